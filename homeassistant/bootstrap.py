@@ -42,9 +42,11 @@ from .setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    SetupPhase,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
+    async_trace_setup,
 )
 from .util import dt as dt_util
 from .util.logging import async_activate_log_queue_handler
@@ -69,6 +71,9 @@ STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
+# Lane of the bootstrap stages in the setup trace
+BOOTSTRAP_LANE = "bootstrap"
+
 MAX_LOAD_CONCURRENTLY = 6
 
 DEBUGGER_INTEGRATIONS = {"debugpy"}
@@ -255,6 +260,8 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         issue_registry.async_load(hass),
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
+        template.async_load_compiled_code_cache(hass),
+        loader.async_load_startup_cache(hass),
         restore_state.async_load(hass),
         hass.config_entries.async_initialize(),
     )
@@ -629,22 +636,26 @@ async def _async_set_up_integrations(
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+        with async_trace_setup(hass, BOOTSTRAP_LANE, SetupPhase.STAGE, "logging"):
+            await async_setup_multi_components(hass, logging_domains, config)
 
     # Setup frontend
     if frontend_domains := domains_to_setup & FRONTEND_INTEGRATIONS:
         _LOGGER.info("Setting up frontend: %s", frontend_domains)
-        await async_setup_multi_components(hass, frontend_domains, config)
+        with async_trace_setup(hass, BOOTSTRAP_LANE, SetupPhase.STAGE, "frontend"):
+            await async_setup_multi_components(hass, frontend_domains, config)
 
     # Setup recorder
     if recorder_domains := domains_to_setup & RECORDER_INTEGRATIONS:
         _LOGGER.info("Setting up recorder: %s", recorder_domains)
-        await async_setup_multi_components(hass, recorder_domains, config)
+        with async_trace_setup(hass, BOOTSTRAP_LANE, SetupPhase.STAGE, "recorder"):
+            await async_setup_multi_components(hass, recorder_domains, config)
 
     # Start up debuggers. Start these first in case they want to wait.
     if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+        with async_trace_setup(hass, BOOTSTRAP_LANE, SetupPhase.STAGE, "debuggers"):
+            await async_setup_multi_components(hass, debuggers, config)
 
     # calculate what components to setup in what stage
     stage_1_domains: set[str] = set()
@@ -684,10 +695,11 @@ async def _async_set_up_integrations(
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+            with async_trace_setup(hass, BOOTSTRAP_LANE, SetupPhase.STAGE, "stage_1"):
+                async with hass.timeout.async_timeout(
+                    STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
@@ -697,18 +709,22 @@ async def _async_set_up_integrations(
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+            with async_trace_setup(hass, BOOTSTRAP_LANE, SetupPhase.STAGE, "stage_2"):
+                async with hass.timeout.async_timeout(
+                    STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
-        async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+        with async_trace_setup(hass, BOOTSTRAP_LANE, SetupPhase.STAGE, "wrap_up"):
+            async with hass.timeout.async_timeout(
+                WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME
+            ):
+                await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
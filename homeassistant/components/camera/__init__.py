@@ -74,6 +74,7 @@ from .const import (  # noqa: F401
     CONF_DURATION,
     CONF_LOOKBACK,
     DATA_CAMERA_PREFS,
+    DATA_JPEG_SCALER,
     DATA_RTSP_TO_WEB_RTC,
     DOMAIN,
     PREF_ORIENTATION,
@@ -81,7 +82,7 @@ from .const import (  # noqa: F401
     SERVICE_RECORD,
     StreamType,
 )
-from .img_util import scale_jpeg_camera_image
+from .img_util import JpegScaler
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
 if TYPE_CHECKING:
@@ -179,7 +180,8 @@ async def _async_get_image(
     the image will be made on a best effort basis.
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
-    are handled.
+    are handled. Scaled images are shared between the
+    requests for the same image and size.
     """
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with asyncio.timeout(timeout):
@@ -200,8 +202,12 @@ async def _async_get_image(
                 ):
                     assert width is not None
                     assert height is not None
+                    scaler: JpegScaler = camera.hass.data[DATA_JPEG_SCALER]
                     return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                        content_type,
+                        await scaler.async_scale(
+                            camera.entity_id, image, width, height
+                        ),
                     )
 
                 return image
@@ -388,6 +394,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     prefs = CameraPreferences(hass)
     hass.data[DATA_CAMERA_PREFS] = prefs
+    hass.data[DATA_JPEG_SCALER] = JpegScaler(hass)
 
     hass.http.register_view(CameraImageView(component))
     hass.http.register_view(CameraMjpegStream(component))
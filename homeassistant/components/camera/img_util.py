@@ -1,15 +1,28 @@
 """Image processing for cameras."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING, Literal, cast
 
+from homeassistant.core import HomeAssistant, callback
+
 SUPPORTED_SCALING_FACTORS = [(7, 8), (3, 4), (5, 8), (1, 2), (3, 8), (1, 4), (1, 8)]
 
 _LOGGER = logging.getLogger(__name__)
 
 JPEG_QUALITY = 75
 
+# Scaled images are served from the cache for SCALED_IMAGE_CACHE_TTL seconds
+SCALED_IMAGE_CACHE_TTL = 30
+MAX_SCALED_IMAGES = 64
+# At most MAX_SCALE_JOBS images are scaled in the executor at once
+MAX_SCALE_JOBS = 2
+
+# The entity id, the hash of the image content, the width and the height
+_ScaleKey = tuple[str, int, int, int]
+
 if TYPE_CHECKING:
     from turbojpeg import TurboJPEG
 
@@ -101,3 +114,70 @@ class TurboJPEGSingleton:
                 "Error loading libturbojpeg; Cameras may impact HomeKit performance"
             )
             TurboJPEGSingleton.__instance = False
+
+
+class JpegScaler:
+    """Scale camera images once for all the clients requesting them.
+
+    Dashboards request the same camera image at the same size from
+    every client every few seconds. Scaled images are cached by the
+    frame they were scaled from, concurrent requests for a frame share
+    a single scale job and the scale jobs running in the executor at
+    once are bounded so they do not starve the other executor jobs.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scaler."""
+        self.hass = hass
+        self._cache: dict[_ScaleKey, tuple[float, bytes]] = {}
+        self._pending: dict[_ScaleKey, asyncio.Task[bytes]] = {}
+        self._semaphore = asyncio.Semaphore(MAX_SCALE_JOBS)
+
+    async def async_scale(
+        self, entity_id: str, cam_image: Image, width: int, height: int
+    ) -> bytes:
+        """Return a camera image scaled to the width and height."""
+        # The hash of a bytes object is cached so cameras returning
+        # the same frame again only pay for hashing it once
+        key = (entity_id, hash(cam_image.content), width, height)
+        if (cached := self._cache.get(key)) is not None:
+            expires, content = cached
+            if expires > time.monotonic():
+                return content
+            del self._cache[key]
+        if (task := self._pending.get(key)) is None:
+            task = self._pending[key] = self.hass.async_create_task(
+                self._async_scale(key, cam_image, width, height),
+                f"camera scale image {entity_id}",
+            )
+        # A request timing out does not cancel the job other requests wait on
+        return await asyncio.shield(task)
+
+    async def _async_scale(
+        self, key: _ScaleKey, cam_image: Image, width: int, height: int
+    ) -> bytes:
+        """Scale a camera image in the executor and cache it."""
+        try:
+            async with self._semaphore:
+                content = await self.hass.async_add_executor_job(
+                    scale_jpeg_camera_image, cam_image, width, height
+                )
+        finally:
+            del self._pending[key]
+        # Images which cannot be scaled are served as is
+        if content is not cam_image.content:
+            self._async_cache(key, content)
+        return content
+
+    @callback
+    def _async_cache(self, key: _ScaleKey, content: bytes) -> None:
+        """Cache a scaled image and evict the expired and oldest images."""
+        now = time.monotonic()
+        cache = self._cache
+        # Images are cached in the order they expire
+        while cache:
+            oldest = next(iter(cache))
+            if cache[oldest][0] > now and len(cache) < MAX_SCALED_IMAGES:
+                break
+            del cache[oldest]
+        cache[key] = (now + SCALED_IMAGE_CACHE_TTL, content)
@@ -72,6 +72,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> str:
     """Fetch history significant_states and convert them to json in the executor."""
     return JSON_DUMP(
@@ -88,22 +89,69 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
 
 
+def _ws_get_significant_states_columnar(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    max_points: int | None,
+) -> str:
+    """Fetch history significant_states as columns and convert them to json."""
+    return JSON_DUMP(
+        messages.result_message(
+            msg_id,
+            history.get_significant_states_columnar(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                max_points,
+            ),
+        )
+    )
+
+
+def _require_minimal_response_with_max_points(msg: dict[str, Any]) -> dict[str, Any]:
+    """Require minimal_response when downsampling to max_points.
+
+    Downsampled states following the first one only have the state and
+    last_changed, and attribute changes are dropped, like with
+    minimal_response. Columns never include attributes.
+    """
+    if "max_points" in msg and not msg["minimal_response"] and not msg.get("columnar"):
+        raise vol.Invalid("max_points requires minimal_response")
+    return msg
+
+
 @websocket_api.websocket_command(
-    {
-        vol.Required("type"): "history/history_during_period",
-        vol.Required("start_time"): str,
-        vol.Optional("end_time"): str,
-        vol.Required("entity_ids"): [str],
-        vol.Optional("include_start_time_state", default=True): bool,
-        vol.Optional("significant_changes_only", default=True): bool,
-        vol.Optional("minimal_response", default=False): bool,
-        vol.Optional("no_attributes", default=False): bool,
-    }
+    vol.All(
+        vol.Schema(
+            {
+                vol.Required("type"): "history/history_during_period",
+                vol.Required("start_time"): str,
+                vol.Optional("end_time"): str,
+                vol.Required("entity_ids"): [str],
+                vol.Optional("include_start_time_state", default=True): bool,
+                vol.Optional("significant_changes_only", default=True): bool,
+                vol.Optional("minimal_response", default=False): bool,
+                vol.Optional("no_attributes", default=False): bool,
+                vol.Optional("columnar", default=False): bool,
+                vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
+            }
+        ),
+        _require_minimal_response_with_max_points,
+    )
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
@@ -154,6 +202,25 @@ async def ws_get_history_during_period(
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
+
+    if msg["columnar"]:
+        # Columns never include attributes and drop
+        # consecutive duplicate states like minimal_response
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_get_significant_states_columnar,
+                hass,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                max_points,
+            )
+        )
+        return
 
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
@@ -167,6 +234,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
         )
     )
 
@@ -221,6 +289,7 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    max_points: int | None,
 ) -> tuple[float, dt | None, str | None]:
     """Generate a historical response."""
     states = cast(
@@ -236,6 +305,7 @@ def _generate_historical_response(
             minimal_response,
             no_attributes,
             True,
+            max_points,
         ),
     )
     last_time_ts = 0.0
@@ -276,6 +346,7 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    max_points: int | None = None,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
@@ -291,6 +362,7 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        max_points,
     )
     if payload:
         connection.send_message(payload)
@@ -396,16 +468,22 @@ def _async_subscribe_events(
 
 
 @websocket_api.websocket_command(
-    {
-        vol.Required("type"): "history/stream",
-        vol.Required("start_time"): str,
-        vol.Optional("end_time"): str,
-        vol.Required("entity_ids"): [str],
-        vol.Optional("include_start_time_state", default=True): bool,
-        vol.Optional("significant_changes_only", default=True): bool,
-        vol.Optional("minimal_response", default=False): bool,
-        vol.Optional("no_attributes", default=False): bool,
-    }
+    vol.All(
+        vol.Schema(
+            {
+                vol.Required("type"): "history/stream",
+                vol.Required("start_time"): str,
+                vol.Optional("end_time"): str,
+                vol.Required("entity_ids"): [str],
+                vol.Optional("include_start_time_state", default=True): bool,
+                vol.Optional("significant_changes_only", default=True): bool,
+                vol.Optional("minimal_response", default=False): bool,
+                vol.Optional("no_attributes", default=False): bool,
+                vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
+            }
+        ),
+        _require_minimal_response_with_max_points,
+    )
 )
 @websocket_api.async_response
 async def ws_stream(
@@ -444,6 +522,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
 
     if end_time and end_time <= utc_now:
         if (
@@ -470,6 +549,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            max_points,
         )
         return
 
@@ -534,6 +614,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        max_points,
     )
 
     if msg_id not in connection.subscriptions:
@@ -575,4 +656,5 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        max_points=max_points,
     )
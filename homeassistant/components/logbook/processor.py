@@ -6,10 +6,12 @@ from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
+import math
 from typing import Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -21,6 +23,7 @@ from homeassistant.components.recorder.models import (
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import (
+    chunked_or_all,
     execute_stmt_lambda_element,
     session_scope,
 )
@@ -63,6 +66,7 @@ from .const import (
 from .helpers import is_sensor_continuous
 from .models import EventAsRow, LazyEventPartialState, LogbookConfig, async_event_to_row
 from .queries import statement_for_request
+from .queries.all import all_context_rows_stmt
 from .queries.common import PSEUDO_EVENT_STATE_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
@@ -120,6 +124,8 @@ class EventProcessor:
             format_time=format_time,
         )
         self.context_augmenter = ContextAugmenter(self.logbook_run)
+        # The cursor of the last page this processor returned
+        self._cursor: float | None = None
 
     @property
     def limited_select(self) -> bool:
@@ -142,19 +148,7 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
-            )
+            metadata_ids, event_type_ids = self._get_ids(session)
             stmt = statement_for_request(
                 start_day,
                 end_day,
@@ -169,6 +163,140 @@ class EventProcessor:
                 execute_stmt_lambda_element(session, stmt, orm_rows=False)
             )
 
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        after: float | None = None,
+    ) -> tuple[list[dict[str, Any]], float | None]:
+        """Get a page of the events for a period of time.
+
+        Pages are keyed by the time the rows were fired and read at most
+        limit rows from the database. The returned cursor is passed as
+        after to get the next page and is None once the period is
+        exhausted. The rows fired at the same time as the last row of a
+        full page are left for the next page so none is skipped.
+        """
+        with session_scope(hass=self.hass, read_only=True) as session:
+            metadata_ids, event_type_ids = self._get_ids(session)
+            rows_limit = limit
+            while True:
+                stmt = statement_for_request(
+                    start_day,
+                    end_day,
+                    event_type_ids,
+                    self.entity_ids,
+                    metadata_ids,
+                    self.device_ids,
+                    self.filters,
+                    self.context_id,
+                    after,
+                    rows_limit,
+                )
+                rows: Sequence[Row] = execute_stmt_lambda_element(
+                    session, stmt, orm_rows=False
+                )
+                if len(rows) < rows_limit:
+                    cursor = None
+                    break
+                # Context only rows without a matching row have no time
+                # and context only rows may have been fired before the cursor
+                fired = [row for row in rows if row.time_fired_ts is not None]
+                if (
+                    fired
+                    and (
+                        cursor := max(
+                            (
+                                row.time_fired_ts
+                                for row in fired
+                                if not row.context_only
+                                and row.time_fired_ts < fired[-1].time_fired_ts
+                            ),
+                            default=None,
+                        )
+                    )
+                    is not None
+                ):
+                    boundary = fired[-1].time_fired_ts
+                    rows = [row for row in fired if row.time_fired_ts < boundary]
+                    break
+                # Every row of the page was fired at the same time
+                rows_limit *= 2
+
+            if after is not None and after != self._cursor and not self.limited_select:
+                # The previous pages were returned by another processor
+                self._prefetch_context_rows(
+                    session, rows, start_day, after, event_type_ids
+                )
+            self._cursor = cursor
+            return self.humanify(rows), cursor
+
+    def _get_ids(self, session: Session) -> tuple[list[int] | None, tuple[int, ...]]:
+        """Return the metadata ids of the entities and the event type ids."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        return metadata_ids, event_type_ids
+
+    def _prefetch_context_rows(
+        self,
+        session: Session,
+        rows: Sequence[Row],
+        start_day: dt,
+        after: float,
+        event_type_ids: tuple[int, ...],
+    ) -> None:
+        """Fetch the rows starting the contexts of a page from the previous pages.
+
+        The contexts are looked up in batches so the page is augmented
+        like it would be if the previous pages had been processed.
+        """
+        context_lookup = self.logbook_run.context_lookup
+        context_ids_bin = list(
+            {
+                context_id_bin
+                for row in rows
+                for context_id_bin in (row.context_id_bin, row.context_parent_id_bin)
+                if context_id_bin not in context_lookup
+            }
+        )
+        if not context_ids_bin:
+            return
+        start_day_ts = dt_util.utc_to_timestamp(start_day)
+        # The rows fired at the cursor belong to the previous pages
+        end_day_ts = math.nextafter(after, math.inf)
+        memoize_context = context_lookup.setdefault
+        context_rows: list[Row] = []
+        for context_ids_bin_chunk in chunked_or_all(
+            context_ids_bin, get_instance(self.hass).max_bind_vars
+        ):
+            context_rows.extend(
+                execute_stmt_lambda_element(
+                    session,
+                    all_context_rows_stmt(
+                        start_day_ts,
+                        end_day_ts,
+                        event_type_ids,
+                        self.filters,
+                        list(context_ids_bin_chunk),
+                    ),
+                    orm_rows=False,
+                )
+            )
+        # The first row of each context is the one that started it
+        context_rows.sort(key=lambda row: row.time_fired_ts)
+        for row in context_rows:
+            memoize_context(row.context_id_bin, row)
+
     def humanify(
         self, rows: Generator[EventAsRow, None, None] | Sequence[Row] | Result
     ) -> list[dict[str, str]]:
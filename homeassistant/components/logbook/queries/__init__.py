@@ -26,10 +26,40 @@ def statement_for_request(
     device_ids: list[str] | None = None,
     filters: Filters | None = None,
     context_id: str | None = None,
+    after: float | None = None,
+    limit: int | None = None,
 ) -> StatementLambdaElement:
-    """Generate the logbook statement for a logbook request."""
-    start_day = dt_util.utc_to_timestamp(start_day_dt)
-    end_day = dt_util.utc_to_timestamp(end_day_dt)
+    """Generate the logbook statement for a logbook request.
+
+    after and limit select a page of rows fired after the given
+    timestamp, see EventProcessor.get_events_page.
+    """
+    stmt = _statement_for_request(
+        after if after is not None else dt_util.utc_to_timestamp(start_day_dt),
+        dt_util.utc_to_timestamp(end_day_dt),
+        event_type_ids,
+        entity_ids,
+        states_metadata_ids,
+        device_ids,
+        filters,
+        context_id,
+    )
+    if limit is not None:
+        stmt += lambda s: s.limit(limit)
+    return stmt
+
+
+def _statement_for_request(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    entity_ids: list[str] | None,
+    states_metadata_ids: Collection[int] | None,
+    device_ids: list[str] | None,
+    filters: Filters | None,
+    context_id: str | None,
+) -> StatementLambdaElement:
+    """Generate the logbook statement for a period of time."""
     # No entities: logbook sends everything for the timeframe
     # limited by the context_id and the yaml configured filter
     if not entity_ids and not device_ids:
@@ -12,7 +12,13 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 
-from .common import apply_states_filters, select_events_without_states, select_states
+from .common import (
+    apply_events_context_hints,
+    apply_states_context_hints,
+    apply_states_filters,
+    select_events_without_states,
+    select_states,
+)
 
 
 def all_stmt(
@@ -65,3 +71,45 @@ def _states_query_for_context_id(
     return apply_states_filters(select_states(), start_day, end_day).where(
         States.context_id_bin == context_id_bin
     )
+
+
+def all_context_rows_stmt(
+    start_day: float,
+    end_day: float,
+    event_type_ids: tuple[int, ...],
+    filters: Filters | None,
+    context_ids_bin: list[bytes],
+) -> StatementLambdaElement:
+    """Generate a logbook query for the rows of contexts for all entities.
+
+    The rows are the ones all_stmt would select for the same period.
+    """
+    stmt = lambda_stmt(
+        lambda: apply_events_context_hints(
+            select_events_without_states(start_day, end_day, event_type_ids)
+        ).where(Events.context_id_bin.in_(context_ids_bin))
+    )
+    if filters and filters.has_config:
+        stmt = stmt.add_criteria(
+            lambda q: q.filter(filters.events_entity_filter()).union_all(
+                _states_query_for_context_ids(
+                    start_day, end_day, context_ids_bin
+                ).where(filters.states_metadata_entity_filter())
+            ),
+            track_on=[filters],
+        )
+    else:
+        stmt += lambda s: s.union_all(
+            _states_query_for_context_ids(start_day, end_day, context_ids_bin)
+        )
+
+    stmt += lambda s: s.order_by(Events.time_fired_ts)
+    return stmt
+
+
+def _states_query_for_context_ids(
+    start_day: float, end_day: float, context_ids_bin: list[bytes]
+) -> Select:
+    return apply_states_filters(
+        apply_states_context_hints(select_states()), start_day, end_day
+    ).where(States.context_id_bin.in_(context_ids_bin))
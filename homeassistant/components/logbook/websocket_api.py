@@ -34,6 +34,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# maximum number of rows read from the database for a single message
+MAX_PAGE_ROWS = 10000
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -102,30 +104,25 @@ async def _async_send_historical_events(
     )
 
     if not is_big_query:
-        message, last_event_time = await _async_get_ws_stream_events(
+        return await _async_send_historical_pages(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
             formatter,
             event_processor,
             partial,
+            force_send,
         )
-        # If there is no last_event_time, there are no historical
-        # results, but we still send an empty message
-        # if its the last one (not partial) so
-        # consumers of the api know their request was
-        # answered but there were no results
-        if last_event_time or not partial or force_send:
-            connection.send_message(message)
-        return last_event_time
 
     # This is a big query so we deliver
     # the first three hours and then
     # we fetch the old data
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
-    recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
+    recent_query_last_event_time = await _async_send_historical_pages(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -133,49 +130,63 @@ async def _async_send_historical_events(
         event_processor,
         partial=True,
     )
-    if recent_query_last_event_time:
-        connection.send_message(recent_message)
-
-    older_message, older_query_last_event_time = await _async_get_ws_stream_events(
+    older_query_last_event_time = await _async_send_historical_pages(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
         formatter,
         event_processor,
         partial,
+        force_send,
     )
-    # If there is no last_event_time, there are no historical
-    # results, but we still send an empty message
-    # if its the last one (not partial) so
-    # consumers of the api know their request was
-    # answered but there were no results
-    if older_query_last_event_time or not partial or force_send:
-        connection.send_message(older_message)
 
     # Returns the time of the newest event
     return recent_query_last_event_time or older_query_last_event_time
 
 
-async def _async_get_ws_stream_events(
+async def _async_send_historical_pages(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
-) -> tuple[str, dt | None]:
-    """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
-        _ws_stream_get_events,
-        msg_id,
-        start_time,
-        end_time,
-        formatter,
-        event_processor,
-        partial,
-    )
+    force_send: bool = False,
+) -> dt | None:
+    """Deliver the historical data of a period to the websocket page by page.
+
+    Every page but the last one is marked as partial. This function
+    returns the time of the most recent event we sent to the websocket.
+    """
+    instance = get_instance(hass)
+    last_event_time: dt | None = None
+    cursor: float | None = None
+    while True:
+        message, page_last_event_time, cursor = await instance.async_add_executor_job(
+            _ws_stream_get_events,
+            msg_id,
+            start_time,
+            end_time,
+            formatter,
+            event_processor,
+            partial,
+            cursor,
+        )
+        if page_last_event_time:
+            last_event_time = page_last_event_time
+        # If there is no last_event_time, there are no historical
+        # results, but we still send an empty message
+        # if its the last one (not partial) so
+        # consumers of the api know their request was
+        # answered but there were no results
+        if page_last_event_time or cursor is None and (not partial or force_send):
+            connection.send_message(message)
+        if cursor is None:
+            return last_event_time
 
 
 def _generate_stream_message(
@@ -196,20 +207,23 @@ def _ws_stream_get_events(
     formatter: Callable[[int, Any], dict[str, Any]],
     event_processor: EventProcessor,
     partial: bool,
-) -> tuple[str, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
+    after: float | None,
+) -> tuple[str, dt | None, float | None]:
+    """Fetch a page of events and convert them to json in the executor."""
+    events, cursor = event_processor.get_events_page(
+        start_day, end_day, MAX_PAGE_ROWS, after
+    )
     last_time = None
     if events:
         last_time = dt_util.utc_from_timestamp(events[-1]["when"])
     message = _generate_stream_message(events, start_day, end_day)
-    if partial:
+    if partial or cursor is not None:
         # This is a hint to consumers of the api that
         # we are about to send a another block of historical
         # data in case the UI needs to show that historical
         # data is still loading in the future
         message["partial"] = True
-    return JSON_DUMP(formatter(msg_id, message)), last_time
+    return JSON_DUMP(formatter(msg_id, message)), last_time, cursor
 
 
 async def _async_events_consumer(
@@ -444,6 +458,21 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    limit: int,
+    after: float | None,
+) -> str:
+    """Fetch a page of events and convert them to json in the executor."""
+    events, cursor = event_processor.get_events_page(start_time, end_time, limit, after)
+    return JSON_DUMP(
+        messages.result_message(msg_id, {"events": events, "next_after": cursor})
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -452,6 +481,8 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1, max=MAX_PAGE_ROWS)),
+        vol.Optional("after"): vol.Coerce(float),
     }
 )
 @websocket_api.async_response
@@ -477,8 +508,9 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    limit: int | None = msg.get("limit")
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        connection.send_result(msg["id"], _empty_result(limit))
         return
 
     device_ids = msg.get("device_ids")
@@ -488,7 +520,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            connection.send_result(msg["id"], _empty_result(limit))
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -503,6 +535,20 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if limit is not None:
+        connection.send_message(
+            await get_instance(hass).async_add_executor_job(
+                _ws_formatted_get_events_page,
+                msg["id"],
+                start_time,
+                end_time,
+                event_processor,
+                limit,
+                msg.get("after"),
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
@@ -512,3 +558,10 @@ async def ws_get_events(
             event_processor,
         )
     )
+
+
+def _empty_result(limit: int | None) -> list[Any] | dict[str, Any]:
+    """Return the result of a request without events."""
+    if limit is None:
+        return []
+    return {"events": [], "next_after": None}
@@ -68,6 +68,7 @@ from .const import (  # noqa: F401
     CONF_DISCOVERY_PREFIX,
     CONF_KEEPALIVE,
     CONF_QOS,
+    CONF_RECEIVE_BATCH_LATENCY,
     CONF_STATE_TOPIC,
     CONF_TLS_INSECURE,
     CONF_TOPIC,
@@ -133,6 +134,7 @@ CONFIG_ENTRY_CONFIG_KEYS = [
     CONF_PASSWORD,
     CONF_PORT,
     CONF_PROTOCOL,
+    CONF_RECEIVE_BATCH_LATENCY,
     CONF_TLS_INSECURE,
     CONF_TRANSPORT,
     CONF_WS_PATH,
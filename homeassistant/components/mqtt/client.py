@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass
-from functools import lru_cache
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any
 import uuid
 
 import certifi
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -47,6 +48,7 @@ from .const import (
     CONF_CLIENT_CERT,
     CONF_CLIENT_KEY,
     CONF_KEEPALIVE,
+    CONF_RECEIVE_BATCH_LATENCY,
     CONF_TLS_INSECURE,
     CONF_TRANSPORT,
     CONF_WILL_MESSAGE,
@@ -58,6 +60,7 @@ from .const import (
     DEFAULT_PORT,
     DEFAULT_PROTOCOL,
     DEFAULT_QOS,
+    DEFAULT_RECEIVE_BATCH_LATENCY,
     DEFAULT_TRANSPORT,
     DEFAULT_WILL,
     DEFAULT_WS_HEADERS,
@@ -77,7 +80,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
-from .util import get_file_path, get_mqtt_data, mqtt_config_entry_enabled
+from .util import TopicTrie, get_file_path, get_mqtt_data, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
     # Only import for paho-mqtt type checking here, imports are done locally
@@ -92,6 +95,11 @@ SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
 
+# Number of topics whose matching subscriptions are cached
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+# Maximum number of received messages handled before yielding to the event loop
+MAX_RECEIVE_BATCH_SIZE = 500
+
 SubscribePayloadType = str | bytes  # Only bytes if encoding is None
 
 
@@ -226,7 +234,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -390,7 +397,11 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions: TopicTrie[Subscription] = TopicTrie()
+        # Bounded so high cardinality topics do not grow it without limit
+        self._matching_subscriptions_cache: LRU[str, list[Subscription]] = LRU(
+            MATCHING_SUBSCRIPTIONS_CACHE_SIZE
+        )
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -412,6 +423,12 @@ class MQTT:
             UNSUBSCRIBE_COOLDOWN, self._async_perform_unsubscribes
         )
         self._pending_unsubscribes: set[str] = set()  # topic
+        # Messages received by the paho thread waiting to be handled
+        self._pending_messages: deque[mqtt.MQTTMessage] = deque()
+        self._handle_messages_scheduled = False
+        self._receive_batch_latency: float = conf.get(
+            CONF_RECEIVE_BATCH_LATENCY, DEFAULT_RECEIVE_BATCH_LATENCY
+        )
 
         if self.hass.state is CoreState.running:
             self._ha_started.set()
@@ -473,8 +490,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_filter(topic)
         )
 
     async def async_publish(
@@ -555,30 +572,28 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
-        if _is_simple_match(subscription.topic):
-            self._simple_subscriptions.setdefault(subscription.topic, []).append(
-                subscription
-            )
+        topic = subscription.topic
+        if _is_simple_match(topic):
+            self._simple_subscriptions.setdefault(topic, []).append(subscription)
+            # Only the cached matches of the topic itself are affected
+            if topic in self._matching_subscriptions_cache:
+                del self._matching_subscriptions_cache[topic]
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(topic, subscription)
+            self._matching_subscriptions_cache.clear()
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -587,8 +602,11 @@ class MQTT:
                 simple_subscriptions[topic].remove(subscription)
                 if not simple_subscriptions[topic]:
                     del simple_subscriptions[topic]
+                if topic in self._matching_subscriptions_cache:
+                    del self._matching_subscriptions_cache[topic]
             else:
-                self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions.remove(topic, subscription)
+                self._matching_subscriptions_cache.clear()
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -623,11 +641,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -637,7 +652,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -795,17 +809,47 @@ class MQTT:
     def _mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
     ) -> None:
-        """Message received callback."""
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are queued and handled in batches so a burst of messages
+        only wakes up the event loop once.
+        """
+        self._pending_messages.append(msg)
+        if not self._handle_messages_scheduled:
+            self._handle_messages_scheduled = True
+            self.loop.call_soon_threadsafe(self._async_start_handle_messages)
+
+    @callback
+    def _async_start_handle_messages(self) -> None:
+        """Handle the pending messages, optionally waiting for more to arrive."""
+        if self._receive_batch_latency:
+            self.loop.call_later(
+                self._receive_batch_latency, self._async_handle_pending_messages
+            )
+        else:
+            self._async_handle_pending_messages()
+
+    @callback
+    def _async_handle_pending_messages(self) -> None:
+        """Handle a batch of the messages received by the paho thread."""
+        # Reset the flag before draining so a message queued while
+        # draining always schedules a new batch
+        self._handle_messages_scheduled = False
+        pending = self._pending_messages
+        for _ in range(min(len(pending), MAX_RECEIVE_BATCH_SIZE)):
+            self._mqtt_handle_message(pending.popleft())
+        if pending and not self._handle_messages_scheduled:
+            self._handle_messages_scheduled = True
+            self.loop.call_soon(self._async_handle_pending_messages)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+        """Return the subscriptions matching a topic."""
+        cache = self._matching_subscriptions_cache
+        if (subscriptions := cache.get(topic)) is None:
+            subscriptions = cache[topic] = [
+                *self._simple_subscriptions.get(topic, ()),
+                *self._wildcard_subscriptions.match(topic),
+            ]
         return subscriptions
 
     @callback
@@ -820,6 +864,8 @@ class MQTT:
         timestamp = dt_util.utcnow()
 
         subscriptions = self._matching_subscriptions(msg.topic)
+        # Subscriptions with the same filter and encoding share the message
+        messages: dict[tuple[str | None, str], ReceiveMessage | None] = {}
 
         for subscription in subscriptions:
             if msg.retain:
@@ -830,30 +876,34 @@ class MQTT:
                 # Remember the subscription had an initial retained message
                 self._retained_topics[subscription].add(msg.topic)
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
-                    _LOGGER.warning(
-                        "Can't decode payload %s on %s with encoding %s (for %s)",
-                        msg.payload[0:8192],
-                        msg.topic,
-                        subscription.encoding,
-                        subscription.job,
-                    )
+            key = (subscription.encoding, subscription.topic)
+            if key in messages:
+                if (receive_message := messages[key]) is None:
                     continue
-            self.hass.async_run_hass_job(
-                subscription.job,
-                ReceiveMessage(
+            else:
+                payload: SubscribePayloadType = msg.payload
+                if subscription.encoding is not None:
+                    try:
+                        payload = msg.payload.decode(subscription.encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        _LOGGER.warning(
+                            "Can't decode payload %s on %s with encoding %s (for %s)",
+                            msg.payload[0:8192],
+                            msg.topic,
+                            subscription.encoding,
+                            subscription.job,
+                        )
+                        messages[key] = None
+                        continue
+                receive_message = messages[key] = ReceiveMessage(
                     msg.topic,
                     payload,
                     msg.qos,
                     msg.retain,
                     subscription.topic,
                     timestamp,
-                ),
-            )
+                )
+            self.hass.async_run_hass_job(subscription.job, receive_message)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
     def _mqtt_on_callback(
@@ -950,13 +1000,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -59,6 +59,7 @@ from .const import (
     CONF_CLIENT_KEY,
     CONF_DISCOVERY_PREFIX,
     CONF_KEEPALIVE,
+    CONF_RECEIVE_BATCH_LATENCY,
     CONF_TLS_INSECURE,
     CONF_TRANSPORT,
     CONF_WILL_MESSAGE,
@@ -71,6 +72,7 @@ from .const import (
     DEFAULT_PORT,
     DEFAULT_PREFIX,
     DEFAULT_PROTOCOL,
+    DEFAULT_RECEIVE_BATCH_LATENCY,
     DEFAULT_TRANSPORT,
     DEFAULT_WILL,
     DEFAULT_WS_PATH,
@@ -112,6 +114,18 @@ KEEPALIVE_SELECTOR = vol.All(
     ),
     vol.Coerce(int),
 )
+RECEIVE_BATCH_LATENCY_SELECTOR = vol.All(
+    NumberSelector(
+        NumberSelectorConfig(
+            mode=NumberSelectorMode.BOX,
+            min=0,
+            max=1,
+            step="any",
+            unit_of_measurement="sec",
+        )
+    ),
+    vol.Coerce(float),
+)
 PROTOCOL_SELECTOR = SelectSelector(
     SelectSelectorConfig(
         options=SUPPORTED_PROTOCOLS,
@@ -600,6 +614,9 @@ async def async_get_broker_settings(
     # Get default settings for advanced broker options
     current_client_id = current_config.get(CONF_CLIENT_ID)
     current_keepalive = current_config.get(CONF_KEEPALIVE, DEFAULT_KEEPALIVE)
+    current_receive_batch_latency = current_config.get(
+        CONF_RECEIVE_BATCH_LATENCY, DEFAULT_RECEIVE_BATCH_LATENCY
+    )
     current_ca_certificate = current_config.get(CONF_CERTIFICATE)
     current_client_certificate = current_config.get(CONF_CLIENT_CERT)
     current_client_key = current_config.get(CONF_CLIENT_KEY)
@@ -615,6 +632,7 @@ async def async_get_broker_settings(
     advanced_broker_options |= bool(
         current_client_id
         or current_keepalive != DEFAULT_KEEPALIVE
+        or current_receive_batch_latency != DEFAULT_RECEIVE_BATCH_LATENCY
         or current_ca_certificate
         or current_client_certificate
         or current_client_key
@@ -664,6 +682,12 @@ async def async_get_broker_settings(
             description={"suggested_value": current_keepalive},
         )
     ] = KEEPALIVE_SELECTOR
+    fields[
+        vol.Optional(
+            CONF_RECEIVE_BATCH_LATENCY,
+            description={"suggested_value": current_receive_batch_latency},
+        )
+    ] = RECEIVE_BATCH_LATENCY_SELECTOR
     fields[
         vol.Optional(
             SET_CLIENT_CERT,
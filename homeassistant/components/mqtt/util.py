@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterator
+from operator import itemgetter
 import os
 from pathlib import Path
 import tempfile
-from typing import Any
+from typing import Any, Generic, TypeVar
 
 import voluptuous as vol
 
@@ -38,6 +40,8 @@ TEMP_DIR_NAME = f"home-assistant-{DOMAIN}"
 
 _VALID_QOS_SCHEMA = vol.All(vol.Coerce(int), vol.In([0, 1, 2]))
 
+_T = TypeVar("_T")
+
 
 def mqtt_config_entry_enabled(hass: HomeAssistant) -> bool | None:
     """Return true when the MQTT config entry is enabled."""
@@ -232,3 +236,117 @@ def migrate_certificate_file_to_content(file_name_or_auto: str) -> str | None:
             return certificate_file.read()
     except OSError:
         return None
+
+
+class _TopicTrieNode:
+    """A level of a topic filter in the topic trie."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        # Items subscribed to the topic filter ending at this node,
+        # mapped to the order they were added in
+        self.items: dict[Any, int] = {}
+
+
+class TopicTrie(Generic[_T]):
+    """Trie of topic filters supporting the + and # wildcards.
+
+    Topic filters are split into levels, so matching a topic only visits
+    the filters sharing its levels instead of testing every filter.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+        self._added = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of items in the trie."""
+        return self._count
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over the items in the order they were added."""
+        items: list[tuple[_T, int]] = []
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            items.extend(node.items.items())
+            nodes.extend(node.children.values())
+        return (item for item, _ in sorted(items, key=itemgetter(1)))
+
+    def add(self, topic_filter: str, item: _T) -> None:
+        """Add an item for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.items[item] = self._added
+        self._added += 1
+        self._count += 1
+
+    def remove(self, topic_filter: str, item: _T) -> None:
+        """Remove an item for a topic filter.
+
+        Raises KeyError if the item was not added for the topic filter.
+        """
+        path: list[tuple[_TopicTrieNode, str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.items[item]
+        self._count -= 1
+        # Prune the levels that no longer lead to any item
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.items or child.children:
+                break
+            del parent.children[level]
+
+    def has_filter(self, topic_filter: str) -> bool:
+        """Return if any item was added for the topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.items)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the items whose topic filter matches the topic.
+
+        The items are returned in the order they were added.
+        """
+        # Wildcards in the first level do not match topics starting with $
+        wildcards = not topic.startswith("$")
+        matches: list[tuple[_T, int]] = []
+        nodes = [self._root]
+        for level in topic.split("/"):
+            next_nodes: list[_TopicTrieNode] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if wildcards:
+                    if (child := children.get("+")) is not None:
+                        next_nodes.append(child)
+                    if (child := children.get("#")) is not None:
+                        matches.extend(child.items.items())
+            if not next_nodes:
+                break
+            nodes = next_nodes
+            wildcards = True
+        else:
+            for node in nodes:
+                matches.extend(node.items.items())
+                # A filter ending with # also matches its parent level
+                if (child := node.children.get("#")) is not None:
+                    matches.extend(child.items.items())
+        if len(matches) > 1:
+            matches.sort(key=itemgetter(1))
+        return [item for item, _ in matches]
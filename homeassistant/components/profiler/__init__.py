@@ -14,16 +14,24 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_TYPE,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+import homeassistant.util.dt as dt_util
 
 from .const import DOMAIN
+from .job_profile import JobProfile
+from .loop_monitor import LoopMonitor
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -35,6 +43,8 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_START_JOB_PROFILE = "start_job_profile"
+SERVICE_STOP_JOB_PROFILE = "stop_job_profile"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -57,6 +67,8 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_START_JOB_PROFILE,
+    SERVICE_STOP_JOB_PROFILE,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -67,6 +79,10 @@ CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
+JOB_PROFILE = "job_profile"
+LOOP_MONITOR = "loop_monitor"
+
+PLATFORMS = [Platform.SENSOR]
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -341,6 +357,23 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_thread_frames,
     )
 
+    @callback
+    def _async_start_job_profile(call: ServiceCall) -> None:
+        """Start attributing event loop time to the jobs."""
+        if hass.job_profiler is not None:
+            raise HomeAssistantError("Job profiling already started")
+        domain_data[JOB_PROFILE] = hass.job_profiler = JobProfile()
+
+    @callback
+    def _async_stop_job_profile(call: ServiceCall) -> None:
+        """Stop attributing event loop time to the jobs."""
+        if (
+            JOB_PROFILE not in domain_data
+            or hass.job_profiler is not domain_data[JOB_PROFILE]
+        ):
+            raise HomeAssistantError("Job profiling not running")
+        _async_stop_job_profiler(hass)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -348,15 +381,97 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_JOB_PROFILE,
+        _async_start_job_profile,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_JOB_PROFILE,
+        _async_stop_job_profile,
+    )
+
+    websocket_api.async_register_command(hass, websocket_job_profile)
+    websocket_api.async_register_command(hass, websocket_loop_monitor)
+
+    monitor = domain_data[LOOP_MONITOR] = LoopMonitor(hass)
+    monitor.async_start()
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, monitor.async_stop)
+    )
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
+@callback
+def _async_stop_job_profiler(hass: HomeAssistant) -> None:
+    """Stop the job profiler keeping its results."""
+    profile: JobProfile = hass.data[DOMAIN][JOB_PROFILE]
+    if hass.job_profiler is profile:
+        profile.stopped = dt_util.utcnow()
+        hass.job_profiler = None
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/job_profile",
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+    }
+)
+@callback
+def websocket_job_profile(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return where the event loop spent its time while profiling jobs."""
+    if (profile := hass.data.get(DOMAIN, {}).get(JOB_PROFILE)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.const.ERR_NOT_FOUND, "Job profiling not started"
+        )
+        return
+    connection.send_result(
+        msg["id"],
+        {"running": hass.job_profiler is profile, **profile.as_dict(msg.get("limit"))},
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/loop_monitor",
+        vol.Optional("limit"): vol.All(int, vol.Range(min=1)),
+    }
+)
+@callback
+def websocket_loop_monitor(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the event loop lag and the worst stalls."""
+    if (monitor := hass.data.get(DOMAIN, {}).get(LOOP_MONITOR)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.const.ERR_NOT_FOUND, "Loop monitor not running"
+        )
+        return
+    connection.send_result(msg["id"], monitor.as_dict(msg.get("limit")))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    if JOB_PROFILE in hass.data[DOMAIN]:
+        _async_stop_job_profiler(hass)
+    await hass.data[DOMAIN][LOOP_MONITOR].async_stop()
     hass.data.pop(DOMAIN)
     return True
 
@@ -0,0 +1,27 @@
+"""Diagnostics support for Profiler."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import JOB_PROFILE, LOOP_MONITOR
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    domain_data = hass.data[DOMAIN]
+    loop_monitor = domain_data[LOOP_MONITOR].as_dict()
+    if (profile := domain_data.get(JOB_PROFILE)) is None:
+        return {"job_profile": None, "loop_monitor": loop_monitor}
+    return {
+        "job_profile": {
+            "running": hass.job_profiler is profile,
+            **profile.as_dict(),
+        },
+        "loop_monitor": loop_monitor,
+    }
@@ -0,0 +1,199 @@
+"""Attribute event loop time to HassJobs, event types and integrations."""
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from datetime import datetime
+import functools
+import threading
+from time import perf_counter
+from typing import Any, TypeVar
+
+from homeassistant.core import Event, HassJob
+from homeassistant.util.async_ import TimedCoroutine
+import homeassistant.util.dt as dt_util
+
+_R = TypeVar("_R")
+
+# Durations are counted in buckets of powers of two microseconds
+# up to about 35 minutes
+_BUCKETS = 32
+
+DOMAIN_HOMEASSISTANT = "homeassistant"
+
+
+def _domain_from_module(module: str) -> str:
+    """Return the integration domain a module belongs to."""
+    parts = module.split(".", 3)
+    if parts[0] == "homeassistant" and len(parts) > 2 and parts[1] == "components":
+        return parts[2]
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return DOMAIN_HOMEASSISTANT
+
+
+class JobStats:
+    """Time spent running a group of jobs."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        """Initialize the stats."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * _BUCKETS
+
+    def add(self, duration: float) -> None:
+        """Add the duration of a single run."""
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+        self.buckets[min(int(duration * 1_000_000).bit_length(), _BUCKETS - 1)] += 1
+
+    def percentile(self, percentile: float) -> float:
+        """Return the upper bound of the duration of the given percentile."""
+        threshold = self.count * percentile / 100
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= threshold:
+                return min((1 << index) / 1_000_000, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dict."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p99": self.percentile(99),
+        }
+
+
+def _get_stats(stats: dict[str, JobStats], key: str) -> JobStats:
+    """Return the stats for a key, adding them if needed."""
+    if (item := stats.get(key)) is None:
+        item = stats[key] = JobStats()
+    return item
+
+
+class JobProfile:
+    """Profile of the HassJobs run by Home Assistant.
+
+    Every time the event loop runs a callback job or a step of a
+    coroutine job the duration is attributed to the name of the job,
+    the event type it handles and the integration it belongs to.
+    Executor jobs do not block the event loop and are tracked apart.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profile."""
+        self.started = dt_util.utcnow()
+        self.stopped: datetime | None = None
+        self.jobs: dict[str, JobStats] = {}
+        self.event_types: dict[str, JobStats] = {}
+        self.domains: dict[str, JobStats] = {}
+        self.executor_jobs: dict[str, JobStats] = {}
+        # Executor jobs are recorded from the worker threads
+        self._executor_lock = threading.Lock()
+        self._labels: dict[tuple[str | None, Any], tuple[str, str]] = {}
+
+    def _job_label(self, hassjob: HassJob[..., Any]) -> tuple[str, str]:
+        """Return the name and the integration domain of a job."""
+        target: Any = hassjob.target
+        while isinstance(target, functools.partial):
+            target = target.func
+        func = getattr(target, "__func__", target)
+        try:
+            return self._labels[(hassjob.name, func)]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable callable objects are not cached
+            func = None
+
+        module = getattr(target, "__module__", None) or type(target).__module__
+        qualname = getattr(target, "__qualname__", None) or type(target).__qualname__
+        name = f"{module}.{qualname}"
+        if hassjob.name:
+            # Many jobs share a name like "listen state_changed"
+            name = f"{hassjob.name}: {name}"
+        label = (name, _domain_from_module(module))
+        if func is not None:
+            self._labels[(hassjob.name, func)] = label
+        return label
+
+    def _recorder(
+        self, hassjob: HassJob[..., Any], args: tuple[Any, ...]
+    ) -> Callable[[float], None]:
+        """Return a function recording the durations of a job run in the loop."""
+        name, domain = self._job_label(hassjob)
+        job_stats = _get_stats(self.jobs, name)
+        domain_stats = _get_stats(self.domains, domain)
+        event_stats: JobStats | None = None
+        if args and isinstance(event := args[0], Event):
+            event_stats = _get_stats(self.event_types, event.event_type)
+
+        def _record(duration: float) -> None:
+            job_stats.add(duration)
+            domain_stats.add(duration)
+            if event_stats is not None:
+                event_stats.add(duration)
+
+        return _record
+
+    def run_callback(self, hassjob: HassJob[..., Any], args: tuple[Any, ...]) -> None:
+        """Run a callback job in the event loop."""
+        record = self._recorder(hassjob, args)
+        start = perf_counter()
+        try:
+            hassjob.target(*args)
+        finally:
+            record(perf_counter() - start)
+
+    def wrap_coroutine(
+        self,
+        hassjob: HassJob[..., Any],
+        args: tuple[Any, ...],
+        coro: Coroutine[Any, Any, _R],
+    ) -> Coroutine[Any, Any, _R]:
+        """Wrap the coroutine of a coroutine function job."""
+        return TimedCoroutine(coro, self._recorder(hassjob, args))
+
+    def run_executor(self, hassjob: HassJob[..., _R], args: tuple[Any, ...]) -> _R:
+        """Run an executor job in the executor."""
+        start = perf_counter()
+        try:
+            return hassjob.target(*args)
+        finally:
+            duration = perf_counter() - start
+            with self._executor_lock:
+                name, _ = self._job_label(hassjob)
+                _get_stats(self.executor_jobs, name).add(duration)
+
+    def as_dict(self, limit: int | None = None) -> dict[str, Any]:
+        """Return the profile with the most expensive entries first."""
+
+        def _sorted(stats: dict[str, JobStats]) -> list[dict[str, Any]]:
+            ordered = sorted(
+                stats.items(), key=lambda item: item[1].total, reverse=True
+            )
+            return [
+                {"name": name, **item_stats.as_dict()}
+                for name, item_stats in ordered[:limit]
+            ]
+
+        with self._executor_lock:
+            executor_jobs = _sorted(self.executor_jobs)
+        end = self.stopped or dt_util.utcnow()
+        return {
+            "started": self.started.isoformat(),
+            "stopped": self.stopped.isoformat() if self.stopped else None,
+            "duration": (end - self.started).total_seconds(),
+            "jobs": _sorted(self.jobs),
+            "event_types": _sorted(self.event_types),
+            "domains": _sorted(self.domains),
+            "executor_jobs": executor_jobs,
+        }
@@ -0,0 +1,215 @@
+"""Monitor the event loop lag and capture what blocks it."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import heapq
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+from homeassistant.core import Event, HomeAssistant, callback
+import homeassistant.util.dt as dt_util
+
+# The heartbeat runs in the event loop every HEARTBEAT_INTERVAL seconds
+HEARTBEAT_INTERVAL = 0.5
+# The watchdog thread checks the heartbeat every WATCHDOG_INTERVAL seconds
+WATCHDOG_INTERVAL = 0.1
+# A heartbeat running more than STALL_THRESHOLD seconds late is a stall
+STALL_THRESHOLD = 0.2
+# Lags are kept for a minute for the lag sensor
+LAG_WINDOW = 60
+# The stalls with the largest lag are kept
+MAX_STALLS = 50
+MAX_STACK_FRAMES = 30
+
+_ASYNCIO_EVENTS_FILE = "asyncio/events.py"
+
+
+@dataclass(slots=True)
+class LoopStall:
+    """A stall of the event loop."""
+
+    started: datetime
+    lag: float
+    callback: str | None
+    stack: list[str] | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stall as a dict."""
+        return {
+            "started": self.started.isoformat(),
+            "lag": self.lag,
+            "callback": self.callback,
+            "stack": self.stack,
+        }
+
+
+def _format_frame(frame: traceback.FrameSummary) -> str:
+    """Return the location of a frame."""
+    return f"{frame.filename}:{frame.lineno} in {frame.name}"
+
+
+def _capture_stack(thread_id: int) -> tuple[str | None, list[str]] | None:
+    """Return the callback and the stack a thread is running."""
+    # pylint: disable-next=protected-access
+    if (frame := sys._current_frames().get(thread_id)) is None:
+        return None
+    frames = traceback.extract_stack(frame)
+    # The frame following Handle._run is the callback the loop runs
+    callback_frame: traceback.FrameSummary | None = None
+    for index in range(len(frames) - 2, -1, -1):
+        summary = frames[index]
+        if summary.name == "_run" and summary.filename.replace("\\", "/").endswith(
+            _ASYNCIO_EVENTS_FILE
+        ):
+            callback_frame = frames[index + 1]
+            break
+    return (
+        _format_frame(callback_frame) if callback_frame else None,
+        [line.rstrip() for line in traceback.format_list(frames[-MAX_STACK_FRAMES:])],
+    )
+
+
+class LoopMonitor:
+    """Sample the lag of the event loop at low cost.
+
+    A heartbeat scheduled in the event loop measures how late it runs.
+    A watchdog thread checks the time of the next heartbeat and when it
+    is late by more than the stall threshold, captures the stack the
+    event loop is blocked in so the stall can be attributed to a
+    callback once the heartbeat runs again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        interval: float = HEARTBEAT_INTERVAL,
+        threshold: float = STALL_THRESHOLD,
+        watchdog_interval: float = WATCHDOG_INTERVAL,
+    ) -> None:
+        """Initialize the monitor."""
+        self.hass = hass
+        self.interval = interval
+        self.threshold = threshold
+        self.watchdog_interval = watchdog_interval
+        self.started: datetime | None = None
+        self.stall_count = 0
+        # Min heap of (lag, stall number, stall) holding the worst stalls
+        self._worst_stalls: list[tuple[float, int, LoopStall]] = []
+        self._lags: deque[float] = deque(maxlen=max(int(LAG_WINDOW / interval), 1))
+        self._beats = 0
+        self._expected = 0.0
+        # Written by the watchdog thread, read by the heartbeat
+        self._capture: tuple[int, str | None, list[str]] | None = None
+        self._loop_thread_id = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return if the monitor is running."""
+        return self._handle is not None
+
+    @property
+    def stalls(self) -> list[LoopStall]:
+        """Return the worst stalls, the largest lag first."""
+        return [
+            stall
+            for _, _, stall in sorted(self._worst_stalls, key=lambda item: -item[0])
+        ]
+
+    @property
+    def lag(self) -> float | None:
+        """Return the lag of the last heartbeat."""
+        return self._lags[-1] if self._lags else None
+
+    @property
+    def max_lag(self) -> float | None:
+        """Return the maximum lag during the last minute."""
+        return max(self._lags) if self._lags else None
+
+    @callback
+    def async_start(self) -> None:
+        """Start the heartbeat and the watchdog thread."""
+        self.started = dt_util.utcnow()
+        self._loop_thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._expected = time.monotonic() + self.interval
+        self._handle = self.hass.loop.call_later(self.interval, self._async_beat)
+        self._thread = threading.Thread(
+            target=self._watch, name="profiler_loop_watchdog", daemon=True
+        )
+        self._thread.start()
+
+    async def async_stop(self, event: Event | None = None) -> None:
+        """Stop the heartbeat and wait for the watchdog thread."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._stop_event.set()
+        if (thread := self._thread) is not None:
+            self._thread = None
+            await self.hass.async_add_executor_job(thread.join)
+
+    @callback
+    def _async_beat(self) -> None:
+        """Measure how late the heartbeat runs."""
+        now = time.monotonic()
+        lag = max(now - self._expected, 0.0)
+        self._lags.append(lag)
+        if lag >= self.threshold:
+            self.stall_count += 1
+            callback_name: str | None = None
+            stack: list[str] | None = None
+            if (capture := self._capture) is not None and capture[0] == self._beats:
+                _, callback_name, stack = capture
+            stall = LoopStall(
+                dt_util.utcnow() - timedelta(seconds=lag), lag, callback_name, stack
+            )
+            item = (lag, self.stall_count, stall)
+            if len(self._worst_stalls) < MAX_STALLS:
+                heapq.heappush(self._worst_stalls, item)
+            elif lag > self._worst_stalls[0][0]:
+                heapq.heapreplace(self._worst_stalls, item)
+        # The watchdog reads the beat before the expected time, so the
+        # expected time must be updated first for this beat to not be
+        # seen as late
+        self._expected = now + self.interval
+        self._beats += 1
+        self._handle = self.hass.loop.call_later(self.interval, self._async_beat)
+
+    def _watch(self) -> None:
+        """Capture the stack of the event loop when the heartbeat is late."""
+        captured = -1
+        while not self._stop_event.wait(self.watchdog_interval):
+            captured = self._check_heartbeat(captured)
+
+    def _check_heartbeat(self, captured: int) -> int:
+        """Capture the stack if the heartbeat is late, return the captured beat."""
+        # Read the beat before the time it is expected at so a
+        # heartbeat running in between is never seen as late
+        beat = self._beats
+        if beat == captured or time.monotonic() - self._expected < self.threshold:
+            return captured
+        if (capture := _capture_stack(self._loop_thread_id)) is not None:
+            self._capture = (beat, *capture)
+        return beat
+
+    def as_dict(self, limit: int | None = None) -> dict[str, Any]:
+        """Return the lag and the worst stalls first."""
+        return {
+            "running": self.running,
+            "started": self.started.isoformat() if self.started else None,
+            "interval": self.interval,
+            "threshold": self.threshold,
+            "lag": self.lag,
+            "max_lag": self.max_lag,
+            "stall_count": self.stall_count,
+            "stalls": [stall.as_dict() for stall in self.stalls[:limit]],
+        }
@@ -0,0 +1,97 @@
+"""Sensors for the event loop lag monitored by the profiler."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+
+from . import LOOP_MONITOR
+from .const import DEFAULT_NAME, DOMAIN
+from .loop_monitor import LoopMonitor
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class ProfilerSensorEntityDescription(SensorEntityDescription):
+    """Describes a profiler sensor entity."""
+
+    value_fn: Callable[[LoopMonitor], StateType]
+
+
+def _max_lag_ms(monitor: LoopMonitor) -> StateType:
+    """Return the maximum lag during the last minute in milliseconds."""
+    if (max_lag := monitor.max_lag) is None:
+        return None
+    return round(max_lag * 1000, 1)
+
+
+SENSORS: tuple[ProfilerSensorEntityDescription, ...] = (
+    ProfilerSensorEntityDescription(
+        key="event_loop_lag",
+        translation_key="event_loop_lag",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=_max_lag_ms,
+    ),
+    ProfilerSensorEntityDescription(
+        key="event_loop_stalls",
+        translation_key="event_loop_stalls",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda monitor: monitor.stall_count,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the profiler sensors."""
+    monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+    async_add_entities(
+        ProfilerSensor(entry, monitor, description) for description in SENSORS
+    )
+
+
+class ProfilerSensor(SensorEntity):
+    """Sensor for the event loop lag."""
+
+    entity_description: ProfilerSensorEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        monitor: LoopMonitor,
+        description: ProfilerSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._monitor = monitor
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=DEFAULT_NAME,
+        )
+        self._attr_native_value = description.value_fn(monitor)
+
+    async def async_update(self) -> None:
+        """Update the sensor from the monitor."""
+        self._attr_native_value = self.entity_description.value_fn(self._monitor)
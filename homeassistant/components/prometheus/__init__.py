@@ -5,6 +5,7 @@ from collections.abc import Callable
 from contextlib import suppress
 import logging
 import string
+import threading
 from typing import Any, TypeVar, cast
 
 from aiohttp import web
@@ -105,8 +106,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(config[DOMAIN][CONF_REQUIRES_AUTH]))
-
     conf: dict[str, Any] = config[DOMAIN]
     entity_filter: entityfilter.EntityFilter = conf[CONF_FILTER]
     namespace: str = conf[CONF_PROM_NAMESPACE]
@@ -128,6 +127,8 @@ def setup(hass: HomeAssistant, config: ConfigType) -> bool:
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(conf[CONF_REQUIRES_AUTH], metrics))
+
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_state_changed_event)  # type: ignore[arg-type]
     hass.bus.listen(
         EVENT_ENTITY_REGISTRY_UPDATED,
@@ -175,6 +176,15 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics: dict[str, MetricWrapperBase] = {}
         self._climate_units = climate_units
+        self._handlers: dict[str, Callable[[State], None] | None] = {}
+        self._entity_labels: dict[str, dict[str, Any]] = {}
+        # State changes are handled in executor threads and scrapes render
+        # the exposition in the executor, the lock keeps them apart
+        self._lock = threading.Lock()
+        # The exposition of every metric is kept pre-rendered and only
+        # the metrics that changed since the last scrape are rendered again
+        self._rendered: dict[str, bytes] = {}
+        self._dirty: set[str] = set()
 
     def handle_state_changed_event(
         self, event: EventType[EventStateChangedData]
@@ -195,6 +205,11 @@ class PrometheusMetrics:
         self.handle_state(state)
 
     def handle_state(self, state: State) -> None:
+        """Add/update a state in Prometheus."""
+        with self._lock:
+            self._handle_state(state)
+
+    def _handle_state(self, state: State) -> None:
         """Add/update a state in Prometheus."""
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
@@ -202,10 +217,13 @@ class PrometheusMetrics:
 
         ignored_states = (STATE_UNAVAILABLE, STATE_UNKNOWN)
 
-        handler = f"_handle_{domain}"
+        try:
+            handler = self._handlers[domain]
+        except KeyError:
+            handler = self._handlers[domain] = getattr(self, f"_handle_{domain}", None)
 
-        if hasattr(self, handler) and state.state not in ignored_states:
-            getattr(self, handler)(state)
+        if handler is not None and state.state not in ignored_states:
+            handler(state)
 
         labels = self._labels(state)
         state_change = self._metric(
@@ -256,7 +274,15 @@ class PrometheusMetrics:
         self, entity_id: str, friendly_name: str | None = None
     ) -> None:
         """Remove labelsets matching the given entity id from all metrics."""
-        for _, metric in self._metrics.items():
+        with self._lock:
+            self._entity_labels.pop(entity_id, None)
+            self._remove_metric_labelsets(entity_id, friendly_name)
+
+    def _remove_metric_labelsets(
+        self, entity_id: str, friendly_name: str | None
+    ) -> None:
+        """Remove labelsets matching the given entity id from all metrics."""
+        for name, metric in self._metrics.items():
             for sample in cast(list[prometheus_client.Metric], metric.collect())[
                 0
             ].samples:
@@ -270,6 +296,7 @@ class PrometheusMetrics:
                     )
                     with suppress(KeyError):
                         metric.remove(*sample.labels.values())
+                    self._dirty.add(name)
 
     def _handle_attributes(self, state: State) -> None:
         for key, value in state.attributes.items():
@@ -292,24 +319,46 @@ class PrometheusMetrics:
         documentation: str,
         extra_labels: list[str] | None = None,
     ) -> _MetricBaseT:
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
-
+        # Metrics are only looked up right before they are updated
+        self._dirty.add(metric)
         try:
             return cast(_MetricBaseT, self._metrics[metric])
         except KeyError:
+            labels = ["entity", "friendly_name", "domain"]
+            if extra_labels is not None:
+                labels.extend(extra_labels)
             full_metric_name = self._sanitize_metric_name(
                 f"{self.metrics_prefix}{metric}"
             )
+            # The metrics are rendered by generate_latest so they are not
+            # registered with the default registry
             self._metrics[metric] = factory(
                 full_metric_name,
                 documentation,
                 labels,
-                registry=prometheus_client.REGISTRY,
+                registry=None,
             )
             return cast(_MetricBaseT, self._metrics[metric])
 
+    def generate_latest(self) -> bytes:
+        """Return the exposition of the default registry and all metrics.
+
+        Must be run in the executor.
+        """
+        with self._lock:
+            rendered = self._rendered
+            for metric in self._dirty:
+                rendered[metric] = prometheus_client.generate_latest(
+                    self._metrics[metric]
+                )
+            self._dirty.clear()
+            return b"".join(
+                (
+                    prometheus_client.generate_latest(prometheus_client.REGISTRY),
+                    *rendered.values(),
+                )
+            )
+
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
         return "".join(
@@ -337,13 +386,16 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state: State) -> dict[str, Any]:
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+    def _labels(self, state: State) -> dict[str, Any]:
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        labels = self._entity_labels.get(state.entity_id)
+        if labels is None or labels["friendly_name"] != friendly_name:
+            labels = self._entity_labels[state.entity_id] = {
+                "entity": state.entity_id,
+                "domain": state.domain,
+                "friendly_name": friendly_name,
+            }
+        return labels
 
     def _battery(self, state: State) -> None:
         if (battery_level := state.attributes.get(ATTR_BATTERY_LEVEL)) is not None:
@@ -721,15 +773,20 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, requires_auth: bool) -> None:
+    def __init__(self, requires_auth: bool, metrics: PrometheusMetrics) -> None:
         """Initialize Prometheus view."""
         self.requires_auth = requires_auth
+        self.metrics = metrics
 
     async def get(self, request: web.Request) -> web.Response:
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=prometheus_client.generate_latest(prometheus_client.REGISTRY),
+        hass: HomeAssistant = request.app["hass"]
+        response = web.Response(
+            body=await hass.async_add_executor_job(self.metrics.generate_latest),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
+            zlib_executor_size=32768,
         )
+        response.enable_compression()
+        return response
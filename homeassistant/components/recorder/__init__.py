@@ -27,6 +27,7 @@ from homeassistant.loader import bind_hass
 
 from . import entity_registry, websocket_api
 from .const import (  # noqa: F401
+    BACKLOG_SPILL_FILE,
     CONF_DB_INTEGRITY_CHECK,
     DATA_INSTANCE,
     DOMAIN,
@@ -59,6 +60,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_SPILL_BACKLOG = "spill_backlog"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -111,6 +113,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_SPILL_BACKLOG, default=False): cv.boolean,
                 }
             ),
         )
@@ -149,6 +152,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     if EVENT_STATE_CHANGED in exclude_event_types:
         _LOGGER.error("State change events cannot be excluded, use a filter instead")
         exclude_event_types.remove(EVENT_STATE_CHANGED)
+    backlog_spill_path: str | None = None
+    if conf[CONF_SPILL_BACKLOG]:
+        backlog_spill_path = hass.config.path(BACKLOG_SPILL_FILE)
     instance = hass.data[DATA_INSTANCE] = Recorder(
         hass=hass,
         auto_purge=auto_purge,
@@ -160,6 +166,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        backlog_spill_path=backlog_spill_path,
     )
     instance.async_initialize()
     instance.async_register()
@@ -0,0 +1,230 @@
+"""Spill the recorder backlog to disk when the queue is exhausted."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import suppress
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_CONTEXT,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    Context,
+    Event,
+    EventOrigin,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_object
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import StateInfo
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key used to store the unrecorded attributes of a spilled state
+COMPRESSED_STATE_UNRECORDED_ATTRIBUTES = "u"
+
+
+def _encode_event(event: Event) -> bytes:
+    """Encode an event as a single json line."""
+    data = event.data
+    if event.event_type == EVENT_STATE_CHANGED:
+        new_state: State | None = data.get("new_state")
+        compressed_state: dict[str, Any] | None = None
+        if new_state is not None:
+            compressed_state = new_state.as_compressed_state
+            if state_info := new_state.state_info:
+                compressed_state = {
+                    **compressed_state,
+                    COMPRESSED_STATE_UNRECORDED_ATTRIBUTES: list(
+                        state_info["unrecorded_attributes"]
+                    ),
+                }
+        # The old state is never recorded so there is no
+        # need to write it to disk
+        data = {"entity_id": data["entity_id"], "new_state": compressed_state}
+    context = event.context
+    return (
+        json_bytes(
+            {
+                "t": event.event_type,
+                "d": data,
+                "o": event.origin.value,
+                "f": dt_util.utc_to_timestamp(event.time_fired),
+                "c": [context.id, context.user_id, context.parent_id],
+            }
+        )
+        + b"\n"
+    )
+
+
+def _decode_state(entity_id: str, compressed_state: dict[str, Any]) -> State:
+    """Decode a compressed state."""
+    last_changed = dt_util.utc_from_timestamp(
+        compressed_state[COMPRESSED_STATE_LAST_CHANGED]
+    )
+    if (
+        last_updated_ts := compressed_state.get(COMPRESSED_STATE_LAST_UPDATED)
+    ) is not None:
+        last_updated = dt_util.utc_from_timestamp(last_updated_ts)
+    else:
+        last_updated = last_changed
+    state_context = compressed_state[COMPRESSED_STATE_CONTEXT]
+    if isinstance(state_context, str):
+        context = Context(id=state_context)
+    else:
+        context = Context(
+            user_id=state_context["user_id"],
+            parent_id=state_context["parent_id"],
+            id=state_context["id"],
+        )
+    state_info: StateInfo | None = None
+    if (
+        unrecorded_attributes := compressed_state.get(
+            COMPRESSED_STATE_UNRECORDED_ATTRIBUTES
+        )
+    ) is not None:
+        state_info = {"unrecorded_attributes": frozenset(unrecorded_attributes)}
+    return State(
+        entity_id,
+        compressed_state[COMPRESSED_STATE_STATE],
+        compressed_state[COMPRESSED_STATE_ATTRIBUTES],
+        last_changed,
+        last_updated,
+        context,
+        False,
+        state_info,
+    )
+
+
+def _decode_event(line: bytes) -> Event:
+    """Decode an event from a json line."""
+    raw = json_loads_object(line)
+    event_type: str = raw["t"]
+    data: dict[str, Any] = raw["d"]  # type: ignore[assignment]
+    if event_type == EVENT_STATE_CHANGED:
+        entity_id: str = data["entity_id"]
+        new_state: dict[str, Any] | None = data["new_state"]
+        data = {
+            "entity_id": entity_id,
+            "old_state": None,
+            "new_state": new_state and _decode_state(entity_id, new_state),
+        }
+    context_id, user_id, parent_id = raw["c"]  # type: ignore[misc]
+    return Event(
+        event_type,
+        data,
+        EventOrigin(raw["o"]),
+        dt_util.utc_from_timestamp(raw["f"]),  # type: ignore[arg-type]
+        Context(user_id=user_id, parent_id=parent_id, id=context_id),
+    )
+
+
+class RecorderBacklogSpill:
+    """Append-only file holding the events the recorder queue could not hold.
+
+    Events are spilled from the event loop and written to disk in the
+    executor in the order they were fired. The recorder thread replays
+    them once the queue has drained from a replay file the backlog file
+    is moved to, so events spilled during the replay go to a new file.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the backlog spill."""
+        self.hass = hass
+        self.path = path
+        self.replay_path = f"{path}.replay"
+        self._pending: list[bytes] = []
+        self._write_task: asyncio.Task[None] | None = None
+        # Held while appending to the backlog file so it
+        # is never moved away in the middle of a write
+        self._lock = threading.Lock()
+
+    @callback
+    def async_spill(self, event: Event) -> None:
+        """Spill an event to disk."""
+        try:
+            line = _encode_event(event)
+        except (TypeError, ValueError) as err:
+            _LOGGER.warning(
+                "Event is not serializable, not spilling %s: %s", event, err
+            )
+            return
+        self._pending.append(line)
+        if self._write_task is None:
+            self._write_task = self.hass.async_create_task(
+                self._async_write_pending(), "recorder backlog spill"
+            )
+
+    async def _async_write_pending(self) -> None:
+        """Write pending lines to disk until there are none left."""
+        try:
+            while self._pending:
+                lines, self._pending = self._pending, []
+                await self.hass.async_add_executor_job(self._write_lines, lines)
+        finally:
+            self._write_task = None
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        """Append lines to the backlog file."""
+        with self._lock, open(self.path, "ab") as backlog_file:
+            backlog_file.writelines(lines)
+
+    async def async_wait_writes(self) -> None:
+        """Wait until every spilled event has been written to disk."""
+        while self._write_task is not None:
+            await self._write_task
+
+    def iter_replay_paths(self) -> Iterator[str]:
+        """Move the backlog file aside and yield the path of the files to replay.
+
+        A file left behind by an interrupted replay is yielded first. Each
+        file must be removed once replayed before the next one is taken.
+        Must be called from the recorder thread.
+        """
+        if os.path.exists(self.replay_path):
+            yield self.replay_path
+        with self._lock:
+            try:
+                os.replace(self.path, self.replay_path)
+            except FileNotFoundError:
+                return
+        yield self.replay_path
+
+    def iter_events(self, path: str) -> Iterator[Event]:
+        """Read back the spilled events of a file in the order they were fired.
+
+        Must be called from the recorder thread.
+        """
+        try:
+            backlog_file = open(path, "rb")  # pylint: disable=consider-using-with
+        except FileNotFoundError:
+            return
+        with backlog_file:
+            for line in backlog_file:
+                try:
+                    event = _decode_event(line)
+                except (KeyError, TypeError, ValueError) as err:
+                    _LOGGER.warning(
+                        "Skipping unreadable event in recorder backlog: %s", err
+                    )
+                    continue
+                yield event
+
+    def remove(self, path: str) -> None:
+        """Remove a replay file once it has been replayed."""
+        with suppress(FileNotFoundError):
+            os.unlink(path)
@@ -25,6 +25,13 @@ MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 ESTIMATED_QUEUE_ITEM_SIZE = 10240
 QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY = 0.65
 
+# When spilling the backlog to disk, events are queued again
+# once the queue has drained below this percentage of the maximum
+BACKLOG_SPILL_RESUME_PERCENTAGE = 50
+BACKLOG_SPILL_FILE = "home-assistant_v2.backlog"
+# Commit the session every this many events while replaying the backlog
+BACKLOG_REPLAY_COMMIT_SIZE = 1000
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -41,7 +41,10 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
 from . import migration, statistics
+from .backlog import RecorderBacklogSpill
 from .const import (
+    BACKLOG_REPLAY_COMMIT_SIZE,
+    BACKLOG_SPILL_RESUME_PERCENTAGE,
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -79,6 +82,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -87,6 +91,7 @@ from .queries import (
 )
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
+from .table_managers.events import EventsManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
@@ -110,6 +115,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    ReplayBacklogTask,
     StatesContextIDMigrationTask,
     StatisticsTask,
     StopTask,
@@ -177,6 +183,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        backlog_spill_path: str | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -204,6 +211,12 @@ class Recorder(threading.Thread):
         self.engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
+        # When set, events that do not fit in the queue are
+        # spilled to disk instead of being dropped
+        self._backlog_spill: RecorderBacklogSpill | None = None
+        if backlog_spill_path:
+            self._backlog_spill = RecorderBacklogSpill(hass, backlog_spill_path)
+        self._spilling_backlog = False
 
         # The entity_filter is exposed on the recorder instance so that
         # it can be used to see if an entity is being recorded and is called
@@ -214,9 +227,13 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # States are bulk inserted when the database can return
+        # the ids of an executemany in parameter order
+        self._bulk_insert_states = False
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
+        self.events_manager = EventsManager()
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
         self.states_meta_manager = StatesMetaManager(self)
@@ -249,6 +266,9 @@ class Recorder(threading.Thread):
         # and determine what is actually supported.
         self.max_bind_vars = SQLITE_MAX_BIND_VARS
 
+        # The progress of the last purge run
+        self.purge_progress: PurgeProgress | None = None
+
     @property
     def backlog(self) -> int:
         """Return the number of items in the recorder backlog."""
@@ -302,9 +322,23 @@ class Recorder(threading.Thread):
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
+        if self._backlog_spill:
+            # Replay anything left behind by a previous run before
+            # any of the new events are processed
+            self.queue_task(ReplayBacklogTask())
+        self._async_listen_events(self._queue.put_nowait)
+        self._queue_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_queue,
+            timedelta(minutes=10),
+            name="Recorder queue watcher",
+        )
+
+    @callback
+    def _async_listen_events(self, queue_put: Callable[[Event], None]) -> None:
+        """Listen for events and pass the ones to record to queue_put."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -336,12 +370,6 @@ class Recorder(threading.Thread):
             _event_listener,
             run_immediately=True,
         )
-        self._queue_watcher = async_track_time_interval(
-            self.hass,
-            self._async_check_queue,
-            timedelta(minutes=10),
-            name="Recorder queue watcher",
-        )
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -381,8 +409,32 @@ class Recorder(threading.Thread):
         """
         size = self.backlog
         _LOGGER.debug("Recorder queue size is: %s", size)
+        if self._spilling_backlog:
+            if not self._reached_max_backlog_percentage(
+                BACKLOG_SPILL_RESUME_PERCENTAGE
+            ):
+                self.hass.async_create_task(
+                    self._async_resume_from_backlog_spill(),
+                    "Recorder resume from backlog spill",
+                )
+            return
         if not self._reached_max_backlog_percentage(100):
             return
+        if self._backlog_spill and self._event_listener:
+            _LOGGER.warning(
+                (
+                    "The recorder backlog queue reached the maximum size of %s events; "
+                    "usually, the system is CPU bound, I/O bound, or the database "
+                    "is corrupt due to a disk problem; The recorder will write new "
+                    "events to %s until the queue has drained"
+                ),
+                self.backlog,
+                self._backlog_spill.path,
+            )
+            self._spilling_backlog = True
+            self._event_listener()
+            self._async_listen_events(self._backlog_spill.async_spill)
+            return
         _LOGGER.error(
             (
                 "The recorder backlog queue reached the maximum size of %s events; "
@@ -394,6 +446,20 @@ class Recorder(threading.Thread):
         )
         self._async_stop_queue_watcher_and_event_listener()
 
+    async def _async_resume_from_backlog_spill(self) -> None:
+        """Queue events again and replay the spilled backlog."""
+        assert self._backlog_spill is not None
+        # Events keep being spilled until everything spilled so far is on
+        # disk so the replay sees them in the order they were fired
+        await self._backlog_spill.async_wait_writes()
+        if not self._spilling_backlog or not self._event_listener:
+            return
+        _LOGGER.info("The recorder backlog queue has drained, replaying spilled events")
+        self._spilling_backlog = False
+        self._event_listener()
+        self.queue_task(ReplayBacklogTask())
+        self._async_listen_events(self._queue.put_nowait)
+
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
         if not self._psutil:
@@ -460,6 +526,9 @@ class Recorder(threading.Thread):
             except queue.Empty:
                 break
         self.queue_task(StopTask())
+        if self._backlog_spill:
+            # Keep the spilled events for the next run
+            await self._backlog_spill.async_wait_writes()
         await self.hass.async_add_executor_job(self.join)
 
     async def _async_shutdown(self, event: Event) -> None:
@@ -868,7 +937,12 @@ class Recorder(threading.Thread):
 
         self.stop_requested = False
         while not self.stop_requested:
-            self._guarded_process_one_task_or_event_or_recover(queue_.get())
+            task_or_event = queue_.get()
+            if self._spilling_backlog and queue_.empty():
+                # Resume queueing events as soon as the queue has drained
+                # instead of waiting for the next check of the queue watcher
+                self.hass.add_job(self._async_check_queue)
+            self._guarded_process_one_task_or_event_or_recover(task_or_event)
 
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event]
@@ -1026,6 +1100,22 @@ class Recorder(threading.Thread):
             self.backlog,
         )
 
+    def _replay_backlog(self) -> None:
+        """Replay the events that were spilled to disk."""
+        backlog_spill = self._backlog_spill
+        assert backlog_spill is not None
+        replayed = 0
+        for path in backlog_spill.iter_replay_paths():
+            for event in backlog_spill.iter_events(path):
+                self._process_one_event(event)
+                replayed += 1
+                if not replayed % BACKLOG_REPLAY_COMMIT_SIZE:
+                    self._commit_event_session_or_retry()
+            self._commit_event_session_or_retry()
+            backlog_spill.remove(path)
+        if replayed:
+            _LOGGER.info("Replayed %s events from the recorder backlog", replayed)
+
     def _process_one_event(self, event: Event) -> None:
         if not self.enabled:
             return
@@ -1056,7 +1146,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_session(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1081,7 +1171,12 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_session(dbevent)
+
+    def _add_event_to_session(self, dbevent: Events) -> None:
+        """Add an event to be bulk inserted at the next commit."""
+        self._event_session_has_pending_writes = True
+        self.events_manager.add_pending_insert(dbevent)
 
     def _process_state_changed_event_into_session(self, event: Event) -> None:
         """Process a state_changed event into the session."""
@@ -1154,7 +1249,11 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self._bulk_insert_states:
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_insert(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1193,6 +1292,10 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        # Rows collected since the last commit are written
+        # with executemany instead of the ORM unit of work
+        self.states_manager.bulk_insert_pending(session)
+        self.events_manager.bulk_insert_pending(session)
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1204,6 +1307,7 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        self.events_manager.post_commit_pending()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1226,6 +1330,7 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        self.events_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
@@ -1417,6 +1522,10 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        # The dialect has been initialized by the first connection
+        self._bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
@@ -7,6 +7,7 @@ from typing import Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State
 
 from ... import recorder
@@ -16,8 +17,10 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_columnar as _modern_get_significant_states_columnar,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    states_to_columns,
 )
 
 # These are the APIs of this package
@@ -27,6 +30,7 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_columnar",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -91,17 +95,32 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
-    if not recorder.get_instance(hass).states_meta_manager.active:
-        from .legacy import (  # pylint: disable=import-outside-toplevel
-            get_significant_states as _legacy_get_significant_states,
+    """Return a dict of significant states during a time period.
+
+    max_points is ignored until the states have been migrated
+    to the current schema.
+    """
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            max_points,
         )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+    return _legacy_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -115,6 +134,57 @@ def get_significant_states(
     )
 
 
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    max_points: int | None = None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return significant states during a time period as per entity columns.
+
+    max_points is ignored until the states have been migrated
+    to the current schema.
+    """
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_columnar(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            max_points,
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    # The legacy schema is only used until the migration finishes
+    # so there is no need for a dedicated query
+    compressed_states = _legacy_get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        True,
+        True,
+        True,
+    )
+    return {
+        entity_id: states_to_columns(
+            [state[COMPRESSED_STATE_LAST_UPDATED] for state in states],  # type: ignore[index]
+            [state[COMPRESSED_STATE_STATE] for state in states],  # type: ignore[index]
+        )
+        for entity_id, states in compressed_states.items()
+    }
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
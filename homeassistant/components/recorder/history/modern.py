@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
+from functools import partial
 from itertools import groupby
 from operator import itemgetter
 from typing import Any, cast
@@ -21,7 +22,12 @@ from sqlalchemy import (
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
 import homeassistant.util.dt as dt_util
 
@@ -49,6 +55,10 @@ _FIELD_MAP = {
     "last_updated_ts": 2,
 }
 
+_NON_NUMERIC_STATES = {STATE_UNAVAILABLE, STATE_UNKNOWN, None}
+
+_Downsampler = Callable[[Iterable[Row], str | None], Iterator[tuple[str, float]]]
+
 
 def _stmt_and_join_attributes(
     no_attributes: bool, include_last_changed: bool
@@ -102,6 +112,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -117,6 +128,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -195,6 +207,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -206,11 +219,105 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    max_points downsamples the states of each entity while the rows
+    are read, see _downsample_states. The states following the first
+    one are then returned like with minimal_response, even when it is
+    not set.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        result := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = result
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+        downsample=_downsampler(start_time, end_time, max_points),
+    )
+
+
+def get_significant_states_columnar(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    max_points: int | None = None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Return significant states as per entity columns.
+
+    Each entity maps to a list of last_updated timestamps and a list of
+    states. Consecutive duplicate states are dropped as they are with
+    minimal_response and attributes are never included.
+
+    When every state of an entity is numeric (or unknown/unavailable),
+    the states are returned as floats (or None) so graphs of numeric
+    sensors can be built without creating an object per row.
+
+    max_points downsamples the states of each entity while the rows
+    are read, see _downsample_states.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            result := _significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                True,
+            )
+        ):
+            return {}
+        rows, start_time_ts, entity_id_to_metadata_id = result
+        return _sorted_states_to_columns(
+            rows,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            _downsampler(start_time, end_time, max_points),
+        )
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Query the significant state rows sorted by metadata_id and last_updated.
+
+    Returns the rows, the start time timestamp if the start time
+    state is included, and the entity_id to metadata_id map.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +326,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -257,14 +364,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
+    return (
         execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
         start_time_ts if include_start_time_state else None,
-        entity_ids,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -633,6 +736,160 @@ def _get_single_entity_start_time_stmt(
     )
 
 
+def states_to_columns(
+    timestamps: list[float], states: list[str]
+) -> dict[str, list[Any]]:
+    """Build the columns for the states of an entity.
+
+    States are converted to floats when every state is numeric,
+    unknown, or unavailable, otherwise they are kept as strings.
+    """
+    numeric_states: list[float | None] = []
+    append = numeric_states.append
+    try:
+        for state in states:
+            if state in _NON_NUMERIC_STATES:
+                append(None)
+            else:
+                append(float(state))
+    except ValueError:
+        return {
+            COMPRESSED_STATE_LAST_UPDATED: timestamps,
+            COMPRESSED_STATE_STATE: states,
+        }
+    return {
+        COMPRESSED_STATE_LAST_UPDATED: timestamps,
+        COMPRESSED_STATE_STATE: numeric_states,
+    }
+
+
+def _downsample_states(
+    rows: Iterable[Row],
+    prev_state: str | None,
+    start_time_ts: float,
+    end_time_ts: float,
+    max_points: int,
+) -> Iterator[tuple[str, float]]:
+    """Yield the state changes of an entity downsampled to about max_points.
+
+    The period is split in max_points // 2 buckets and only the rows
+    with the minimum and the maximum value of each bucket are kept, in
+    time order, so a graph keeps its shape while the number of points
+    only depends on max_points. The last row is always kept. Rows with
+    a non numeric state are never dropped and close the current bucket.
+    """
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    bucket_width = (end_time_ts - start_time_ts) / max(max_points // 2, 1) or 1.0
+    bucket = -1
+    # (value, state, last_updated_ts) of the current bucket
+    low: tuple[float, str, float] | None = None
+    high: tuple[float, str, float] | None = None
+    last: tuple[float, str, float] | None = None
+
+    def _flush() -> Iterator[tuple[str, float]]:
+        if low is None or high is None:
+            return
+        first, second = (low, high) if low[2] <= high[2] else (high, low)
+        yield first[1], first[2]
+        if second is not first:
+            yield second[1], second[2]
+
+    for row in rows:
+        if (state := row[state_idx]) == prev_state:
+            continue
+        prev_state = state
+        # The start time state row has a last_updated_ts of 0
+        last_updated_ts = row[last_updated_ts_idx] or start_time_ts
+        try:
+            value = float(state)
+        except (TypeError, ValueError):
+            yield from _flush()
+            low = high = last = None
+            bucket = -1
+            yield state, last_updated_ts
+            continue
+        last = sample = (value, state, last_updated_ts)
+        if (index := int((last_updated_ts - start_time_ts) // bucket_width)) != bucket:
+            yield from _flush()
+            bucket = index
+            low = high = sample
+        elif low is not None and value < low[0]:
+            low = sample
+        elif high is not None and value > high[0]:
+            high = sample
+
+    yield from _flush()
+    if last is not None and last is not low and last is not high:
+        yield last[1], last[2]
+
+
+def _downsampler(
+    start_time: datetime, end_time: datetime | None, max_points: int | None
+) -> _Downsampler | None:
+    """Return a function downsampling the state rows of an entity."""
+    if not max_points:
+        return None
+    return partial(
+        _downsample_states,
+        start_time_ts=dt_util.utc_to_timestamp(start_time),
+        end_time_ts=dt_util.utc_to_timestamp(end_time or dt_util.utcnow()),
+        max_points=max_points,
+    )
+
+
+def _sorted_states_to_columns(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    downsample: _Downsampler | None = None,
+) -> dict[str, dict[str, list[Any]]]:
+    """Convert SQL results into per entity columns.
+
+    States must be sorted by metadata_id and last_updated.
+    """
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    columns: dict[str, dict[str, list[Any]]] = {}
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        timestamps: list[float] = []
+        entity_states: list[str] = []
+        if downsample is not None:
+            # The first state is always kept like with _sorted_states_to_dict
+            first_row = next(group)
+            entity_states.append(first_row[state_idx])
+            timestamps.append(first_row[last_updated_ts_idx] or start_time_ts)
+            for state, last_updated_ts in downsample(group, first_row[state_idx]):
+                entity_states.append(state)
+                timestamps.append(last_updated_ts)
+            columns[metadata_id_to_entity_id[metadata_id]] = states_to_columns(
+                timestamps, entity_states
+            )
+            continue
+        prev_state: str | None = None
+        for row in group:
+            if (state := row[state_idx]) == prev_state:
+                continue
+            prev_state = state
+            entity_states.append(state)
+            # The start time state row has a last_updated_ts of 0
+            timestamps.append(row[last_updated_ts_idx] or start_time_ts)
+        if timestamps:
+            columns[metadata_id_to_entity_id[metadata_id]] = states_to_columns(
+                timestamps, entity_states
+            )
+    # Maintain the order of the requested entity_ids
+    return {
+        entity_id: columns[entity_id]
+        for entity_id in entity_ids
+        if entity_id in columns
+    }
+
+
 def _sorted_states_to_dict(
     states: Iterable[Row],
     start_time_ts: float | None,
@@ -642,6 +899,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    downsample: _Downsampler | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -653,6 +911,9 @@ def _sorted_states_to_dict(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    When downsampling, the states following the first one are reduced
+    like with minimal_response and then downsampled.
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -697,6 +958,7 @@ def _sorted_states_to_dict(
         ent_results = result[entity_id]
         if (
             not minimal_response
+            and downsample is None
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
             ent_results.extend(
@@ -741,6 +1003,23 @@ def _sorted_states_to_dict(
         #
         # With minimal response we do not care about attribute
         # changes so we can filter out duplicate states
+        if downsample is not None:
+            if compressed_state_format:
+                ent_results.extend(
+                    {attr_state: state, attr_time: last_updated_ts}
+                    for state, last_updated_ts in downsample(group, prev_state)
+                )
+            else:
+                _utc_from_timestamp = dt_util.utc_from_timestamp
+                ent_results.extend(
+                    {
+                        attr_state: state,
+                        attr_time: _utc_from_timestamp(last_updated_ts).isoformat(),
+                    }
+                    for state, last_updated_ts in downsample(group, prev_state)
+                )
+            continue
+
         if compressed_state_format:
             # Compressed state format uses the timestamp directly
             ent_results.extend(
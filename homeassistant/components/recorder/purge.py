@@ -1,12 +1,14 @@
 """Purge old data helper."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -52,6 +54,105 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# A purge task stops purging batches after PURGE_TASK_TIME_BUDGET seconds
+# and schedules the next purge task to let the other recorder tasks run
+PURGE_TASK_TIME_BUDGET = 10.0
+# The rows purged per batch are adapted so a batch of statements
+# takes about PURGE_BATCH_TARGET_LATENCY seconds
+PURGE_BATCH_TARGET_LATENCY = 1.0
+MIN_PURGE_BATCH_ROWS = 100
+
+PURGE_PROGRESS_TABLES = (
+    "states",
+    "state_attributes",
+    "events",
+    "event_data",
+    "statistics_runs",
+    "statistics_short_term",
+)
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge run split over several purge tasks.
+
+    The progress is updated from the recorder thread
+    and read from the event loop for the recorder info.
+    """
+
+    purge_before: datetime
+    started: datetime = field(default_factory=dt_util.utcnow)
+    finished: datetime | None = None
+    tasks: int = 0
+    elapsed: float = 0.0
+    deadline: float = 0.0
+    batch_rows: int | None = None
+    batch_latency: float | None = None
+    rows: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(PURGE_PROGRESS_TABLES, 0)
+    )
+
+    @property
+    def out_of_time(self) -> bool:
+        """Return if the purge task used its time budget."""
+        return time.monotonic() >= self.deadline
+
+    def get_batch_rows(self, max_bind_vars: int) -> int:
+        """Return the number of rows to purge in the next batch."""
+        if self.batch_rows is None or self.batch_rows > max_bind_vars:
+            return max_bind_vars
+        return self.batch_rows
+
+    def record_batch(self, latency: float, max_bind_vars: int) -> None:
+        """Adapt the rows of the next batch to the latency of the last batch."""
+        rows = self.get_batch_rows(max_bind_vars)
+        self.batch_latency = latency
+        if latency > PURGE_BATCH_TARGET_LATENCY:
+            self.batch_rows = max(rows // 2, MIN_PURGE_BATCH_ROWS)
+        elif latency < PURGE_BATCH_TARGET_LATENCY / 2:
+            self.batch_rows = min(rows * 2, max_bind_vars)
+
+    def add_rows(self, table: str, count: int) -> None:
+        """Add purged rows of a table."""
+        self.rows[table] += count
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        rows = dict(self.rows)
+        total = sum(rows.values())
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "started": self.started.isoformat(),
+            "finished": self.finished.isoformat() if self.finished else None,
+            "tasks": self.tasks,
+            "elapsed": round(self.elapsed, 3),
+            "batch_rows": self.batch_rows,
+            "batch_latency": self.batch_latency,
+            "rows": rows,
+            "rows_per_second": round(total / self.elapsed, 1) if self.elapsed else None,
+        }
+
+
+@contextmanager
+def _track_purge_progress(
+    instance: Recorder, purge_before: datetime
+) -> Generator[PurgeProgress, None, None]:
+    """Track the progress of a purge task in the purge run it belongs to."""
+    progress = instance.purge_progress
+    if (
+        progress is None
+        or progress.finished is not None
+        or progress.purge_before != purge_before
+    ):
+        progress = instance.purge_progress = PurgeProgress(purge_before)
+    start = time.monotonic()
+    progress.deadline = start + PURGE_TASK_TIME_BUDGET
+    try:
+        yield progress
+    finally:
+        progress.tasks += 1
+        progress.elapsed += time.monotonic() - start
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -70,7 +171,9 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
-    with session_scope(session=instance.get_session()) as session:
+    with _track_purge_progress(instance, purge_before) as progress, session_scope(
+        session=instance.get_session()
+    ) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -86,10 +189,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, progress, states_batch_size, purge_before
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, progress, events_batch_size, purge_before
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -100,9 +203,11 @@ def purge_old_data(
         )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
+            progress.add_rows("statistics_runs", len(statistics_runs))
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
+            progress.add_rows("statistics_short_term", len(short_term_statistics))
 
         if has_more_to_purge or statistics_runs or short_term_statistics:
             # Return false, as we might not be done yet.
@@ -122,6 +227,8 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+        progress.finished = dt_util.utcnow()
+        _LOGGER.debug("Purge finished: %s", progress.as_dict())
     if repack:
         repack_database(instance)
     return True
@@ -175,6 +282,7 @@ def _purge_legacy_format(
 def _purge_states_and_attributes_ids(
     instance: Recorder,
     session: Session,
+    progress: PurgeProgress,
     states_batch_size: int,
     purge_before: datetime,
 ) -> bool:
@@ -192,16 +300,24 @@ def _purge_states_and_attributes_ids(
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(states_batch_size):
+        start = time.monotonic()
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, progress.get_batch_rows(max_bind_vars)
         )
         if not state_ids:
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.record_batch(time.monotonic() - start, max_bind_vars)
+        progress.add_rows("states", len(state_ids))
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if progress.out_of_time:
+            break
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    progress.add_rows(
+        "state_attributes",
+        _purge_unused_attributes_ids(instance, session, attributes_ids_batch),
+    )
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -212,6 +328,7 @@ def _purge_states_and_attributes_ids(
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
+    progress: PurgeProgress,
     events_batch_size: int,
     purge_before: datetime,
 ) -> bool:
@@ -227,16 +344,23 @@ def _purge_events_and_data_ids(
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
     for _ in range(events_batch_size):
+        start = time.monotonic()
         event_ids, data_ids = _select_event_data_ids_to_purge(
-            session, purge_before, max_bind_vars
+            session, purge_before, progress.get_batch_rows(max_bind_vars)
         )
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.record_batch(time.monotonic() - start, max_bind_vars)
+        progress.add_rows("events", len(event_ids))
         data_ids_batch = data_ids_batch | data_ids
+        if progress.out_of_time:
+            break
 
-    _purge_unused_data_ids(instance, session, data_ids_batch)
+    progress.add_rows(
+        "event_data", _purge_unused_data_ids(instance, session, data_ids_batch)
+    )
     _LOGGER.debug(
         "After purging event and data_ids remaining=%s",
         has_remaining_event_ids_to_purge,
@@ -364,14 +488,15 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
+) -> int:
+    """Purge unused attributes ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
         instance, session, attributes_ids_batch, database_engine
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+    return len(unused_attribute_ids_set)
 
 
 def _select_unused_event_data_ids(
@@ -412,13 +537,15 @@ def _select_unused_event_data_ids(
 
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
-) -> None:
+) -> int:
+    """Purge unused event data ids and return how many were purged."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_data_ids_set := _select_unused_event_data_ids(
         instance, session, data_ids_batch, database_engine
     ):
         _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    return len(unused_data_ids_set)
 
 
 def _select_statistics_runs_to_purge(
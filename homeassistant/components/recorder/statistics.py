@@ -7,16 +7,29 @@ import contextlib
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import groupby
 import logging
 from operator import itemgetter
 import re
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Float,
+    Integer,
+    Select,
+    and_,
+    bindparam,
+    case,
+    func,
+    lambda_stmt,
+    literal_column,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError, StatementError
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
@@ -144,17 +157,6 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
 
 
-def mean(values: list[float]) -> float | None:
-    """Return the mean of the values.
-
-    This is a very simple version that only works
-    with a non-empty list of floats. The built-in
-    statistics.mean is more robust but is is almost
-    an order of magnitude slower.
-    """
-    return sum(values) / len(values)
-
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -866,65 +868,6 @@ def list_statistic_ids(
     return _flatten_list_statistic_ids_metadata_result(result)
 
 
-def _reduce_statistics(
-    stats: dict[str, list[StatisticsRow]],
-    same_period: Callable[[float, float], bool],
-    period_start_end: Callable[[float], tuple[float, float]],
-    period: timedelta,
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily or monthly statistics."""
-    result: dict[str, list[StatisticsRow]] = defaultdict(list)
-    period_seconds = period.total_seconds()
-    _want_mean = "mean" in types
-    _want_min = "min" in types
-    _want_max = "max" in types
-    _want_last_reset = "last_reset" in types
-    _want_state = "state" in types
-    _want_sum = "sum" in types
-    for statistic_id, stat_list in stats.items():
-        max_values: list[float] = []
-        mean_values: list[float] = []
-        min_values: list[float] = []
-        prev_stat: StatisticsRow = stat_list[0]
-        fake_entry: StatisticsRow = {"start": stat_list[-1]["start"] + period_seconds}
-
-        # Loop over the hourly statistics + a fake entry to end the period
-        for statistic in chain(stat_list, (fake_entry,)):
-            if not same_period(prev_stat["start"], statistic["start"]):
-                start, end = period_start_end(prev_stat["start"])
-                # The previous statistic was the last entry of the period
-                row: StatisticsRow = {
-                    "start": start,
-                    "end": end,
-                }
-                if _want_mean:
-                    row["mean"] = mean(mean_values) if mean_values else None
-                    mean_values.clear()
-                if _want_min:
-                    row["min"] = min(min_values) if min_values else None
-                    min_values.clear()
-                if _want_max:
-                    row["max"] = max(max_values) if max_values else None
-                    max_values.clear()
-                if _want_last_reset:
-                    row["last_reset"] = prev_stat.get("last_reset")
-                if _want_state:
-                    row["state"] = prev_stat.get("state")
-                if _want_sum:
-                    row["sum"] = prev_stat["sum"]
-                result[statistic_id].append(row)
-            if _want_max and (_max := statistic.get("max")) is not None:
-                max_values.append(_max)
-            if _want_mean and (_mean := statistic.get("mean")) is not None:
-                mean_values.append(_mean)
-            if _want_min and (_min := statistic.get("min")) is not None:
-                min_values.append(_min)
-            prev_stat = statistic
-
-    return result
-
-
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -962,17 +905,6 @@ def reduce_day_ts_factory() -> (
     return _same_day_ts, _day_start_end_ts_cached
 
 
-def _reduce_statistics_per_day(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
-
-
 def reduce_week_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -1012,17 +944,6 @@ def reduce_week_ts_factory() -> (
     return _same_week_ts, _week_start_end_ts_cached
 
 
-def _reduce_statistics_per_week(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
-
-
 def _find_month_end_time(timestamp: datetime) -> datetime:
     """Return the end of the month (midnight at the first day of the next month)."""
     # We add 4 days to the end to make sure we are in the next month
@@ -1069,17 +990,6 @@ def reduce_month_ts_factory() -> (
     return _same_month_ts, _month_start_end_ts_cached
 
 
-def _reduce_statistics_per_month(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
-    )
-
-
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1103,6 +1013,134 @@ def _generate_statistics_during_period_stmt(
     return stmt
 
 
+def _period_index_case(
+    column: ColumnElement[float], starts: list[float], offset: int = 0
+) -> ColumnElement[int]:
+    """Return an expression mapping a timestamp to the index of its period.
+
+    The periods are searched with a balanced tree of CASE expressions so
+    each row only needs a logarithmic number of comparisons. The period
+    starts are rendered as literals to not run into bind parameter limits.
+    """
+    if len(starts) == 1:
+        return literal_column(str(offset), Integer)
+    middle = len(starts) // 2
+    return case(
+        (
+            column < literal_column(repr(starts[middle]), Float),
+            _period_index_case(column, starts[:middle], offset),
+        ),
+        else_=_period_index_case(column, starts[middle:], offset + middle),
+    )
+
+
+def _generate_reduced_statistics_during_period_stmt(
+    start_time_ts: float,
+    end_time_ts: float,
+    periods: list[tuple[float, float]],
+    metadata_ids: list[int] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Select:
+    """Prepare a database query reducing hourly statistics to longer periods.
+
+    The mean, min and max are aggregated per period and the last_reset, state
+    and sum are taken from the last hourly statistic of the period, the start
+    of each row is the index of its period. Only the hourly statistics from
+    the start time until the end time are reduced, the periods are used to
+    group them.
+    """
+    period_index = _period_index_case(
+        Statistics.start_ts, [start for start, _ in periods]
+    )
+    columns: list[ColumnElement[Any]] = [
+        Statistics.metadata_id,
+        period_index.label("period_index"),
+        func.max(Statistics.start_ts).label("last_start_ts"),
+    ]
+    if "mean" in types:
+        columns.append(func.avg(Statistics.mean).label("mean"))
+    if "min" in types:
+        columns.append(func.min(Statistics.min).label("min"))
+    if "max" in types:
+        columns.append(func.max(Statistics.max).label("max"))
+    reduced_stmt = select(*columns).filter(
+        Statistics.start_ts >= start_time_ts, Statistics.start_ts < end_time_ts
+    )
+    if metadata_ids:
+        reduced_stmt = reduced_stmt.filter(Statistics.metadata_id.in_(metadata_ids))
+    if len(periods) > 1:
+        reduced_stmt = reduced_stmt.group_by(Statistics.metadata_id, period_index)
+    else:
+        # A constant would be taken as a column position
+        reduced_stmt = reduced_stmt.group_by(Statistics.metadata_id)
+    reduced = reduced_stmt.subquery()
+
+    stmt = select(
+        reduced.c.metadata_id,
+        reduced.c.period_index.label("start_ts"),
+        *(reduced.c[column] for column in ("mean", "min", "max") if column in types),
+    ).select_from(reduced)
+    if last_columns := [
+        getattr(Statistics, _type_column_mapping[key])
+        for key in ("last_reset", "state", "sum")
+        if key in types
+    ]:
+        stmt = stmt.add_columns(*last_columns).join(
+            Statistics,
+            and_(
+                Statistics.metadata_id == reduced.c.metadata_id,
+                Statistics.start_ts == reduced.c.last_start_ts,
+            ),
+        )
+    return stmt.order_by(reduced.c.metadata_id, reduced.c.period_index)
+
+
+def _reduced_statistics_during_period(
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period: Literal["day", "week", "month"],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> tuple[Sequence[Row], list[tuple[float, float]]]:
+    """Reduce hourly statistics to daily, weekly or monthly statistics.
+
+    The statistics are reduced by the database, the periods are returned
+    to map the period index of each row to its start and end.
+    """
+    start_time_ts = start_time.timestamp()
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+    else:
+        last_stmt = select(func.max(Statistics.start_ts)).filter(
+            Statistics.start_ts >= start_time_ts
+        )
+        if metadata_ids:
+            last_stmt = last_stmt.filter(Statistics.metadata_id.in_(metadata_ids))
+        if (last_start_ts := session.execute(last_stmt).scalar()) is None:
+            return [], []
+        end_time_ts = last_start_ts + Statistics.duration.total_seconds()
+
+    if period == "day":
+        _, period_start_end = reduce_day_ts_factory()
+    elif period == "week":
+        _, period_start_end = reduce_week_ts_factory()
+    else:
+        _, period_start_end = reduce_month_ts_factory()
+    periods: list[tuple[float, float]] = []
+    period_start = start_time_ts
+    while period_start < end_time_ts:
+        periods.append(period_start_end(period_start))
+        period_start = periods[-1][1]
+    if not periods:
+        return [], []
+
+    stmt = _generate_reduced_statistics_during_period_stmt(
+        start_time_ts, end_time_ts, periods, metadata_ids, types
+    )
+    return session.connection().execute(stmt).all(), periods
+
+
 def _generate_max_mean_min_statistic_in_sub_period_stmt(
     columns: Select,
     start_time: datetime | None,
@@ -1702,12 +1740,18 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    periods: list[tuple[float, float]] | None = None
+    if period in ("day", "week", "month"):
+        stats, periods = _reduced_statistics_during_period(
+            session, start_time, end_time, metadata_ids, period, types
+        )
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
     if not stats:
         return {}
@@ -1725,14 +1769,11 @@ def _statistics_during_period_with_session(
         types,
     )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
-
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
-
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+    if periods is not None:
+        # Replace the period index of each row with the start and end of the period
+        for rows in result.values():
+            for row in rows:
+                row["start"], row["end"] = periods[int(row["start"])]
 
     if "change" in _types:
         _augment_result_with_change(
@@ -0,0 +1,71 @@
+"""Support managing Events."""
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from ..db_schema import Events
+
+# The columns written by bulk_insert_pending, event_id is
+# assigned by the database.
+_INSERT_COLUMNS = tuple(
+    column.key for column in Events.__table__.columns if not column.primary_key
+)
+
+
+class EventsManager:
+    """Manage the events table."""
+
+    def __init__(self) -> None:
+        """Initialize the events manager."""
+        self._pending_inserts: list[Events] = []
+
+    def add_pending_insert(self, event: Events) -> None:
+        """Add an event to be written by bulk_insert_pending.
+
+        The event is not added to the session, which avoids the
+        overhead of the ORM unit of work for every row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(event)
+
+    def bulk_insert_pending(self, session: Session) -> None:
+        """Insert the events added by add_pending_insert with executemany.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (pending := self._pending_inserts):
+            return
+        # Make sure the EventTypes and EventData rows
+        # the events refer to have been assigned their ids
+        session.flush()
+        params: list[dict[str, Any]] = []
+        for dbevent in pending:
+            row = {key: getattr(dbevent, key) for key in _INSERT_COLUMNS}
+            if (event_type := dbevent.event_type_rel) is not None:
+                row["event_type_id"] = event_type.event_type_id
+            if (event_data := dbevent.event_data_rel) is not None:
+                row["data_id"] = event_data.data_id
+            params.append(row)
+        session.execute(insert(Events), params)
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to clear the inserted events.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.clear()
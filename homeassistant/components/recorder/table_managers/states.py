@@ -1,8 +1,19 @@
 """Support managing States."""
 from __future__ import annotations
 
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
 
+# The columns written by bulk_insert_pending, state_id is
+# assigned by the database.
+_INSERT_COLUMNS = tuple(
+    column.key for column in States.__table__.columns if not column.primary_key
+)
+
 
 class StatesManager:
     """Manage the states table."""
@@ -11,6 +22,7 @@ class StatesManager:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
         self._last_committed_id: dict[str, int] = {}
+        self._pending_inserts: list[States] = []
 
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
@@ -43,6 +55,66 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state to be written by bulk_insert_pending.
+
+        The state is not added to the session, which avoids the
+        overhead of the ORM unit of work for every row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def bulk_insert_pending(self, session: Session) -> None:
+        """Insert the states added by add_pending_insert with executemany.
+
+        States are inserted in waves so that a state whose old state
+        is pending in the same batch is inserted after it. The state_ids
+        returned by each wave are used to link the old_state_id of
+        the next wave.
+
+        The database must support RETURNING for executemany with
+        the rows returned in parameter order.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (pending := self._pending_inserts):
+            return
+        # Make sure the StatesMeta and StateAttributes rows
+        # the states refer to have been assigned their ids
+        session.flush()
+        # Clear the state_ids from an earlier attempt that was rolled back
+        for dbstate in pending:
+            dbstate.state_id = None  # type: ignore[assignment]
+        in_batch = {id(dbstate) for dbstate in pending}
+        stmt = insert(States).returning(States.state_id, sort_by_parameter_order=True)
+        while pending:
+            wave: list[States] = []
+            deferred: list[States] = []
+            params: list[dict[str, Any]] = []
+            for dbstate in pending:
+                old_state = dbstate.old_state
+                if old_state is not None:
+                    if old_state.state_id is None and id(old_state) in in_batch:
+                        deferred.append(dbstate)
+                        continue
+                row = {key: getattr(dbstate, key) for key in _INSERT_COLUMNS}
+                if old_state is not None:
+                    row["old_state_id"] = old_state.state_id
+                if (states_meta := dbstate.states_meta_rel) is not None:
+                    row["metadata_id"] = states_meta.metadata_id
+                if (state_attributes := dbstate.state_attributes) is not None:
+                    row["attributes_id"] = state_attributes.attributes_id
+                wave.append(dbstate)
+                params.append(row)
+            for dbstate, state_id in zip(
+                wave, session.execute(stmt, params).scalars(), strict=True
+            ):
+                dbstate.state_id = state_id
+            pending = deferred
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
@@ -52,6 +124,7 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +134,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
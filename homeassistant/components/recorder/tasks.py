@@ -256,6 +256,15 @@ class DatabaseLockTask(RecorderTask):
         instance._lock_database(self)  # pylint: disable=[protected-access]
 
 
+@dataclass(slots=True)
+class ReplayBacklogTask(RecorderTask):
+    """An object to insert into the recorder queue to replay the spilled backlog."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_backlog()  # pylint: disable=[protected-access]
+
+
 @dataclass(slots=True)
 class StopTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
@@ -500,12 +500,14 @@ def ws_info(
     migration_is_live = async_migration_is_live(hass)
     recording = instance.recording if instance else False
     thread_alive = instance.is_alive() if instance else False
+    purge_progress = instance.purge_progress if instance else None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": instance.max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "purge": purge_progress.as_dict() if purge_progress else None,
         "recording": recording,
         "thread_running": thread_alive,
     }
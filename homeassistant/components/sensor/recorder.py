@@ -1,12 +1,14 @@
 """Statistics helper for sensor."""
 from __future__ import annotations
 
+from bisect import insort
 from collections import defaultdict
 from collections.abc import Callable, Iterable, MutableMapping
 import datetime
 import itertools
 import logging
 import math
+import threading
 from typing import Any
 
 from sqlalchemy.orm.session import Session
@@ -24,12 +26,13 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.core import Event, HomeAssistant, State, callback, split_entity_id
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
 from homeassistant.loader import async_suggest_report_issue
@@ -64,6 +67,8 @@ WARN_UNSUPPORTED_UNIT = "sensor_warn_unsupported_unit"
 WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# States collected from state changed events to compile statistics from
+DATA_LIVE_STATES = "sensor_recorder_live_states"
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -131,6 +136,139 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+class _LiveStates:
+    """States of the statistics sensors collected from state changed events.
+
+    The states are collected on the event loop and read from the recorder
+    thread, which spares compile_statistics reading back the states the
+    recorder has just written. The states of an entity are only used for
+    periods starting after the entity was first tracked, the database is
+    the fallback after a restart or for older periods.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the live states."""
+        self.hass = hass
+        self._lock = threading.Lock()
+        self._states: dict[str, list[tuple[float | None, State]]] = {}
+        self._tracked_since: dict[str, datetime.datetime] = {}
+
+    @callback
+    def async_start(self) -> None:
+        """Start collecting the states."""
+        entity_filter = get_instance(self.hass).entity_filter
+        now = dt_util.utcnow()
+        with self._lock:
+            for state in self.hass.states.async_all(DOMAIN):
+                if ATTR_STATE_CLASS in state.attributes and entity_filter(
+                    state.entity_id
+                ):
+                    self._states[state.entity_id] = [
+                        (_float_or_none(state.state), state)
+                    ]
+                    self._tracked_since[state.entity_id] = max(now, state.last_updated)
+
+        @callback
+        def _async_state_changed_filter(event: Event) -> bool:
+            """Filter state changes of recorded sensors."""
+            return entity_filter(event.data["entity_id"])
+
+        self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=_async_state_changed_filter,
+            run_immediately=True,
+            domain=DOMAIN,
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Collect the new state of a sensor."""
+        entity_id: str = event.data["entity_id"]
+        new_state: State | None = event.data["new_state"]
+        with self._lock:
+            if new_state is None or ATTR_STATE_CLASS not in new_state.attributes:
+                self._states.pop(entity_id, None)
+                self._tracked_since.pop(entity_id, None)
+                return
+            item = (_float_or_none(new_state.state), new_state)
+            if (states := self._states.get(entity_id)) is not None:
+                if new_state.last_updated >= states[-1][1].last_updated:
+                    states.append(item)
+                else:
+                    # Keep the states ordered like the recorder history
+                    insort(states, item, key=_last_updated)
+            else:
+                self._states[entity_id] = [item]
+                self._tracked_since[entity_id] = new_state.last_updated
+
+    def float_states(
+        self,
+        entity_id: str,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        significant_changes_only: bool,
+    ) -> list[tuple[float, State]] | None:
+        """Return the float states during start-end like the recorder history.
+
+        Returns None if the entity has not been tracked since before start.
+        """
+        with self._lock:
+            if (since := self._tracked_since.get(entity_id)) is None or since >= start:
+                return None
+            states = self._states[entity_id].copy()
+
+        # The last state before start is the state at start, the states
+        # after it are filtered like the recorder history filters them
+        first = 0
+        for index, (_, state) in enumerate(states):
+            if state.last_updated >= start:
+                break
+            first = index
+        float_states: list[tuple[float, State]] = []
+        for fstate, state in itertools.islice(states, first, None):
+            if state.last_updated >= end:
+                break
+            if fstate is None:
+                continue
+            if (
+                significant_changes_only
+                and state.last_updated >= start
+                and state.last_changed != state.last_updated
+            ):
+                continue
+            float_states.append((fstate, state))
+        return float_states
+
+    def prune(self, end: datetime.datetime) -> None:
+        """Drop the states which are not needed for periods starting at end."""
+        tracked_since = end - datetime.timedelta.resolution
+        with self._lock:
+            for entity_id, states in self._states.items():
+                keep = 0
+                for index, (_, state) in enumerate(states):
+                    if state.last_updated >= end:
+                        break
+                    keep = index
+                del states[:keep]
+                # Periods before end can no longer be compiled from the states
+                if self._tracked_since[entity_id] < tracked_since:
+                    self._tracked_since[entity_id] = tracked_since
+
+
+def _last_updated(item: tuple[float | None, State]) -> datetime.datetime:
+    """Return when the state of a live states item was last updated."""
+    return item[1].last_updated
+
+
+def _get_live_states(hass: HomeAssistant) -> _LiveStates:
+    """Return the live states, start collecting them on first use."""
+    if (live_states := hass.data.get(DATA_LIVE_STATES)) is None:
+        live_states = hass.data[DATA_LIVE_STATES] = _LiveStates(hass)
+        hass.loop.call_soon_threadsafe(live_states.async_start)
+    return live_states
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -390,9 +528,27 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    live_states = _get_live_states(hass)
+
+    # Use the states collected from state changed events when possible and
+    # only get the history of the remaining sensors from the database
+    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    history_sensor_states: list[State] = []
+    for _state in sensor_states:
+        entity_id = _state.entity_id
+        float_states = live_states.float_states(
+            entity_id, start, end, "sum" not in wanted_statistics[entity_id]
+        )
+        if float_states is None:
+            history_sensor_states.append(_state)
+        elif float_states:
+            entities_with_float_states[entity_id] = float_states
+
     # Get history between start and end
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in history_sensor_states
+        if "sum" in wanted_statistics[i.entity_id]
     ]
     history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
@@ -406,7 +562,7 @@ def compile_statistics(  # noqa: C901
         )
     entities_significant_history = [
         i.entity_id
-        for i in sensor_states
+        for i in history_sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
     if entities_significant_history:
@@ -419,8 +575,7 @@ def compile_statistics(  # noqa: C901
         )
         history_list = {**history_list, **_history_list}
 
-    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
-    for _state in sensor_states:
+    for _state in history_sensor_states:
         entity_id = _state.entity_id
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
@@ -613,6 +768,7 @@ def compile_statistics(  # noqa: C901
 
         result.append({"meta": meta, "stat": stat})
 
+    live_states.prune(end)
     return statistics.PlatformCompiledStatistics(result, old_metadatas)
 
 
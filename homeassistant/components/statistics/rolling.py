@@ -0,0 +1,370 @@
+"""Incrementally maintained statistics over a window of samples."""
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from collections.abc import Callable
+from datetime import datetime
+from heapq import heapify, heappop, heappush
+import math
+from typing import cast
+
+# The running sums lose the precision of the values much smaller than
+# the largest value added to them, so they are recomputed from the
+# samples once a value RECOMPUTE_RATIO times larger than the remaining
+# values leaves the window
+RECOMPUTE_RATIO = 2**20
+
+
+class _SplitHeaps:
+    """Values split into the smallest ones and the others by a rank.
+
+    The smallest values are kept in a max heap and the others in a min
+    heap, so the values around the split are read in O(1) and adding
+    or removing a value is O(log n). Removed values are only marked and
+    dropped once they reach the top of their heap.
+    """
+
+    def __init__(self, rank: Callable[[int], int]) -> None:
+        """Initialize the heaps, rank returns the count of the smallest values."""
+        self._rank = rank
+        # The lower heap holds the negated values to act as a max heap
+        self._lower: list[float | bool] = []
+        self._upper: list[float | bool] = []
+        self._lower_len = 0
+        self._upper_len = 0
+        self._removed_lower: defaultdict[float | bool, int] = defaultdict(int)
+        self._removed_upper: defaultdict[float | bool, int] = defaultdict(int)
+
+    @property
+    def lower_max(self) -> float | bool:
+        """Return the largest of the smallest values."""
+        return -self._lower[0]
+
+    @property
+    def upper_min(self) -> float | bool:
+        """Return the smallest of the other values."""
+        return self._upper[0]
+
+    def add(self, value: float | bool) -> None:
+        """Add a value."""
+        if self._lower_len and value <= -self._lower[0]:
+            heappush(self._lower, -value)
+            self._lower_len += 1
+        else:
+            heappush(self._upper, value)
+            self._upper_len += 1
+        self._rebalance()
+
+    def remove(self, value: float | bool) -> None:
+        """Remove a value that was added before."""
+        # A value not larger than the top of the lower heap is in it,
+        # since all values in the upper heap are at least that large
+        if self._lower_len and value <= -self._lower[0]:
+            self._removed_lower[-value] += 1
+            self._lower_len -= 1
+            self._prune_lower()
+        else:
+            self._removed_upper[value] += 1
+            self._upper_len -= 1
+            self._prune_upper()
+        self._rebalance()
+        # Compact a heap once most of it is removed values
+        if len(self._lower) > 2 * self._lower_len + 16:
+            self._lower = self._compact(self._lower, self._removed_lower)
+        if len(self._upper) > 2 * self._upper_len + 16:
+            self._upper = self._compact(self._upper, self._removed_upper)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._lower.clear()
+        self._upper.clear()
+        self._lower_len = 0
+        self._upper_len = 0
+        self._removed_lower.clear()
+        self._removed_upper.clear()
+
+    def _rebalance(self) -> None:
+        """Move values between the heaps until the lower one holds rank values."""
+        rank = self._rank(self._lower_len + self._upper_len)
+        while self._lower_len > rank:
+            value = -heappop(self._lower)
+            self._lower_len -= 1
+            self._prune_lower()
+            heappush(self._upper, value)
+            self._upper_len += 1
+        while self._lower_len < rank:
+            value = heappop(self._upper)
+            self._upper_len -= 1
+            self._prune_upper()
+            heappush(self._lower, -value)
+            self._lower_len += 1
+
+    def _prune_lower(self) -> None:
+        """Drop removed values from the top of the lower heap."""
+        lower = self._lower
+        removed = self._removed_lower
+        while lower and removed.get(lower[0]):
+            self._discard(removed, heappop(lower))
+
+    def _prune_upper(self) -> None:
+        """Drop removed values from the top of the upper heap."""
+        upper = self._upper
+        removed = self._removed_upper
+        while upper and removed.get(upper[0]):
+            self._discard(removed, heappop(upper))
+
+    @staticmethod
+    def _discard(removed: defaultdict[float | bool, int], value: float | bool) -> None:
+        """Account for a removed value that left its heap."""
+        if removed[value] == 1:
+            del removed[value]
+        else:
+            removed[value] -= 1
+
+    @classmethod
+    def _compact(
+        cls, heap: list[float | bool], removed: defaultdict[float | bool, int]
+    ) -> list[float | bool]:
+        """Return the heap without its removed values."""
+        kept: list[float | bool] = []
+        for value in heap:
+            if removed.get(value):
+                cls._discard(removed, value)
+            else:
+                kept.append(value)
+        heapify(kept)
+        return kept
+
+
+class RollingWindow:
+    """A window of samples with incrementally maintained statistics.
+
+    Samples are always appended at the end and removed from the start,
+    either because the buffer is full or because they expired, so every
+    statistic is updated from the sample entering or leaving the window
+    instead of being recomputed over the whole buffer. The running sums
+    are recomputed from the samples once the buffer turned over, or
+    when a much larger value left it, so rounding errors do not pile up.
+    """
+
+    def __init__(
+        self,
+        maxlen: int | None,
+        percentile: int | None = None,
+        circular: bool = False,
+    ) -> None:
+        """Initialize the window.
+
+        percentile keeps the values split at the rank of that percentile,
+        50 for the median, circular keeps the sums needed for the circular mean.
+        """
+        self.maxlen = maxlen
+        self.states: deque[float | bool] = deque()
+        self.ages: deque[datetime] = deque()
+        self._percentile = percentile
+        self._circular = circular
+        self._split: _SplitHeaps | None = None
+        if percentile is not None:
+            self._split = _SplitHeaps(self._percentile_rank)
+        # Monotonic deques of (value, age, sequence) with the oldest
+        # sample holding the minimum/maximum value in front
+        self._min: deque[tuple[float | bool, datetime, int]] = deque()
+        self._max: deque[tuple[float | bool, datetime, int]] = deque()
+        self._appended = 0
+        self._removed = 0
+        self.sum: float = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sin_sum = 0.0
+        self._cos_sum = 0.0
+        self.sum_differences = 0.0
+        self.sum_differences_nonnegative = 0.0
+        self.area_linear = 0.0
+        self.area_step = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self.states)
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add the newest sample, dropping the oldest when the window is full."""
+        states = self.states
+        if self.maxlen is not None and len(states) >= self.maxlen:
+            self.popleft()
+        if states:
+            self._add_segment(states[-1], self.ages[-1], value, age, 1)
+        states.append(value)
+        self.ages.append(age)
+        sequence = self._appended
+        self._appended += 1
+
+        self.sum += value
+        delta = value - self._mean
+        self._mean += delta / len(states)
+        self._m2 += delta * (value - self._mean)
+        if self._circular:
+            self._sin_sum += math.sin(math.radians(value))
+            self._cos_sum += math.cos(math.radians(value))
+        if self._split is not None:
+            self._split.add(value)
+
+        # Equal values are kept so the oldest occurrence stays in front
+        while self._max and self._max[-1][0] < value:
+            self._max.pop()
+        self._max.append((value, age, sequence))
+        while self._min and self._min[-1][0] > value:
+            self._min.pop()
+        self._min.append((value, age, sequence))
+
+    def popleft(self) -> None:
+        """Remove the oldest sample."""
+        states = self.states
+        sequence = self._appended - len(states)
+        value = states.popleft()
+        age = self.ages.popleft()
+        if not states:
+            self._reset()
+            return
+        self._add_segment(value, age, states[0], self.ages[0], -1)
+
+        self.sum -= value
+        delta = value - self._mean
+        self._mean -= delta / len(states)
+        self._m2 -= delta * (value - self._mean)
+        if self._circular:
+            self._sin_sum -= math.sin(math.radians(value))
+            self._cos_sum -= math.cos(math.radians(value))
+        if self._split is not None:
+            self._split.remove(value)
+
+        if self._max[0][2] == sequence:
+            self._max.popleft()
+        if self._min[0][2] == sequence:
+            self._min.popleft()
+
+        self._removed += 1
+        if self._removed >= len(states) or abs(value) > RECOMPUTE_RATIO * max(
+            abs(self._min[0][0]), abs(self._max[0][0])
+        ):
+            self._recompute()
+
+    def _add_segment(
+        self,
+        value: float | bool,
+        age: datetime,
+        next_value: float | bool,
+        next_age: datetime,
+        sign: int,
+    ) -> None:
+        """Add or remove the segment between two consecutive samples."""
+        seconds = (next_age - age).total_seconds()
+        self.area_linear += sign * 0.5 * (value + next_value) * seconds
+        self.area_step += sign * value * seconds
+        difference = next_value - value
+        self.sum_differences += sign * abs(difference)
+        self.sum_differences_nonnegative += sign * (
+            difference if next_value >= value else next_value
+        )
+
+    def _recompute(self) -> None:
+        """Recompute the running sums from the samples in the window."""
+        states = self.states
+        ages = self.ages
+        self._removed = 0
+        self.sum = math.fsum(states)
+        self._mean = self.sum / len(states)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in states)
+        if self._circular:
+            self._sin_sum = math.fsum(math.sin(math.radians(v)) for v in states)
+            self._cos_sum = math.fsum(math.cos(math.radians(v)) for v in states)
+        area_linear: list[float] = []
+        area_step: list[float] = []
+        differences: list[float] = []
+        differences_nonnegative: list[float] = []
+        for index in range(1, len(states)):
+            value = states[index - 1]
+            next_value = states[index]
+            seconds = (ages[index] - ages[index - 1]).total_seconds()
+            area_linear.append(0.5 * (value + next_value) * seconds)
+            area_step.append(value * seconds)
+            difference = next_value - value
+            differences.append(abs(difference))
+            differences_nonnegative.append(
+                difference if next_value >= value else next_value
+            )
+        self.area_linear = math.fsum(area_linear)
+        self.area_step = math.fsum(area_step)
+        self.sum_differences = math.fsum(differences)
+        self.sum_differences_nonnegative = math.fsum(differences_nonnegative)
+
+    def _reset(self) -> None:
+        """Reset the statistics once the window is empty."""
+        self._removed = 0
+        if self._split is not None:
+            self._split.clear()
+        self._min.clear()
+        self._max.clear()
+        self.sum = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sin_sum = 0.0
+        self._cos_sum = 0.0
+        self.sum_differences = 0.0
+        self.sum_differences_nonnegative = 0.0
+        self.area_linear = 0.0
+        self.area_step = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values."""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance of the values, needs two samples."""
+        return max(self._m2, 0.0) / (len(self.states) - 1)
+
+    @property
+    def mean_circular(self) -> float:
+        """Return the circular mean of the values in degrees."""
+        return (math.degrees(math.atan2(self._sin_sum, self._cos_sum)) + 360) % 360
+
+    @property
+    def max(self) -> tuple[float | bool, datetime]:
+        """Return the maximum value and the age of its oldest occurrence."""
+        value, age, _ = self._max[0]
+        return value, age
+
+    @property
+    def min(self) -> tuple[float | bool, datetime]:
+        """Return the minimum value and the age of its oldest occurrence."""
+        value, age, _ = self._min[0]
+        return value, age
+
+    def _percentile_rank(self, count: int) -> int:
+        """Return the count of the values below the split for the percentile."""
+        if count < 2:
+            return 0
+        j = cast(int, self._percentile) * (count + 1) // 100
+        return 1 if j < 1 else count - 1 if j > count - 1 else j
+
+    def median(self) -> float:
+        """Return the median of the values, needs the percentile to be 50."""
+        split = cast(_SplitHeaps, self._split)
+        count = len(self.states)
+        if count % 2 == 0:
+            return (split.lower_max + split.upper_min) / 2
+        # The middle value is the only one above the split of a single value
+        return split.upper_min if count == 1 else split.lower_max
+
+    def percentile(self) -> float:
+        """Return the percentile like statistics.quantiles with the exclusive method.
+
+        Needs at least two samples.
+        """
+        split = cast(_SplitHeaps, self._split)
+        percentile = cast(int, self._percentile)
+        count = len(self.states)
+        j = self._percentile_rank(count)
+        delta = percentile * (count + 1) - j * 100
+        return (split.lower_max * (100 - delta) + split.upper_min * delta) / 100
@@ -10,7 +10,9 @@ from typing import Any, cast
 
 import voluptuous as vol
 
+from homeassistant.auth import EVENT_USER_REMOVED, EVENT_USER_UPDATED
 from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
@@ -19,6 +21,7 @@ from homeassistant.const import (
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     HomeAssistant,
@@ -56,7 +59,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+    async_get_setup_trace,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -64,6 +71,7 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+ENTITY_CHANGES_ROUTER = "websocket_api_entity_changes_router"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +91,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -360,28 +369,134 @@ def _send_handle_get_states_response(
     )
 
 
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = ("send_message", "user", "msg_id", "entity_ids")
+
+    def __init__(
+        self,
+        send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+        user: User,
+        msg_id: int,
+        entity_ids: set[str],
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.user = user
+        self.msg_id = msg_id
+        self.entity_ids = entity_ids
+
+
+class _EntityChangesRouter:
+    """Route state changed events to the subscribe_entities subscriptions.
+
+    A single state changed listener is shared by every connection.
+    Subscriptions are indexed by entity_id so an event only reaches the
+    subscriptions interested in its entity, and read permissions are cached
+    per user until the user or its permissions change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the router."""
+        self.hass = hass
+        self._all_entities: dict[_EntitySubscription, None] = {}
+        self._by_entity_id: dict[str, dict[_EntitySubscription, None]] = {}
+        self._permissions: dict[
+            str, tuple[AbstractPermissions, bool, dict[str, bool]]
+        ] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_subscribe(self, subscription: _EntitySubscription) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        if not self._unsubs:
+            bus = self.hass.bus
+            self._unsubs = [
+                bus.async_listen(
+                    EVENT_STATE_CHANGED, self._async_forward, run_immediately=True
+                ),
+                *(
+                    bus.async_listen(
+                        event_type, self._async_user_changed, run_immediately=True
+                    )
+                    for event_type in (EVENT_USER_UPDATED, EVENT_USER_REMOVED)
+                ),
+            ]
+        if not subscription.entity_ids:
+            self._all_entities[subscription] = None
+        for entity_id in subscription.entity_ids:
+            self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+        return partial(self._async_unsubscribe, subscription)
+
+    @callback
+    def _async_unsubscribe(self, subscription: _EntitySubscription) -> None:
+        """Remove a subscription."""
+        self._all_entities.pop(subscription, None)
+        for entity_id in subscription.entity_ids:
+            if (subscriptions := self._by_entity_id.get(entity_id)) is None:
+                continue
+            subscriptions.pop(subscription, None)
+            if not subscriptions:
+                del self._by_entity_id[entity_id]
+        if self._all_entities or self._by_entity_id or not self._unsubs:
+            return
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        self._permissions.clear()
+
+    @callback
+    def _async_user_changed(self, event: Event) -> None:
+        """Forget the cached permissions of a changed user."""
+        self._permissions.pop(event.data["user_id"], None)
+
+    @callback
+    def _async_can_read(self, user: User, entity_id: str) -> bool:
+        """Return if the user can read the entity."""
+        # The permissions object is replaced when the user's permissions
+        # change, so a cache built from another object is stale.
+        permissions = user.permissions
+        cache = self._permissions.get(user.id)
+        if cache is None or cache[0] is not permissions:
+            cache = self._permissions[user.id] = (
+                permissions,
+                user.is_admin or permissions.access_all_entities(POLICY_READ),
+                {},
+            )
+        _, read_all, entities = cache
+        if read_all:
+            return True
+        if (allowed := entities.get(entity_id)) is None:
+            allowed = entities[entity_id] = permissions.check_entity(
+                entity_id, POLICY_READ
+            )
+        return allowed
+
+    @callback
+    def _async_forward(self, event: Event) -> None:
+        """Forward a state changed event to the interested subscriptions."""
+        entity_id: str = event.data["entity_id"]
+        subscriptions = self._by_entity_id.get(entity_id)
+        if subscriptions is None:
+            if not self._all_entities:
+                return
+            interested = list(self._all_entities)
+        else:
+            interested = [*self._all_entities, *subscriptions]
+        for subscription in interested:
+            if self._async_can_read(subscription.user, entity_id):
+                subscription.send_message(
+                    messages.cached_state_diff_message(subscription.msg_id, event)
+                )
+
+
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
-    entity_ids: set[str],
-    user: User,
-    msg_id: int,
-    event: Event,
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+def _async_get_entity_changes_router(hass: HomeAssistant) -> _EntityChangesRouter:
+    """Return the router shared by all subscribe_entities subscriptions."""
+    if (router := hass.data.get(ENTITY_CHANGES_ROUTER)) is None:
+        router = hass.data[ENTITY_CHANGES_ROUTER] = _EntityChangesRouter(hass)
+    return router
 
 
 @callback
@@ -400,16 +515,12 @@ def handle_subscribe_entities(
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            msg["id"],
-        ),
-        run_immediately=True,
+    connection.subscriptions[msg["id"]] = _async_get_entity_changes_router(
+        hass
+    ).async_subscribe(
+        _EntitySubscription(
+            connection.send_message, connection.user, msg["id"], entity_ids
+        )
     )
     connection.send_result(msg["id"])
 
@@ -541,6 +652,16 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "integration/setup_trace"})
+def handle_integration_setup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setup trace command, the trace is in the Chrome trace format."""
+    connection.send_result(msg["id"], async_get_setup_trace(hass).as_chrome_trace())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -25,6 +25,14 @@ PENDING_MSG_PEAK_TIME: Final = 5
 # This is effectively the upper limit of the number of entities
 # that can fire state changes within ~1 second.
 MAX_PENDING_MSG: Final = 4096
+# Maximum number of bytes that can be pending at any given time for
+# clients coalescing messages. Many small messages are sent together
+# to these clients so the size is what they can not keep up with.
+MAX_PENDING_BYTES: Final = 2**23
+# Size of the batches of coalesced messages, the batch size grows
+# while messages keep backing up and shrinks when the queue is empty.
+MIN_COALESCE_BYTES: Final = 2**14
+MAX_COALESCE_BYTES: Final = 2**20
 
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
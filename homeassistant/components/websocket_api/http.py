@@ -5,6 +5,7 @@ import asyncio
 from collections import deque
 from collections.abc import Callable
 import datetime as dt
+from ipaddress import ip_address
 import logging
 from typing import TYPE_CHECKING, Any, Final
 
@@ -15,12 +16,17 @@ from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.network import is_cloud_connection
 from homeassistant.util.json import json_loads
+from homeassistant.util.network import is_local
 
 from .auth import AuthPhase, auth_required_message
 from .const import (
     DATA_CONNECTIONS,
+    MAX_COALESCE_BYTES,
+    MAX_PENDING_BYTES,
     MAX_PENDING_MSG,
+    MIN_COALESCE_BYTES,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
     SIGNAL_WEBSOCKET_CONNECTED,
@@ -28,7 +34,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json
+from .messages import message_to_json_bytes
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -50,6 +56,20 @@ class WebsocketAPIView(HomeAssistantView):
         return await WebSocketHandler(request.app["hass"], request).async_handle()
 
 
+def _should_compress(hass: HomeAssistant, request: web.Request) -> bool:
+    """Return if permessage-deflate should be negotiated with the client.
+
+    Compressing the messages costs CPU time which is wasted on the
+    local network but makes a difference on slow remote links.
+    """
+    if is_cloud_connection(hass):
+        return True
+    try:
+        return not is_local(ip_address(request.remote))  # type: ignore[arg-type]
+    except ValueError:
+        return True
+
+
 class WebSocketAdapter(logging.LoggerAdapter):
     """Add connection id to websocket messages."""
 
@@ -74,6 +94,7 @@ class WebSocketHandler:
         "_peak_checker_unsub",
         "_connection",
         "_message_queue",
+        "_pending_bytes",
         "_ready_future",
     )
 
@@ -81,7 +102,11 @@ class WebSocketHandler:
         """Initialize an active connection."""
         self._hass = hass
         self._request: web.Request = request
-        self._wsock = web.WebSocketResponse(heartbeat=55)
+        # A client offering permessage-deflate shares a single compression
+        # context for all the messages of the connection
+        self._wsock = web.WebSocketResponse(
+            heartbeat=55, compress=_should_compress(hass, request)
+        )
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._closing: bool = False
@@ -94,7 +119,8 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[bytes | None] = deque()
+        self._pending_bytes = 0
         self._ready_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
@@ -121,48 +147,60 @@ class WebSocketHandler:
         message_queue = self._message_queue
         logger = self._logger
         wsock = self._wsock
-        send_str = wsock.send_str
+        # Messages are encoded when they are queued, the writer of the
+        # response is used to send the bytes without encoding them again
+        # as send_str only accepts str
+        send = wsock._writer.send  # type: ignore[union-attr] # pylint: disable=protected-access
         loop = self._hass.loop
         debug = logger.debug
         is_enabled_for = logger.isEnabledFor
         logging_debug = logging.DEBUG
+        batch_bytes = MIN_COALESCE_BYTES
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
-                if (messages_remaining := len(message_queue)) == 0:
+                if not message_queue:
                     self._ready_future = loop.create_future()
                     await self._ready_future
-                    messages_remaining = len(message_queue)
 
                 # A None message is used to signal the end of the connection
                 if (message := message_queue.popleft()) is None:
                     return
 
                 debug_enabled = is_enabled_for(logging_debug)
-                messages_remaining -= 1
 
                 if (
-                    not messages_remaining
+                    not message_queue
                     or not (connection := self._connection)
                     or not connection.can_coalesce
                 ):
+                    self._pending_bytes -= len(message)
                     if debug_enabled:
                         debug("%s: Sending %s", self.description, message)
-                    await send_str(message)
+                    await send(message, binary=False)
                     continue
 
-                messages: list[str] = [message]
-                while messages_remaining:
+                messages: list[bytes] = [message]
+                size = len(message)
+                while message_queue and size < batch_bytes:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
                         return
                     messages.append(message)
-                    messages_remaining -= 1
+                    size += len(message)
+                self._pending_bytes -= size
+
+                # Send larger batches while messages keep backing up
+                # and return to small batches once the client caught up
+                if message_queue:
+                    batch_bytes = min(batch_bytes * 2, MAX_COALESCE_BYTES)
+                else:
+                    batch_bytes = max(batch_bytes // 2, MIN_COALESCE_BYTES)
 
-                coalesced_messages = f'[{",".join(messages)}]'
+                coalesced_messages = b"[" + b",".join(messages) + b"]"
                 if debug_enabled:
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_str(coalesced_messages)
+                await send(coalesced_messages, binary=False)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -181,7 +219,7 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(self, message: bytes | str | dict[str, Any]) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -194,25 +232,34 @@ class WebSocketHandler:
             return
 
         if isinstance(message, dict):
-            message = message_to_json(message)
+            message = message_to_json_bytes(message)
+        elif isinstance(message, str):
+            message = message.encode()
 
         message_queue = self._message_queue
         queue_size_before_add = len(message_queue)
-        if queue_size_before_add >= MAX_PENDING_MSG:
+        # Coalesced messages are sent together so only their size matters
+        if (connection := self._connection) is not None and connection.can_coalesce:
+            overflow = self._pending_bytes >= MAX_PENDING_BYTES
+        else:
+            overflow = queue_size_before_add >= MAX_PENDING_MSG
+        if overflow:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
-                    " messages. The system's load is too high or an integration is"
-                    " misbehaving; Last message was: %s"
+                    " messages (%s bytes). The system's load is too high or an"
+                    " integration is misbehaving; Last message was: %s"
                 ),
                 self.description,
-                MAX_PENDING_MSG,
+                queue_size_before_add,
+                self._pending_bytes,
                 message,
             )
             self._cancel()
             return
 
         message_queue.append(message)
+        self._pending_bytes += len(message)
         ready_future = self._ready_future
         if ready_future and not ready_future.done():
             ready_future.set_result(None)
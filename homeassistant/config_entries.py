@@ -41,7 +41,13 @@ from .helpers.event import (
 )
 from .helpers.frame import report
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
-from .setup import DATA_SETUP_DONE, async_process_deps_reqs, async_setup_component
+from .setup import (
+    DATA_SETUP_DONE,
+    SetupPhase,
+    async_process_deps_reqs,
+    async_setup_component,
+    async_trace_setup,
+)
 from .util import uuid as uuid_util
 from .util.decorator import Registry
 
@@ -418,7 +424,10 @@ class ConfigEntry:
         error_reason = None
 
         try:
-            result = await component.async_setup_entry(hass, self)
+            with async_trace_setup(
+                hass, self.domain, SetupPhase.CONFIG_ENTRY_SETUP, self.title
+            ) as span:
+                result = await span.timed(component.async_setup_entry(hass, self))
 
             if not isinstance(result, bool):
                 _LOGGER.error(  # type: ignore[unreachable]
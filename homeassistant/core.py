@@ -14,6 +14,7 @@ from collections.abc import (
     Iterable,
     KeysView,
     Mapping,
+    Sequence,
     ValuesView,
 )
 import concurrent.futures
@@ -35,6 +36,7 @@ from typing import (
     Generic,
     Literal,
     ParamSpec,
+    Protocol,
     Self,
     TypeVar,
     cast,
@@ -48,6 +50,7 @@ import yarl
 from . import block_async_io, util
 from .const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
@@ -320,6 +323,27 @@ class HassJobWithArgs:
     args: Iterable[Any]
 
 
+class HassJobProfiler(Protocol):
+    """Record the time spent running HassJobs.
+
+    Set as HomeAssistant.job_profiler to have every HassJob run through it.
+    """
+
+    def run_callback(self, hassjob: HassJob[..., Any], args: tuple[Any, ...]) -> None:
+        """Run a callback job in the event loop."""
+
+    def wrap_coroutine(
+        self,
+        hassjob: HassJob[..., Any],
+        args: tuple[Any, ...],
+        coro: Coroutine[Any, Any, _R],
+    ) -> Coroutine[Any, Any, _R]:
+        """Wrap the coroutine of a coroutine function job."""
+
+    def run_executor(self, hassjob: HassJob[..., _R], args: tuple[Any, ...]) -> _R:
+        """Run an executor job in the executor."""
+
+
 def _get_hassjob_callable_job_type(target: Callable[..., Any]) -> HassJobType:
     """Determine the job type from the callable."""
     # Check for partials to properly determine if coroutine function
@@ -392,6 +416,8 @@ class HomeAssistant:
         self.timeout: TimeoutManager = TimeoutManager()
         self._stop_future: concurrent.futures.Future[None] | None = None
         self._shutdown_jobs: list[HassJobWithArgs] = []
+        # Opt-in instrumentation of the HassJobs run by the event loop
+        self.job_profiler: HassJobProfiler | None = None
 
     @property
     def is_running(self) -> bool:
@@ -582,6 +608,8 @@ class HomeAssistant:
         # if TYPE_CHECKING to avoid the overhead of constructing
         # the type used for the cast. For history see:
         # https://github.com/home-assistant/core/pull/71960
+        if (profiler := self.job_profiler) is not None:
+            return self._async_add_profiled_hass_job(profiler, hassjob, args)
         if hassjob.job_type is HassJobType.Coroutinefunction:
             if TYPE_CHECKING:
                 hassjob.target = cast(
@@ -603,6 +631,37 @@ class HomeAssistant:
 
         return task
 
+    @callback
+    def _async_add_profiled_hass_job(
+        self,
+        profiler: HassJobProfiler,
+        hassjob: HassJob[..., Coroutine[Any, Any, _R] | _R],
+        args: tuple[Any, ...],
+    ) -> asyncio.Future[_R] | None:
+        """Add a HassJob from within the event loop through the job profiler."""
+        task: asyncio.Future[_R]
+        if hassjob.job_type is HassJobType.Coroutinefunction:
+            if TYPE_CHECKING:
+                hassjob.target = cast(
+                    Callable[..., Coroutine[Any, Any, _R]], hassjob.target
+                )
+            task = self.loop.create_task(
+                profiler.wrap_coroutine(hassjob, args, hassjob.target(*args)),
+                name=hassjob.name,
+            )
+        elif hassjob.job_type is HassJobType.Callback:
+            self.loop.call_soon(profiler.run_callback, hassjob, args)
+            return None
+        else:
+            if TYPE_CHECKING:
+                hassjob = cast(HassJob[..., _R], hassjob)
+            task = self.loop.run_in_executor(None, profiler.run_executor, hassjob, args)
+
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.remove)
+
+        return task
+
     def create_task(
         self, target: Coroutine[Any, Any, Any], name: str | None = None
     ) -> None:
@@ -690,7 +749,10 @@ class HomeAssistant:
         if hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob.target = cast(Callable[..., _R], hassjob.target)
-            hassjob.target(*args)
+            if self.job_profiler is None:
+                hassjob.target(*args)
+            else:
+                self.job_profiler.run_callback(hassjob, args)
             return None
 
         return self.async_add_hass_job(hassjob, *args)
@@ -1139,18 +1201,29 @@ _FilterableJobType = tuple[
     Callable[[Event], bool] | None,  # event_filter
     bool,  # run_immediately
 ]
+_NO_LISTENERS: tuple[_FilterableJobType, ...] = ()
 
 
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_match_all_listeners",
+        "_entity_id_listeners",
+        "_domain_listeners",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Listeners keyed by event type and then by the entity_id
+        # or domain of the entity_id in the event data
+        self._entity_id_listeners: dict[str, dict[str, list[_FilterableJobType]]] = {}
+        self._domain_listeners: dict[str, dict[str, list[_FilterableJobType]]] = {}
         self._hass = hass
 
     @callback
@@ -1159,7 +1232,13 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for keyed_listeners in (self._entity_id_listeners, self._domain_listeners):
+            for event_type, listeners_by_key in keyed_listeners.items():
+                listeners[event_type] = listeners.get(event_type, 0) + sum(
+                    len(key_listeners) for key_listeners in listeners_by_key.values()
+                )
+        return listeners
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1196,36 +1275,67 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-        match_all_listeners = self._match_all_listeners
+        listeners = self._listeners.get(event_type, _NO_LISTENERS)
+        match_all_listeners: Sequence[_FilterableJobType] = self._match_all_listeners
+        entity_id_listeners: Sequence[_FilterableJobType] = _NO_LISTENERS
+        domain_listeners: Sequence[_FilterableJobType] = _NO_LISTENERS
+
+        if (
+            event_data is not None
+            and (self._entity_id_listeners or self._domain_listeners)
+            and isinstance(entity_id := event_data.get(ATTR_ENTITY_ID), str)
+        ):
+            if (by_entity_id := self._entity_id_listeners.get(event_type)) is not None:
+                entity_id_listeners = by_entity_id.get(entity_id, _NO_LISTENERS)
+            if (by_domain := self._domain_listeners.get(event_type)) is not None:
+                domain_listeners = by_domain.get(
+                    entity_id.partition(".")[0], _NO_LISTENERS
+                )
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners and not match_all_listeners:
+        if (
+            not listeners
+            and not match_all_listeners
+            and not entity_id_listeners
+            and not domain_listeners
+        ):
             return
 
         # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
-
-        for job, event_filter, run_immediately in listeners:
-            if event_filter is not None:
-                try:
-                    if not event_filter(event):
+        if event_type == EVENT_HOMEASSISTANT_CLOSE:
+            match_all_listeners = _NO_LISTENERS
+
+        # Listener lists are never mutated in place, see
+        # _async_listen_filterable_job, so they can be iterated
+        # without taking a copy first.
+        for listener_group in (
+            match_all_listeners,
+            listeners,
+            entity_id_listeners,
+            domain_listeners,
+        ):
+            for job, event_filter, run_immediately in listener_group:
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event):
+                            continue
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error in event filter")
                         continue
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception("Error in event filter")
-                    continue
-            if run_immediately:
-                try:
-                    job.target(event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception("Error running job: %s", job)
-            else:
-                self._hass.async_add_hass_job(job, event)
+                if run_immediately:
+                    try:
+                        if self._hass.job_profiler is None:
+                            job.target(event)
+                        else:
+                            self._hass.job_profiler.run_callback(job, (event,))
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error running job: %s", job)
+                else:
+                    self._hass.async_add_hass_job(job, event)
 
     def listen(
         self,
@@ -1254,6 +1364,9 @@ class EventBus:
         listener: Callable[[Event], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[Event], bool] | None = None,
         run_immediately: bool = False,
+        *,
+        entity_id: str | None = None,
+        domain: str | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1268,6 +1381,11 @@ class EventBus:
         right away instead of using call_soon. Only use this if
         the callback results in scheduling another task.
 
+        If entity_id or domain is passed, the listener is only called for
+        events whose entity_id in the event data matches the entity_id or
+        belongs to the domain. Keyed listeners are looked up directly when
+        the event is fired, so they are not called for other entities.
+
         This method must be run in the event loop.
         """
         job_type: HassJobType | None = None
@@ -1277,6 +1395,15 @@ class EventBus:
             if not is_callback_check_partial(listener):
                 raise HomeAssistantError(f"Event listener {listener} is not a callback")
             job_type = HassJobType.Callback
+        if entity_id is not None or domain is not None:
+            if entity_id is not None and domain is not None:
+                raise HomeAssistantError(
+                    "Only one of entity_id or domain can be used to key a listener"
+                )
+            if event_type == MATCH_ALL:
+                raise HomeAssistantError(
+                    "Keyed listeners must listen to a specific event type"
+                )
         return self._async_listen_filterable_job(
             event_type,
             (
@@ -1284,15 +1411,52 @@ class EventBus:
                 event_filter,
                 run_immediately,
             ),
+            entity_id,
+            domain,
         )
 
+    @callback
+    def _async_listener_container(
+        self,
+        event_type: str,
+        entity_id: str | None,
+        domain: str | None,
+        create: bool,
+    ) -> tuple[dict[str, list[_FilterableJobType]], str]:
+        """Return the dict holding the listener list and its key.
+
+        The dict of keyed listeners of the event type is only created when
+        create is set, an empty dict is returned if it does not exist.
+        """
+        if entity_id is not None:
+            keyed_listeners, key = self._entity_id_listeners, entity_id
+        elif domain is not None:
+            keyed_listeners, key = self._domain_listeners, domain
+        else:
+            return self._listeners, event_type
+        if create:
+            return keyed_listeners.setdefault(event_type, {}), key
+        return keyed_listeners.get(event_type, {}), key
+
     @callback
     def _async_listen_filterable_job(
-        self, event_type: str, filterable_job: _FilterableJobType
+        self,
+        event_type: str,
+        filterable_job: _FilterableJobType,
+        entity_id: str | None = None,
+        domain: str | None = None,
     ) -> CALLBACK_TYPE:
-        self._listeners.setdefault(event_type, []).append(filterable_job)
+        container, key = self._async_listener_container(
+            event_type, entity_id, domain, True
+        )
+        # The list is replaced instead of appended to so that a listener
+        # subscribing or unsubscribing while the event is being fired
+        # does not change the list async_fire is iterating.
+        container[key] = [*container.get(key, _NO_LISTENERS), filterable_job]
+        if container is self._listeners and key == MATCH_ALL:
+            self._match_all_listeners = container[key]
         return functools.partial(
-            self._async_remove_listener, event_type, filterable_job
+            self._async_remove_listener, event_type, filterable_job, entity_id, domain
         )
 
     def listen_once(
@@ -1368,24 +1532,52 @@ class EventBus:
 
     @callback
     def _async_remove_listener(
-        self, event_type: str, filterable_job: _FilterableJobType
+        self,
+        event_type: str,
+        filterable_job: _FilterableJobType,
+        entity_id: str | None = None,
+        domain: str | None = None,
     ) -> None:
         """Remove a listener of a specific event_type.
 
         This method must be run in the event loop.
         """
+        container, key = self._async_listener_container(
+            event_type, entity_id, domain, False
+        )
         try:
-            self._listeners[event_type].remove(filterable_job)
-
-            # delete event_type list if empty
-            if not self._listeners[event_type] and event_type != MATCH_ALL:
-                self._listeners.pop(event_type)
+            listeners = container[key].copy()
+            listeners.remove(filterable_job)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
             _LOGGER.exception(
                 "Unable to remove unknown job listener %s", filterable_job
             )
+            return
+
+        if container is not self._listeners:
+            if listeners:
+                container[key] = listeners
+                return
+            # delete the keyed list, and the event_type dict, if empty
+            del container[key]
+            if not container:
+                keyed_listeners = (
+                    self._entity_id_listeners
+                    if entity_id is not None
+                    else self._domain_listeners
+                )
+                keyed_listeners.pop(event_type)
+            return
+
+        if key == MATCH_ALL:
+            container[key] = self._match_all_listeners = listeners
+        # delete event_type list if empty
+        elif listeners:
+            container[key] = listeners
+        else:
+            container.pop(key)
 
 
 class State:
@@ -1908,6 +2100,105 @@ class StateMachine:
             time_fired=now,
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[
+            tuple[
+                str,
+                str,
+                Mapping[str, Any] | None,
+                bool,
+                Context | None,
+                StateInfo | None,
+            ]
+        ],
+        context: Context | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities that do not exist.
+
+        Each item is a tuple of (entity_id, new_state, attributes, force_update,
+        context, state_info) with the same meaning as the arguments of async_set.
+
+        All changed states share one timestamp. Items without a context share
+        the passed context, or a single new context if none is passed. The
+        state_changed events are fired once all states have been set.
+
+        This method must be run in the event loop.
+        """
+        timestamp = time.time()
+        now = dt_util.utc_from_timestamp(timestamp)
+        events_data: list[tuple[dict[str, Any], Context]] = []
+        try:
+            for (
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                state_context,
+                state_info,
+            ) in states:
+                entity_id = entity_id.lower()
+                new_state = str(new_state)
+                attributes = attributes or {}
+                if (old_state := self._states_data.get(entity_id)) is None:
+                    same_state = False
+                    same_attr = False
+                    last_changed = None
+                else:
+                    same_state = old_state.state == new_state and not force_update
+                    same_attr = old_state.attributes == attributes
+                    last_changed = old_state.last_changed if same_state else None
+
+                if same_state and same_attr:
+                    continue
+
+                if same_attr:
+                    if TYPE_CHECKING:
+                        assert old_state is not None
+                    attributes = old_state.attributes
+
+                if state_context is None:
+                    if context is None:
+                        context = Context(id=ulid_at_time(timestamp))
+                    state_context = context
+
+                state = State(
+                    entity_id,
+                    new_state,
+                    attributes,
+                    last_changed,
+                    now,
+                    state_context,
+                    old_state is None,
+                    state_info,
+                )
+                if old_state is not None:
+                    old_state.expire()
+                self._states[entity_id] = state
+                events_data.append(
+                    (
+                        {
+                            "entity_id": entity_id,
+                            "old_state": old_state,
+                            "new_state": state,
+                        },
+                        state_context,
+                    )
+                )
+        finally:
+            # States that were set before an invalid state was
+            # encountered still get their state_changed event
+            bus_async_fire = self._bus.async_fire
+            for event_data, state_context in events_data:
+                bus_async_fire(
+                    EVENT_STATE_CHANGED,
+                    event_data,
+                    EventOrigin.local,
+                    state_context,
+                    time_fired=now,
+                )
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -4,7 +4,15 @@ from __future__ import annotations
 from abc import ABCMeta
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine, Iterable, Mapping, MutableMapping
+from collections.abc import (
+    Callable,
+    Coroutine,
+    Generator,
+    Iterable,
+    Mapping,
+    MutableMapping,
+)
+from contextlib import contextmanager
 import dataclasses
 from enum import Enum, IntFlag, auto
 import functools as ft
@@ -49,6 +57,7 @@ from homeassistant.core import (
     HomeAssistant,
     callback,
     get_release_channel,
+    validate_state,
 )
 from homeassistant.exceptions import (
     HomeAssistantError,
@@ -79,6 +88,7 @@ _T = TypeVar("_T")
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_PENDING_STATE_WRITES = "entity_pending_state_writes"
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -104,6 +114,31 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return _entity_sources
 
 
+@contextmanager
+def async_batch_state_writes(hass: HomeAssistant) -> Generator[None, None, None]:
+    """Write the states of entities updated inside the block in one batch.
+
+    Entities calling async_write_ha_state inside the block are written to the
+    state machine with a single StateMachine.async_set_many call when the
+    block exits, sharing one timestamp and context.
+
+    This method must be run in the event loop.
+    """
+    if DATA_PENDING_STATE_WRITES in hass.data:
+        # Nested block, the outermost block writes the states
+        yield
+        return
+
+    pending: list[_PendingStateWrite] = []
+    hass.data[DATA_PENDING_STATE_WRITES] = pending
+    try:
+        yield
+    finally:
+        del hass.data[DATA_PENDING_STATE_WRITES]
+        if pending:
+            hass.states.async_set_many(pending)
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -217,6 +252,12 @@ class StateInfo(TypedDict):
     unrecorded_attributes: frozenset[str]
 
 
+# entity_id, state, attributes, force_update, context, state_info
+_PendingStateWrite = tuple[
+    str, str, dict[str, Any], bool, Context | None, StateInfo | None
+]
+
+
 class EntityPlatformState(Enum):
     """The platform state of an entity."""
 
@@ -1168,6 +1209,39 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        if (pending := hass.data.get(DATA_PENDING_STATE_WRITES)) is not None:
+            # Validate now so an invalid state does not fail the whole batch
+            try:
+                validate_state(state)
+            except InvalidStateError:
+                _LOGGER.exception(
+                    "Failed to set state for %s, fall back to %s",
+                    entity_id,
+                    STATE_UNKNOWN,
+                )
+                pending.append(
+                    (
+                        entity_id,
+                        STATE_UNKNOWN,
+                        {},
+                        self.force_update,
+                        self._context,
+                        None,
+                    )
+                )
+                return
+            pending.append(
+                (
+                    entity_id,
+                    state,
+                    attr,
+                    self.force_update,
+                    self._context,
+                    self._state_info,
+                )
+            )
+            return
+
         try:
             hass.states.async_set(
                 entity_id,
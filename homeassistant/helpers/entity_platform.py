@@ -31,7 +31,7 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.generated import languages
-from homeassistant.setup import async_start_setup
+from homeassistant.setup import SetupPhase, async_start_setup, async_trace_setup
 
 from . import (
     config_validation as cv,
@@ -52,6 +52,8 @@ if TYPE_CHECKING:
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 60
 SLOW_ADD_ENTITY_MAX_WAIT = 15  # Per Entity
+# Polling may be delayed this much to share its wakeup with other timers
+POLLING_JITTER = timedelta(milliseconds=50)
 SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
@@ -358,9 +360,11 @@ class EntityPlatform:
             self.platform_name,
             SLOW_SETUP_WARNING,
         )
-        with async_start_setup(hass, [full_name]):
+        with async_start_setup(hass, [full_name]), async_trace_setup(
+            hass, self.platform_name, SetupPhase.PLATFORM_SETUP, self.domain
+        ) as span:
             try:
-                task = async_create_setup_task()
+                task = span.timed(async_create_setup_task())
 
                 async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, self.domain):
                     await asyncio.shield(task)
@@ -538,6 +542,7 @@ class EntityPlatform:
             self._update_entity_states,
             self.scan_interval,
             name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
+            jitter=POLLING_JITTER,
         )
 
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
 import logging
+import math
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypedDict, TypeVar
@@ -63,6 +64,8 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+SHARED_TIMER_WHEEL = "shared_timer_wheel"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -75,6 +78,9 @@ _LOGGER = logging.getLogger(__name__)
 # in PR https://github.com/home-assistant/core/pull/82233
 RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
+# Random offsets are picked in steps so refresh cycles sharing a step can be
+# woken up together by the shared timer wheel.
+RANDOM_MICROSECOND_STEP = 50000
 
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
 _P = ParamSpec("_P")
@@ -1509,12 +1515,167 @@ def async_call_later(
 call_later = threaded_listener_factory(async_call_later)
 
 
+@dataclass(slots=True, eq=False)
+class _WheelTimer:
+    """A timer waiting in a slot of the shared timer wheel."""
+
+    job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    slot: _WheelSlot
+    cancelled: bool = False
+
+
+class _WheelSlot:
+    """Timers of the shared timer wheel due at the same loop time."""
+
+    __slots__ = ("wheel", "when", "timers", "handle")
+
+    def __init__(self, wheel: _TimerWheel, when: float) -> None:
+        """Initialize the slot and schedule its loop timer."""
+        self.wheel = wheel
+        self.when = when
+        self.timers: dict[_WheelTimer, None] = {}
+        self.handle = wheel.hass.loop.call_at(when, self)
+
+    def __call__(self) -> None:
+        """Run the timers of the elapsed slot."""
+        self.wheel.async_fire_slot(self)
+
+    def __repr__(self) -> str:
+        """Return the jobs of the slot so they show up in the loop timer."""
+        return f"<WheelSlot {self.when} {[timer.job for timer in self.timers]}>"
+
+
+class _TimerWheel:
+    """Group timers into slots that share a single loop timer.
+
+    Every occupied slot holds one loop.call_at handle, so timers due at the
+    same loop time, or within the same jitter budget, wake up the event loop
+    once and keep the loop's timer heap small.
+    """
+
+    __slots__ = ("hass", "_slots", "timers", "wakeups", "last_lag", "max_lag")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self.hass = hass
+        self._slots: dict[float, _WheelSlot] = {}
+        self.timers = 0
+        self.wakeups = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    @callback
+    def async_schedule(
+        self,
+        job: HassJob[[datetime], Coroutine[Any, Any, None] | None],
+        loop_time: float,
+        jitter: float,
+    ) -> CALLBACK_TYPE:
+        """Schedule a job to run at or after loop_time."""
+        # Align the timer to the end of its jitter budget so timers due
+        # within the same budget end up in the same slot
+        when = math.ceil(loop_time / jitter) * jitter if jitter else loop_time
+        if (slot := self._slots.get(when)) is None:
+            slot = self._slots[when] = _WheelSlot(self, when)
+        timer = _WheelTimer(job, slot)
+        slot.timers[timer] = None
+        self.timers += 1
+        return ft.partial(self._async_cancel, timer)
+
+    @callback
+    def _async_cancel(self, timer: _WheelTimer) -> None:
+        """Cancel a timer and release its slot when it was the last one."""
+        slot = timer.slot
+        if timer.cancelled or self._slots.get(slot.when) is not slot:
+            # Already cancelled or the slot already fired
+            timer.cancelled = True
+            return
+        timer.cancelled = True
+        del slot.timers[timer]
+        self.timers -= 1
+        if not slot.timers:
+            slot.handle.cancel()
+            del self._slots[slot.when]
+
+    @callback
+    def async_fire_slot(self, slot: _WheelSlot) -> None:
+        """Run the timers of an elapsed slot."""
+        if self._slots.get(slot.when) is not slot:
+            return
+        del self._slots[slot.when]
+        self.timers -= len(slot.timers)
+        self.wakeups += 1
+        hass = self.hass
+        if (lag := hass.loop.time() - slot.when) > 0:
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+        now = time_tracker_utcnow()
+        for timer in slot.timers:
+            if not timer.cancelled:
+                hass.async_run_hass_job(timer.job, now)
+
+    @callback
+    def async_stats(self) -> dict[str, float | int]:
+        """Return the number of active timers and how far they lag."""
+        return {
+            "timers": self.timers,
+            "slots": len(self._slots),
+            "wakeups": self.wakeups,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+        }
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the shared timer wheel."""
+    if (wheel := hass.data.get(SHARED_TIMER_WHEEL)) is None:
+        wheel = hass.data[SHARED_TIMER_WHEEL] = _TimerWheel(hass)
+    return wheel
+
+
+@callback
+@bind_hass
+def async_call_at_shared(
+    hass: HomeAssistant,
+    action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
+    | Callable[[datetime], Coroutine[Any, Any, None] | None],
+    loop_time: float,
+    jitter: float = 0,
+) -> CALLBACK_TYPE:
+    """Add a listener that fires at or after <loop_time> on the shared timer wheel.
+
+    Listeners due at the same time share a single loop timer. When a jitter
+    budget in seconds is given, the listener may fire up to <jitter> seconds
+    late so it can share its wakeup with listeners due shortly after it.
+
+    The listener is passed the time it fires in UTC time.
+    """
+    job = (
+        action
+        if isinstance(action, HassJob)
+        else HassJob(action, f"call_at_shared {loop_time}")
+    )
+    return _async_get_timer_wheel(hass).async_schedule(job, loop_time, jitter)
+
+
+@callback
+@bind_hass
+def async_get_shared_timer_stats(hass: HomeAssistant) -> dict[str, float | int]:
+    """Return statistics about the timers on the shared timer wheel.
+
+    The lag is the number of seconds a slot fired after it was due.
+    """
+    return _async_get_timer_wheel(hass).async_stats()
+
+
 @dataclass(slots=True)
 class _TrackTimeInterval:
     """Helper class to help listen to time interval events."""
 
     hass: HomeAssistant
     seconds: float
+    jitter: float
     job_name: str
     action: Callable[[datetime], Coroutine[Any, Any, None] | None]
     cancel_on_shutdown: bool | None
@@ -1536,10 +1697,11 @@ class _TrackTimeInterval:
             f"track time interval {self.seconds}",
             cancel_on_shutdown=self.cancel_on_shutdown,
         )
-        self._cancel_callback = async_call_at(
+        self._cancel_callback = async_call_at_shared(
             hass,
             self._track_job,
             hass.loop.time() + self.seconds,
+            self.jitter,
         )
 
     @callback
@@ -1549,10 +1711,11 @@ class _TrackTimeInterval:
             assert self._run_job is not None
             assert self._track_job is not None
         hass = self.hass
-        self._cancel_callback = async_call_at(
+        self._cancel_callback = async_call_at_shared(
             hass,
             self._track_job,
             hass.loop.time() + self.seconds,
+            self.jitter,
         )
         hass.async_run_hass_job(self._run_job, now)
 
@@ -1573,16 +1736,28 @@ def async_track_time_interval(
     *,
     name: str | None = None,
     cancel_on_shutdown: bool | None = None,
+    jitter: timedelta | None = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires repetitively at every timedelta interval.
 
+    Intervals are scheduled on the shared timer wheel. When a jitter budget
+    is given, the listener may fire up to that much later so its wakeups
+    can be aligned with other timers.
+
     The listener is passed the time it fires in UTC time.
     """
     seconds = interval.total_seconds()
     job_name = f"track time interval {seconds} {action}"
     if name:
         job_name = f"{name}: {job_name}"
-    track = _TrackTimeInterval(hass, seconds, job_name, action, cancel_on_shutdown)
+    track = _TrackTimeInterval(
+        hass,
+        seconds,
+        jitter.total_seconds() if jitter else 0,
+        job_name,
+        action,
+        cancel_on_shutdown,
+    )
     track.async_attach()
     return track.async_cancel
 
@@ -45,6 +45,9 @@ async def _async_process_single_integration_platform_component(
         return
 
     platform_name = integration_platform.platform_name
+    if integration.platform_exists(platform_name) is False:
+        # Avoid the cost of an import we know fails
+        return
 
     try:
         platform = integration.get_platform(platform_name)
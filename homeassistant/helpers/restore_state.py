@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from functools import cached_property
 import logging
 from typing import Any, Self, cast
 
@@ -16,7 +17,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .storage import Store
 
 DATA_RESTORE_STATE = "restore_state"
@@ -34,7 +35,11 @@ STATE_EXPIRATION = timedelta(days=7)
 
 
 class ExtraStoredData(ABC):
-    """Object to hold extra stored data."""
+    """Object to hold extra stored data.
+
+    Subclasses should implement __eq__, the serialized extra data of an
+    entity is only reused between dumps while the extra data compares equal.
+    """
 
     @abstractmethod
     def as_dict(self) -> dict[str, Any]:
@@ -79,6 +84,28 @@ class StoredState:
         }
         return result
 
+    @cached_property
+    def _json_prefix(self) -> bytes:
+        """Return the JSON of the stored state up to the last seen value."""
+        extra_data = self.extra_data.as_dict() if self.extra_data else None
+        return b"".join(
+            (
+                b'{"state":',
+                self.state.as_dict_json.encode("utf-8"),
+                b',"extra_data":',
+                json_bytes(extra_data),
+                b',"last_seen":',
+            )
+        )
+
+    def as_json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the stored state.
+
+        The state and extra data are only serialized once, the last
+        seen time is updated on every dump.
+        """
+        return json_fragment(self._json_prefix + json_bytes(self.last_seen) + b"}")
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Self:
         """Initialize a stored state from a dict."""
@@ -138,6 +165,9 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # Stored states of the current entities, replaced when the
+        # state or the extra data of the entity change
+        self._current_stored_states: dict[str, StoredState] = {}
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -186,15 +216,24 @@ class RestoreStateData:
         }
 
         # Start with the currently registered states
-        stored_states = [
-            StoredState(
-                current_states_by_entity_id[entity_id],
-                entity.extra_restore_state_data,
-                now,
-            )
-            for entity_id, entity in self.entities.items()
-            if entity_id in current_states_by_entity_id
-        ]
+        stored_states: list[StoredState] = []
+        current_stored_states = self._current_stored_states
+        for entity_id, entity in self.entities.items():
+            if (state := current_states_by_entity_id.get(entity_id)) is None:
+                continue
+            extra_data = entity.extra_restore_state_data
+            stored_state = current_stored_states.get(entity_id)
+            if (
+                stored_state is None
+                or stored_state.state is not state
+                or stored_state.extra_data != extra_data
+            ):
+                stored_state = current_stored_states[entity_id] = StoredState(
+                    state, extra_data, now
+                )
+            else:
+                stored_state.last_seen = now
+            stored_states.append(stored_state)
         expiration_time = now - STATE_EXPIRATION
 
         for entity_id, stored_state in self.last_states.items():
@@ -215,13 +254,11 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        serialized_states = await self.hass.async_add_executor_job(
+            _serialize_stored_states, self.async_get_stored_states()
+        )
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            await self.store.async_save(serialized_states)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
@@ -278,6 +315,24 @@ class RestoreStateData:
             )
 
         self.entities.pop(entity_id)
+        self._current_stored_states.pop(entity_id, None)
+
+
+def _serialize_stored_states(
+    stored_states: list[StoredState],
+) -> list[json_fragment]:
+    """Serialize the stored states, reusing the JSON of unchanged states."""
+    serialized_states: list[json_fragment] = []
+    for stored_state in stored_states:
+        try:
+            serialized_states.append(stored_state.as_json_fragment())
+        except (TypeError, ValueError) as err:
+            _LOGGER.error(
+                "Error serializing the state of %s: %s",
+                stored_state.state.entity_id,
+                err,
+            )
+    return serialized_states
 
 
 class RestoreEntity(Entity):
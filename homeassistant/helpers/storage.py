@@ -6,10 +6,12 @@ from collections.abc import Callable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
 from typing import Any, Generic, TypeVar
+import uuid
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
@@ -35,6 +37,19 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITER = "storage_writer"
+
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the data file once it grows
+# past this size or this ratio of the data file size
+JOURNAL_COMPACT_MIN_SIZE = 65536
+JOURNAL_COMPACT_RATIO = 0.5
+
+JOURNAL_OP_SET = "s"
+JOURNAL_OP_DELETE = "d"
+JOURNAL_OP_TRUNCATE = "t"
+
+_MISSING = object()
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -79,6 +94,199 @@ async def async_migrator(
     return config
 
 
+def _is_journal_dict(node: Any) -> bool:
+    """Return if the journal can address the keys of a node."""
+    return isinstance(node, dict) and all(isinstance(key, str) for key in node)
+
+
+def _journal_diff_leaf(
+    shadow: Any,
+    node: Any,
+    path: list[str | int],
+    dump: Callable[[Any], bytes],
+    ops: list[list[Any]],
+) -> Any:
+    """Add the journal op replacing a node if it changed.
+
+    Returns the shadow of the new node.
+    """
+    if node == shadow:
+        return shadow
+    data = dump(node)
+    # Compare what would be loaded back, e.g. tuples are loaded as lists
+    new_shadow = json_util.json_loads(data)
+    if new_shadow != shadow:
+        ops.append([JOURNAL_OP_SET, path, json_helper.json_fragment(data)])
+    return new_shadow
+
+
+def _journal_diff(
+    shadow: Any,
+    node: Any,
+    path: list[str | int],
+    dump: Callable[[Any], bytes],
+    ops: list[list[Any]],
+) -> Any:
+    """Add the journal ops turning the shadow of the previous data into node.
+
+    The shadow is the data as it would be loaded back from the journal.
+    Dicts are compared key by key, lists item by item and everything
+    else as a whole. Values comparing equal are considered unchanged.
+
+    Returns the shadow of the new node.
+    """
+    if isinstance(shadow, dict) and _is_journal_dict(node):
+        ops.extend(
+            [JOURNAL_OP_DELETE, [*path, key]] for key in shadow if key not in node
+        )
+        new_shadow: dict[str, Any] = {}
+        for key, value in node.items():
+            new_shadow[key] = _journal_diff(
+                shadow.get(key, _MISSING), value, [*path, key], dump, ops
+            )
+        return new_shadow
+
+    if isinstance(shadow, list) and isinstance(node, (list, tuple)):
+        old_length = len(shadow)
+        items = [
+            _journal_diff_leaf(
+                shadow[index] if index < old_length else _MISSING,
+                item,
+                [*path, index],
+                dump,
+                ops,
+            )
+            for index, item in enumerate(node)
+        ]
+        if len(items) < old_length:
+            ops.append([JOURNAL_OP_TRUNCATE, path, len(items)])
+        return items
+
+    return _journal_diff_leaf(shadow, node, path, dump, ops)
+
+
+def _apply_journal_op(document: dict[str, Any], op: list[Any]) -> None:
+    """Apply a single journal op to a loaded document."""
+    action, path = op[0], op[1]
+    parent: Any = document
+    for key in path[:-1]:
+        parent = parent[key]
+    key = path[-1]
+    if action == JOURNAL_OP_SET:
+        if isinstance(parent, list) and key == len(parent):
+            parent.append(op[2])
+        else:
+            parent[key] = op[2]
+    elif action == JOURNAL_OP_DELETE:
+        del parent[key]
+    elif action == JOURNAL_OP_TRUNCATE:
+        del parent[key][op[2] :]
+    else:
+        raise ValueError(f"Unknown journal op {action}")
+
+
+def _load_journaled_json(path: str) -> tuple[Any, bool]:
+    """Load a data file and replay the journal written since it was compacted.
+
+    Replay stops at the first line that is incomplete, which is what
+    an unclean shutdown in the middle of an append leaves behind. Also
+    returns if the data file was written with a journal.
+    """
+    document = json_util.load_json(path)
+    if not isinstance(document, dict) or "journal" not in document:
+        return document, False
+
+    journal_id = document.pop("journal")
+    journal_path = f"{path}{JOURNAL_SUFFIX}"
+    try:
+        journal_file = open(journal_path, "rb")  # pylint: disable=consider-using-with
+    except FileNotFoundError:
+        return document, True
+
+    with journal_file:
+        try:
+            header = json_util.json_loads_object(journal_file.readline())
+        except ValueError:
+            return document, True
+        if header.get("journal") != journal_id:
+            # Left behind by an unclean shutdown during compaction
+            return document, True
+        for line in journal_file:
+            try:
+                ops = json_util.json_loads_array(line)
+            except ValueError:
+                break
+            try:
+                for op in ops:
+                    _apply_journal_op(document, op)  # type: ignore[arg-type]
+            except (IndexError, KeyError, TypeError, ValueError) as err:
+                _LOGGER.warning("Stopped replaying corrupt journal %s: %s", path, err)
+                break
+
+    return document, True
+
+
+def _write_pending(
+    pending: list[tuple[Store, str, dict, asyncio.Future[None]]],
+) -> list[Exception | None]:
+    """Write the data of several stores and collect the errors."""
+    errors: list[Exception | None] = []
+    for store, path, data, _ in pending:
+        try:
+            store._write_data(path, data)  # pylint: disable=protected-access
+        except Exception as err:  # pylint: disable=broad-except
+            errors.append(err)
+        else:
+            errors.append(None)
+    return errors
+
+
+class _StorageWriter:
+    """Write the data of the stores saving at the same time in one executor job."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the writer."""
+        self.hass = hass
+        self._pending: list[tuple[Store, str, dict, asyncio.Future[None]]] = []
+        self._write_task: asyncio.Task[None] | None = None
+
+    async def async_write(self, store: Store, path: str, data: dict) -> None:
+        """Write the data of a store together with the other pending writes."""
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        self._pending.append((store, path, data, future))
+        if self._write_task is None:
+            self._write_task = self.hass.async_create_task(
+                self._async_write_pending(), "Storage write"
+            )
+        await future
+
+    async def _async_write_pending(self) -> None:
+        """Write pending data until there is none left."""
+        try:
+            while self._pending:
+                pending, self._pending = self._pending, []
+                try:
+                    errors = await self.hass.async_add_executor_job(
+                        _write_pending, pending
+                    )
+                except asyncio.CancelledError:
+                    for *_, future in pending:
+                        future.cancel()
+                    raise
+                for (*_, future), err in zip(pending, errors):
+                    if future.done():
+                        continue
+                    if err is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(err)
+        finally:
+            self._write_task = None
+            for *_, future in self._pending:
+                future.cancel()
+            self._pending = []
+
+
 @bind_hass
 class Store(Generic[_T]):
     """Class to help storing data."""
@@ -94,8 +302,14 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal set, saves only append what changed since the previous
+        write to a journal next to the data file, which is compacted into
+        the data file once it grows too large and on the final write.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,12 +323,24 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._journal = journal
+        # Only accessed while holding the write lock
+        self._journal_id: str | None = None
+        self._journal_shadow: Any = None
+        self._journal_size = 0
+        self._journal_max_size = 0
+        self._journal_stale = False
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -158,9 +384,8 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                async with self._write_lock:
+                    data = await self.hass.async_add_executor_job(self._load_data_file)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -327,6 +552,33 @@ class Store(Generic[_T]):
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
         await self._async_handle_write_data()
+        if self._journal:
+            await self._async_compact_journal()
+
+    async def _async_compact_journal(self) -> None:
+        """Write the journaled changes to the data file.
+
+        Older versions ignore the journal, so it is compacted before
+        shutting down to not lose the changes when downgrading.
+        """
+        async with self._write_lock:
+            if self._journal_shadow is None or not self._journal_size:
+                return
+            version, minor_version, data = self._journal_shadow
+            # Without a shadow the data file is written as a whole
+            self._journal_shadow = None
+            try:
+                await self._async_write_data(
+                    self.path,
+                    {
+                        "version": version,
+                        "minor_version": minor_version,
+                        "key": self.key,
+                        "data": data,
+                    },
+                )
+            except (json_util.SerializationError, WriteError) as err:
+                _LOGGER.error("Error compacting journal for %s: %s", self.key, err)
 
     async def _async_handle_write_data(self, *_args):
         """Handle writing the config."""
@@ -353,21 +605,114 @@ class Store(Generic[_T]):
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if self._journal_size:
+                # Compact the journal on the final write
+                self._async_ensure_final_write_listener()
+
+    def _load_data_file(self) -> Any:
+        """Load the data file and replay its journal."""
+        data, journaled = _load_journaled_json(self.path)
+        # The next write compacts the journal into the data file
+        self._journal_shadow = None
+        self._journal_stale = journaled
+        return data
+
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        if (writer := self.hass.data.get(STORAGE_WRITER)) is None:
+            writer = self.hass.data[STORAGE_WRITER] = _StorageWriter(self.hass)
+        await writer.async_write(self, self.path, data)
 
     def _write_data(self, path: str, data: dict) -> None:
         """Write the data."""
+        if self._journal and self._journal_shadow is not None:
+            try:
+                if self._write_journal(path, data):
+                    return
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.debug(
+                    "Error appending to the journal of %s", self.key, exc_info=True
+                )
+            # Compact the journal into the data file instead
+            self._journal_shadow = None
+
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        if self._journal:
+            self._journal_id = uuid.uuid4().hex
+            document = {**data, "journal": self._journal_id}
+        else:
+            document = data
         json_helper.save_json(
             path,
-            data,
+            document,
             self._private,
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self._journal or self._journal_stale:
+            # The journal belongs to the previous data file
+            with suppress(FileNotFoundError):
+                os.unlink(f"{path}{JOURNAL_SUFFIX}")
+            self._journal_stale = False
+        if not self._journal:
+            return
+
+        self._journal_size = 0
+        self._journal_max_size = max(
+            JOURNAL_COMPACT_MIN_SIZE,
+            int(os.path.getsize(path) * JOURNAL_COMPACT_RATIO),
+        )
+        self._journal_shadow = (
+            data["version"],
+            data["minor_version"],
+            json_util.json_loads(self._journal_dump(data["data"])),
+        )
+
+    def _journal_dump(self, obj: Any) -> bytes:
+        """Serialize a node of the data for the journal."""
+        if self._encoder and self._encoder is not JSONEncoder:
+            return json.dumps(obj, cls=self._encoder).encode("utf-8")
+        return json_helper.json_bytes(obj)
+
+    def _write_journal(self, path: str, data: dict) -> bool:
+        """Append what changed since the previous write to the journal.
+
+        Returns False when the journal should be compacted instead.
+        """
+        version, minor_version, shadow = self._journal_shadow
+        if data["version"] != version or data["minor_version"] != minor_version:
+            return False
+
+        ops: list[list[Any]] = []
+        shadow = _journal_diff(shadow, data["data"], ["data"], self._journal_dump, ops)
+        if not ops:
+            return True
+
+        lines = [json_helper.json_bytes(ops) + b"\n"]
+        if not self._journal_size:
+            lines.insert(
+                0, json_helper.json_bytes({"journal": self._journal_id}) + b"\n"
+            )
+        size = sum(len(line) for line in lines)
+        if self._journal_size + size > self._journal_max_size:
+            return False
+
+        _LOGGER.debug("Appending changes for %s to %s", self.key, path)
+        fd = os.open(
+            f"{path}{JOURNAL_SUFFIX}",
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o600 if self._private else 0o666,
+        )
+        with open(fd, "wb") as journal_file:
+            journal_file.writelines(lines)
+            if self._atomic_writes:
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+        self._journal_size += size
+        self._journal_shadow = (version, minor_version, shadow)
+        return True
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -378,5 +723,11 @@ class Store(Generic[_T]):
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
 
-        with suppress(FileNotFoundError):
-            await self.hass.async_add_executor_job(os.unlink, self.path)
+        async with self._write_lock:
+            self._journal_shadow = None
+            self._journal_size = 0
+
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.path)
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
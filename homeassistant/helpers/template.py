@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -50,11 +51,13 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -80,6 +83,7 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import Store
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -97,6 +101,13 @@ _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
 
+# Templates that only output the state of an entity or a key of value_json
+# are rendered without going through jinja
+_RE_STATES_FAST_PATH = re.compile(
+    r"^\{\{\s*states\(\s*(['\"])([a-z0-9_]+\.[a-z0-9_]+)\1\s*\)\s*\}\}$"
+)
+_RE_VALUE_JSON_FAST_PATH = re.compile(r"^\{\{\s*value_json\.([A-Za-z_]\w*)\s*\}\}$")
+
 _RESERVED_NAMES = {
     "contextfunction",
     "evalcontextfunction",
@@ -156,6 +167,17 @@ CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+#
+# The code compiled by the environments with access to hass is shared
+# by all of them since it does not depend on the limited, strict or
+# log_fn options. It is kept across restarts in COMPILED_CODE_CACHE_KEY
+# so the same template strings do not have to be compiled by jinja again.
+#
+COMPILED_CODE_CACHE_SIZE = 10000
+COMPILED_CODE_CACHE_KEY = "core.template_code"
+COMPILED_CODE_CACHE_VERSION = 1
+COMPILED_CODE_LRU: LRU[str, CodeType] = LRU(COMPILED_CODE_CACHE_SIZE)
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -464,6 +486,8 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_fast_path_entity_id",
+        "_fast_path_value_json_key",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -482,6 +506,13 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._fast_path_entity_id: str | None = None
+        self._fast_path_value_json_key: str | None = None
+        if not self.is_static:
+            if match := _RE_STATES_FAST_PATH.match(self.template):
+                self._fast_path_entity_id = match.group(2)
+            elif match := _RE_VALUE_JSON_FAST_PATH.match(self.template):
+                self._fast_path_value_json_key = match.group(1)
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -569,7 +600,12 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (
+                entity_id := self._fast_path_entity_id
+            ) is not None and "states" not in kwargs:
+                render_result = str(compiled.globals["states"](entity_id))
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -747,6 +783,15 @@ class Template:
         with suppress(*JSON_DECODE_EXCEPTIONS):
             variables["value_json"] = json_loads(value)
 
+        if (
+            (key := self._fast_path_value_json_key) is not None
+            and type(value_json := variables.get("value_json")) is dict  # noqa: E721
+            and key in value_json
+            # jinja looks up attributes before items
+            and not hasattr(dict, key)
+        ):
+            return str(value_json[key]).strip()
+
         try:
             return _render_with_context(self.template, compiled, **variables).strip()
         except jinja2.TemplateError as ex:
@@ -2372,6 +2417,57 @@ async def async_load_custom_templates(hass: HomeAssistant) -> None:
     _get_hass_loader(hass).sources = custom_templates
 
 
+async def async_load_compiled_code_cache(hass: HomeAssistant) -> None:
+    """Load the code compiled by the previous run and save it on shutdown."""
+    store: Store[dict[str, Any]] = Store(
+        hass, COMPILED_CODE_CACHE_VERSION, COMPILED_CODE_CACHE_KEY, private=True
+    )
+    loaded: dict[str, CodeType] = {}
+    if (data := await store.async_load()) and data["header"] == list(
+        _compiled_code_cache_header()
+    ):
+        # Code objects are only valid for the python and jinja version
+        # that compiled them, and the filters, tests and globals they
+        # call are compiled in with the signature of this HA version
+        loaded = _decode_compiled_code(data["code"])
+    for source, code in loaded.items():
+        COMPILED_CODE_LRU.setdefault(source, code)
+
+    async def _async_save_compiled_code_cache(_: Any) -> None:
+        """Save the compiled code if templates were compiled since loading."""
+        if set(COMPILED_CODE_LRU.keys()) == loaded.keys():
+            return
+        await store.async_save(
+            {
+                "header": list(_compiled_code_cache_header()),
+                "code": {
+                    source: base64.b64encode(marshal.dumps(code)).decode()
+                    for source, code in COMPILED_CODE_LRU.items()
+                },
+            }
+        )
+
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save_compiled_code_cache
+    )
+
+
+def _compiled_code_cache_header() -> tuple[int, str, str, str]:
+    """Return the header that must match for the saved code to be used."""
+    return (COMPILED_CODE_CACHE_VERSION, sys.version, jinja2.__version__, HA_VERSION)
+
+
+def _decode_compiled_code(encoded: dict[str, str]) -> dict[str, CodeType]:
+    """Decode the marshalled code objects."""
+    compiled: dict[str, CodeType] = {}
+    for source, code in encoded.items():
+        try:
+            compiled[source] = marshal.loads(base64.b64decode(code))
+        except (EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Ignoring unreadable compiled template %s: %s", source, err)
+    return compiled
+
+
 def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     result = {}
     jinja_path = hass.config.path("custom_templates")
@@ -2731,6 +2827,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
+        if self.hass is not None and isinstance(source, str):
+            if (code := COMPILED_CODE_LRU.get(source)) is None:
+                code = COMPILED_CODE_LRU[source] = super().compile(source)
+            return code
+
         if (cached := self.template_cache.get(source)) is None:
             cached = self.template_cache[source] = super().compile(source)
 
@@ -66,6 +66,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`batch_state_writes` to ``True`` will cause the states
+    written by listeners during an update to be set in one batch, sharing
+    one timestamp and context.
     """
 
     def __init__(
@@ -78,6 +82,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         update_method: Callable[[], Awaitable[_DataT]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        batch_state_writes: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -89,6 +94,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.batch_state_writes = batch_state_writes
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -98,9 +104,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.data: _DataT = None  # type: ignore[assignment]
 
         # Pick a random microsecond in range 0.05..0.50 to stagger the refreshes
-        # and avoid a thundering herd.
+        # and avoid a thundering herd. It is picked in steps so coordinators
+        # sharing a step also share their wakeup on the shared timer wheel.
         self._microsecond = (
-            randint(event.RANDOM_MICROSECOND_MIN, event.RANDOM_MICROSECOND_MAX) / 10**6
+            randint(
+                event.RANDOM_MICROSECOND_MIN // event.RANDOM_MICROSECOND_STEP,
+                event.RANDOM_MICROSECOND_MAX // event.RANDOM_MICROSECOND_STEP,
+            )
+            * event.RANDOM_MICROSECOND_STEP
+            / 10**6
         )
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
@@ -179,6 +191,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
+        if self.batch_state_writes:
+            with entity.async_batch_state_writes(self.hass):
+                for update_callback, _ in list(self._listeners.values()):
+                    update_callback()
+            return
         for update_callback, _ in list(self._listeners.values()):
             update_callback()
 
@@ -237,18 +254,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # than the debouncer cooldown, this would cause the debounce to never be called
         self._async_unsub_refresh()
 
-        # We use loop.call_at because DataUpdateCoordinator does
+        # We schedule on loop time because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
         # calling dt_util.utcnow() on every update.
         hass = self.hass
-        loop = hass.loop
 
         next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+            int(hass.loop.time()) + self._microsecond + self._update_interval_seconds
         )
-        self._unsub_refresh = loop.call_at(
-            next_refresh, hass.async_run_hass_job, self._job
-        ).cancel
+        self._unsub_refresh = event.async_call_at_shared(hass, self._job, next_refresh)
 
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
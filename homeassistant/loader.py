@@ -25,7 +25,8 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
-from .core import HomeAssistant, callback
+from .const import EVENT_HOMEASSISTANT_FINAL_WRITE, __version__
+from .core import Event, HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -48,6 +49,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_STARTUP_CACHE = "loader_startup_cache"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -63,6 +65,11 @@ MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+# The resolved manifests, dependencies and files of the integrations
+# are kept across restarts in STARTUP_CACHE_KEY
+STARTUP_CACHE_KEY = "core.loader_cache"
+STARTUP_CACHE_VERSION = 1
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -181,6 +188,92 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
 
 
+class _StartupCache:
+    """Integrations resolved by the previous run.
+
+    An entry is only used while the mtime of the manifest and of the
+    directory of the integration are unchanged. Entries are added from
+    the executor so they are replaced rather than mutated.
+    """
+
+    def __init__(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Initialize the cache."""
+        self.entries = entries
+        # The packages with a manifest that has not changed since it was saved
+        self.unchanged: set[str] = set()
+        self.changed = False
+
+    def load_manifest(
+        self, pkg_path: str, manifest_path: pathlib.Path
+    ) -> tuple[Manifest, set[str]]:
+        """Return the manifest and the top level files of an integration."""
+        directory = manifest_path.parent
+        stamp = [
+            str(directory),
+            manifest_path.stat().st_mtime_ns,
+            directory.stat().st_mtime_ns,
+        ]
+        if (entry := self.entries.get(pkg_path)) and entry["stamp"] == stamp:
+            self.unchanged.add(pkg_path)
+            return cast(Manifest, entry["manifest"]), set(entry["files"])
+        manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+        files = {path.name for path in directory.iterdir()}
+        self.entries[pkg_path] = {
+            "stamp": stamp,
+            "manifest": manifest,
+            "files": sorted(files),
+        }
+        self.changed = True
+        return manifest, files
+
+    def get_dependencies(self, integration: Integration) -> list[str] | None:
+        """Return the dependencies resolved for an unchanged integration."""
+        if integration.pkg_path not in self.unchanged:
+            return None
+        return cast(
+            list[str] | None, self.entries[integration.pkg_path].get("dependencies")
+        )
+
+    def set_dependencies(
+        self, integration: Integration, dependencies: set[str]
+    ) -> None:
+        """Set the dependencies resolved for an integration."""
+        if (entry := self.entries.get(integration.pkg_path)) is None:
+            return
+        self.entries[integration.pkg_path] = {
+            **entry,
+            "dependencies": sorted(dependencies),
+        }
+        self.changed = True
+
+
+async def async_load_startup_cache(hass: HomeAssistant) -> None:
+    """Load the integrations resolved by the previous run and save them on shutdown."""
+    # pylint: disable-next=import-outside-toplevel
+    from .helpers.storage import Store
+
+    store: Store[dict[str, Any]] = Store(
+        hass, STARTUP_CACHE_VERSION, STARTUP_CACHE_KEY, private=True
+    )
+    entries: dict[str, dict[str, Any]] = {}
+    if (data := await store.async_load()) and data["ha_version"] == __version__:
+        # Manifests are processed differently by other versions
+        entries = data["integrations"]
+    cache = hass.data[DATA_STARTUP_CACHE] = _StartupCache(entries)
+
+    async def _async_save_startup_cache(_: Event) -> None:
+        """Save the cache if integrations were resolved since loading."""
+        if not cache.changed:
+            return
+        await store.async_save(
+            {"ha_version": __version__, "integrations": dict(cache.entries)}
+        )
+
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save_startup_cache
+    )
+
+
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     """Generate a manifest from a legacy module."""
     return {
@@ -562,14 +655,22 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        cache: _StartupCache | None = hass.data.get(DATA_STARTUP_CACHE)
+        pkg_path = f"{root_module.__name__}.{domain}"
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
             if not manifest_path.is_file():
                 continue
 
+            top_level_files: set[str] | None = None
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                if cache is None:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                else:
+                    manifest, top_level_files = cache.load_manifest(
+                        pkg_path, manifest_path
+                    )
             except JSON_DECODE_EXCEPTIONS as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
@@ -578,9 +679,10 @@ class Integration:
 
             integration = cls(
                 hass,
-                f"{root_module.__name__}.{domain}",
+                pkg_path,
                 manifest_path.parent,
                 manifest,
+                top_level_files,
             )
 
             if integration.is_built_in:
@@ -633,6 +735,7 @@ class Integration:
         pkg_path: str,
         file_path: pathlib.Path,
         manifest: Manifest,
+        top_level_files: set[str] | None = None,
     ) -> None:
         """Initialize an integration."""
         self.hass = hass
@@ -640,6 +743,8 @@ class Integration:
         self.file_path = file_path
         self.manifest = manifest
         manifest["is_built_in"] = self.is_built_in
+        # The names of the files and packages of the integration if known
+        self._top_level_files = top_level_files
 
         if self.dependencies:
             self._all_dependencies_resolved: bool | None = None
@@ -782,6 +887,19 @@ class Integration:
         if self._all_dependencies_resolved is not None:
             return self._all_dependencies_resolved
 
+        cache: _StartupCache | None = self.hass.data.get(DATA_STARTUP_CACHE)
+        if cache and (cached := cache.get_dependencies(self)) is not None:
+            # The dependencies are unchanged if none of their manifests changed
+            integrations = await async_get_integrations(self.hass, cached)
+            if all(
+                isinstance(integration, Integration)
+                and integration.pkg_path in cache.unchanged
+                for integration in integrations.values()
+            ):
+                self._all_dependencies = set(cached)
+                self._all_dependencies_resolved = True
+                return True
+
         self._all_dependencies_resolved = False
         try:
             dependencies = await _async_component_dependencies(self.hass, self)
@@ -808,6 +926,8 @@ class Integration:
             dependencies.discard(self.domain)
             self._all_dependencies = dependencies
             self._all_dependencies_resolved = True
+            if cache:
+                cache.set_dependencies(self, dependencies)
 
         return self._all_dependencies_resolved
 
@@ -858,6 +978,17 @@ class Integration:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    def platform_exists(self, platform_name: str) -> bool | None:
+        """Return if a platform exists without importing it.
+
+        Returns None if the files of the integration are not known.
+        """
+        if f"{self.domain}.{platform_name}" in self.hass.data[DATA_COMPONENTS]:
+            return True
+        if (files := self._top_level_files) is None:
+            return None
+        return f"{platform_name}.py" in files or platform_name in files
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -8,6 +8,7 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+import tempfile
 from timeit import default_timer as timer
 from typing import TypeVar
 
@@ -227,6 +228,135 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_keyed_listeners(hass):
+    """Fire a million state changes at 1000 entity_id keyed listeners."""
+    count = 0
+    entity_id = "light.kitchen"
+    listeners = 1000
+    events_to_fire = 10**6
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listeners):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            listener,
+            run_immediately=True,
+            entity_id=f"{entity_id}{idx}",
+        )
+
+    events_data = [
+        {
+            "entity_id": f"{entity_id}{idx}",
+            "old_state": core.State(entity_id, "off"),
+            "new_state": core.State(entity_id, "on"),
+        }
+        for idx in range(listeners * 2)
+    ]
+    size = len(events_data)
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[idx % size])
+
+    assert count == events_to_fire // 2
+
+    return timer() - start
+
+
+@benchmark
+async def subscribe_entities_router(hass):
+    """Route 100k state changes to 30 dashboards watching 10 entities each."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import Group, User
+    from homeassistant.components.websocket_api import commands
+
+    count = 0
+    entity_id = "light.kitchen"
+    entities = 1000
+    connections = 30
+    events_to_fire = 10**5
+
+    def send_message(msg):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    group = Group(name="dashboards", policy={"entities": {"domains": {"light": True}}})
+    router = commands._async_get_entity_changes_router(hass)
+    for idx in range(connections):
+        user = User(name=f"dashboard {idx}", perm_lookup=None, groups=[group])
+        entity_ids = {f"{entity_id}{idx * 10 + offset}" for offset in range(10)}
+        router.async_subscribe(
+            commands._EntitySubscription(send_message, user, idx, entity_ids)
+        )
+
+    events_data = [
+        {
+            "entity_id": f"{entity_id}{idx}",
+            "old_state": core.State(f"{entity_id}{idx}", "off"),
+            "new_state": core.State(f"{entity_id}{idx}", "on"),
+        }
+        for idx in range(entities)
+    ]
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[idx % entities])
+
+    assert count == events_to_fire * connections * 10 // entities
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match 10k distinct topics against 5k wildcard subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from lru import LRU  # pylint: disable=no-name-in-module
+
+    from homeassistant.components.mqtt.client import MATCHING_SUBSCRIPTIONS_CACHE_SIZE
+    from homeassistant.components.mqtt.util import TopicTrie
+
+    subscriptions = 5000
+    topics_to_match = 10**4
+    rounds = 10
+
+    trie = TopicTrie()
+    for idx in range(subscriptions):
+        if idx % 2:
+            trie.add(f"zigbee2mqtt/device_{idx}/+", idx)
+        else:
+            trie.add(f"tasmota/tele/plug_{idx}/#", idx)
+    cache = LRU(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
+    topics = [
+        f"zigbee2mqtt/device_{idx % subscriptions}/{idx}"
+        if idx % 2
+        else f"tasmota/tele/plug_{idx % subscriptions}/{idx}/SENSOR"
+        for idx in range(topics_to_match)
+    ]
+    count = 0
+
+    start = timer()
+
+    for _ in range(rounds):
+        for topic in topics:
+            if (matches := cache.get(topic)) is None:
+                matches = cache[topic] = trie.match(topic)
+            count += len(matches)
+
+    assert count == topics_to_match * rounds
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -314,6 +444,235 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def recorder_bulk_insert_states(hass):
+    """Replay a million state changes into SQLite with the bulk insert path."""
+    # pylint: disable-next=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import Base, States, StatesMeta
+    from homeassistant.components.recorder.table_managers.states import StatesManager
+
+    rows_to_insert = 10**6
+    rows_per_commit = 1000
+    entity_ids = [f"sensor.power_{idx}" for idx in range(100)]
+
+    context = core.Context()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{tmp_dir}/bench.db", future=True)
+        Base.metadata.create_all(engine)
+        states_manager = StatesManager()
+        with Session(engine, future=True) as session:
+            states_meta = {
+                entity_id: StatesMeta(entity_id=entity_id) for entity_id in entity_ids
+            }
+            session.add_all(states_meta.values())
+            session.commit()
+            metadata_ids = {
+                entity_id: meta.metadata_id for entity_id, meta in states_meta.items()
+            }
+
+            start = timer()
+            for idx in range(rows_to_insert):
+                entity_id = entity_ids[idx % len(entity_ids)]
+                event = core.Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "new_state": core.State(entity_id, str(idx), context=context),
+                    },
+                    context=context,
+                )
+                dbstate = States.from_event(event)
+                if old_state := states_manager.pop_pending(entity_id):
+                    dbstate.old_state = old_state
+                elif old_state_id := states_manager.pop_committed(entity_id):
+                    dbstate.old_state_id = old_state_id
+                dbstate.entity_id = None
+                dbstate.metadata_id = metadata_ids[entity_id]
+                states_manager.add_pending(entity_id, dbstate)
+                states_manager.add_pending_insert(dbstate)
+                if idx % rows_per_commit == rows_per_commit - 1:
+                    states_manager.bulk_insert_pending(session)
+                    session.commit()
+                    states_manager.post_commit_pending()
+            runtime = timer() - start
+        engine.dispose()
+
+    print(f"Inserted {rows_to_insert / runtime:.0f} rows/s")
+    return runtime
+
+
+@benchmark
+async def storage_journal_save(hass):
+    """Save single entity edits of a 10k entity registry with and without journal."""
+    # pylint: disable-next=import-outside-toplevel
+    import os
+
+    from homeassistant.helpers.storage import Store
+
+    entities = 10**4
+    saves = 100
+    data = {
+        "entities": [
+            {
+                "entity_id": f"sensor.benchmark_{idx}",
+                "id": f"{idx:032x}",
+                "name": None,
+                "platform": "benchmark",
+                "unique_id": f"unique_{idx}",
+                "options": {"sensor": {"suggested_display_precision": 2}},
+            }
+            for idx in range(entities)
+        ],
+        "deleted_entities": [],
+    }
+
+    def _size(path):
+        with suppress(FileNotFoundError):
+            return os.path.getsize(path)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        results = {}
+        for journal in (False, True):
+            store = Store(
+                hass, 1, f"benchmark_{journal}", atomic_writes=True, journal=journal
+            )
+            await store.async_save(data)
+            written = 0
+            start = timer()
+            for idx in range(saves):
+                data["entities"][idx * 97 % entities][
+                    "name"
+                ] = f"renamed {idx} {journal}"
+                journal_size = _size(store.journal_path)
+                await store.async_save(data)
+                new_journal_size = _size(store.journal_path)
+                if new_journal_size > journal_size:
+                    written += new_journal_size - journal_size
+                else:
+                    written += _size(store.path) + new_journal_size
+            results[journal] = timer() - start
+            print(
+                f"journal={journal}: {results[journal] / saves * 1000:.2f}ms per save, "
+                f"{written / saves:.0f} bytes written per save"
+            )
+
+    return results[True]
+
+
+@benchmark
+async def logbook_pagination(hass):
+    """Read a day of a million row logbook at once and page by page."""
+    # pylint: disable-next=import-outside-toplevel
+    from datetime import timedelta
+
+    from sqlalchemy import insert
+
+    from homeassistant import config_entries, loader
+    from homeassistant.components.logbook.const import DOMAIN as LOGBOOK_DOMAIN
+    from homeassistant.components.logbook.models import LogbookConfig
+    from homeassistant.components.logbook.processor import EventProcessor
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.db_schema import States, StatesMeta
+    from homeassistant.components.recorder.util import session_scope
+    from homeassistant.helpers import entity, entity_registry as er, recorder
+    from homeassistant.setup import async_setup_component
+    from homeassistant.util import dt as dt_util
+
+    rows_to_insert = 10**6
+    rows_per_insert = 10**4
+    page_rows = 10**4
+    entity_ids = [f"light.benchmark_{idx}" for idx in range(100)]
+    end = dt_util.utcnow()
+    start = end - timedelta(days=1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        entity.async_setup(hass)
+        loader.async_setup(hass)
+        await er.async_load(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        recorder.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass, "recorder", {"recorder": {"db_url": f"sqlite:///{tmp_dir}/bench.db"}}
+        )
+        await hass.async_start()
+        instance = get_instance(hass)
+        await instance.async_db_ready
+        hass.data[LOGBOOK_DOMAIN] = LogbookConfig({})
+
+        def _insert_states():
+            start_ts = start.timestamp()
+            step = (end - start).total_seconds() / (rows_to_insert + 1)
+            with session_scope(session=instance.get_session()) as session:
+                states_meta = [
+                    StatesMeta(entity_id=entity_id) for entity_id in entity_ids
+                ]
+                session.add_all(states_meta)
+                session.flush()
+                for chunk_start in range(0, rows_to_insert, rows_per_insert):
+                    rows = []
+                    for idx in range(chunk_start, chunk_start + rows_per_insert):
+                        entity_idx = idx % len(entity_ids)
+                        rows.append(
+                            {
+                                "state_id": idx + 1,
+                                "state": "on" if idx // len(entity_ids) % 2 else "off",
+                                "metadata_id": states_meta[entity_idx].metadata_id,
+                                "last_updated_ts": start_ts + step * (idx + 1),
+                                "old_state_id": (
+                                    idx + 1 - len(entity_ids)
+                                    if idx >= len(entity_ids)
+                                    else None
+                                ),
+                                "origin_idx": 0,
+                                # Pairs of rows share a context
+                                "context_id_bin": (idx // 2).to_bytes(16, "big"),
+                            }
+                        )
+                    session.execute(insert(States), rows)
+                    # Do not hold the database lock for the recorder too long
+                    session.commit()
+
+        await instance.async_add_executor_job(_insert_states)
+
+        def _get_events():
+            return len(EventProcessor(hass, (), timestamp=True).get_events(start, end))
+
+        def _get_pages():
+            event_processor = EventProcessor(hass, (), timestamp=True)
+            events = 0
+            pages = 0
+            cursor = None
+            while True:
+                page, cursor = event_processor.get_events_page(
+                    start, end, page_rows, cursor
+                )
+                events += len(page)
+                pages += 1
+                if cursor is None:
+                    return events, pages
+
+        start_time = timer()
+        events = await instance.async_add_executor_job(_get_events)
+        print(f"get_events: {events} events in {timer() - start_time:.2f}s")
+
+        start_time = timer()
+        events, pages = await instance.async_add_executor_job(_get_pages)
+        runtime = timer() - start_time
+        print(f"get_events_page: {events} events in {pages} pages in {runtime:.2f}s")
+
+        await hass.async_stop()
+
+    return runtime
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
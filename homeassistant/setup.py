@@ -2,13 +2,17 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable, Generator, Iterable
 import contextlib
+from dataclasses import dataclass
 from datetime import timedelta
+from enum import StrEnum
 import logging.handlers
+import time
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Any
+from typing import Any, TypeVar
 
 from . import config as conf_util, core, loader, requirements
 from .const import (
@@ -22,6 +26,9 @@ from .exceptions import DependencyError, HomeAssistantError
 from .helpers.issue_registry import IssueSeverity, async_create_issue
 from .helpers.typing import ConfigType
 from .util import dt as dt_util, ensure_unique_string
+from .util.async_ import TimedCoroutine
+
+_R = TypeVar("_R")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -53,6 +60,10 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_TRACE is a SetupTrace, recording the spans of the setup phases
+# of the integrations and the bootstrap stages.
+DATA_SETUP_TRACE = "setup_trace"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
@@ -65,6 +76,160 @@ NOTIFY_FOR_TRANSLATION_KEYS = [
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
+# Keep the spans of a large installation with many platforms
+MAX_SETUP_SPANS = 20000
+
+
+class SetupPhase(StrEnum):
+    """Phases of the setup recorded in the setup trace."""
+
+    WAIT_DEPENDENCIES = "wait_dependencies"
+    REQUIREMENTS = "requirements"
+    IMPORT = "import"
+    CONFIG = "config"
+    SETUP = "setup"
+    CONFIG_ENTRY_SETUP = "config_entry_setup"
+    PLATFORM_SETUP = "platform_setup"
+    STAGE = "stage"
+
+
+# Config entries and platforms of a domain are set up concurrently and
+# get a lane of their own in the trace
+_DETAIL_LANE_PHASES = {SetupPhase.CONFIG_ENTRY_SETUP, SetupPhase.PLATFORM_SETUP}
+
+
+@dataclass(slots=True)
+class SetupSpan:
+    """A setup phase of an integration.
+
+    The blocking time is the time the phase ran in the event loop,
+    it is None when it is not known.
+    """
+
+    domain: str
+    phase: SetupPhase
+    detail: str | None
+    start: float
+    end: float | None = None
+    blocking: float | None = None
+
+    @property
+    def lane(self) -> str:
+        """Return the lane of the span in the trace."""
+        if self.detail is not None and self.phase in _DETAIL_LANE_PHASES:
+            return f"{self.domain} {self.detail}"
+        return self.domain
+
+    def timed(self, awaitable: Awaitable[_R]) -> Awaitable[_R]:
+        """Record the time a coroutine of the span blocks the event loop."""
+        if not asyncio.iscoroutine(awaitable):
+            return awaitable
+        self.blocking = 0.0
+        return TimedCoroutine(awaitable, self._add_blocking)
+
+    def _add_blocking(self, duration: float) -> None:
+        """Add the duration of a step of the coroutine."""
+        assert self.blocking is not None
+        self.blocking += duration
+
+
+class SetupTrace:
+    """Timeline of the setup of the integrations."""
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self.started = dt_util.utcnow()
+        self.origin = time.monotonic()
+        self.spans: deque[SetupSpan] = deque(maxlen=MAX_SETUP_SPANS)
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the trace in the Chrome trace event format.
+
+        Spans still running end now and are flagged as in progress.
+        """
+        now = time.monotonic()
+        lanes: dict[str, int] = {}
+        events: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "args": {"name": "Home Assistant setup"},
+            }
+        ]
+        for span in self.spans:
+            lane = span.lane
+            if (tid := lanes.get(lane)) is None:
+                tid = lanes[lane] = len(lanes) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": lane},
+                    }
+                )
+            end = now if span.end is None else span.end
+            args: dict[str, Any] = {"domain": span.domain}
+            if span.detail is not None:
+                args["detail"] = span.detail
+            if span.blocking is not None:
+                args["blocking_ms"] = round(span.blocking * 1000, 3)
+            if span.end is None:
+                args["in_progress"] = True
+            events.append(
+                {
+                    "name": span.detail
+                    if span.phase is SetupPhase.STAGE and span.detail
+                    else str(span.phase),
+                    "cat": str(span.phase),
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": round((span.start - self.origin) * 1_000_000),
+                    "dur": round((end - span.start) * 1_000_000),
+                    "args": args,
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"started": self.started.isoformat()},
+        }
+
+
+@callback
+def async_get_setup_trace(hass: HomeAssistant) -> SetupTrace:
+    """Return the setup trace."""
+    if (trace := hass.data.get(DATA_SETUP_TRACE)) is None:
+        trace = hass.data[DATA_SETUP_TRACE] = SetupTrace()
+    return trace
+
+
+@contextlib.contextmanager
+def async_trace_setup(
+    hass: HomeAssistant,
+    domain: str,
+    phase: SetupPhase,
+    detail: str | None = None,
+    *,
+    sync: bool = False,
+) -> Generator[SetupSpan, None, None]:
+    """Record a setup phase in the setup trace.
+
+    Pass sync when the phase runs in the event loop without yielding,
+    its blocking time is then the wall time.
+    """
+    span = SetupSpan(domain, phase, detail, time.monotonic())
+    async_get_setup_trace(hass).spans.append(span)
+    try:
+        yield span
+    finally:
+        span.end = time.monotonic()
+        if sync:
+            span.blocking = span.end - span.start
+
 
 @callback
 def async_notify_setup_error(
@@ -182,10 +347,11 @@ async def _async_process_dependencies(
             list(after_dependencies_tasks),
         )
 
-    async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(
-            *dependencies_tasks.values(), *after_dependencies_tasks.values()
-        )
+    with async_trace_setup(hass, integration.domain, SetupPhase.WAIT_DEPENDENCIES):
+        async with hass.timeout.async_freeze(integration.domain):
+            results = await asyncio.gather(
+                *dependencies_tasks.values(), *after_dependencies_tasks.values()
+            )
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -248,14 +414,16 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_trace_setup(hass, domain, SetupPhase.IMPORT, sync=True):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
 
-    integration_config_info = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with async_trace_setup(hass, domain, SetupPhase.CONFIG) as span:
+        integration_config_info = await span.timed(
+            conf_util.async_process_component_config(hass, config, integration)
+        )
     conf_util.async_handle_component_errors(hass, integration_config_info, integration)
     processed_config = conf_util.async_drop_config_annotations(
         integration_config_info, integration
@@ -315,41 +483,42 @@ async def _async_setup_component(
 
         task: Awaitable[bool] | None = None
         result: Any | bool = True
-        try:
-            if hasattr(component, "async_setup"):
-                task = component.async_setup(hass, processed_config)
-            elif hasattr(component, "setup"):
-                # This should not be replaced with hass.async_add_executor_job because
-                # we don't want to track this task in case it blocks startup.
-                task = hass.loop.run_in_executor(
-                    None, component.setup, hass, processed_config
+        with async_trace_setup(hass, domain, SetupPhase.SETUP) as span:
+            try:
+                if hasattr(component, "async_setup"):
+                    task = span.timed(component.async_setup(hass, processed_config))
+                elif hasattr(component, "setup"):
+                    # This should not be replaced with hass.async_add_executor_job because
+                    # we don't want to track this task in case it blocks startup.
+                    task = hass.loop.run_in_executor(
+                        None, component.setup, hass, processed_config
+                    )
+                elif not hasattr(component, "async_setup_entry"):
+                    log_error("No setup or config entry setup function defined.")
+                    return False
+
+                if task:
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
+            except asyncio.TimeoutError:
+                _LOGGER.error(
+                    (
+                        "Setup of '%s' is taking longer than %s seconds."
+                        " Startup will proceed without waiting any longer"
+                    ),
+                    domain,
+                    SLOW_SETUP_MAX_WAIT,
                 )
-            elif not hasattr(component, "async_setup_entry"):
-                log_error("No setup or config entry setup function defined.")
                 return False
-
-            if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
-        except asyncio.TimeoutError:
-            _LOGGER.error(
-                (
-                    "Setup of '%s' is taking longer than %s seconds."
-                    " Startup will proceed without waiting any longer"
-                ),
-                domain,
-                SLOW_SETUP_MAX_WAIT,
-            )
-            return False
-        # pylint: disable-next=broad-except
-        except (asyncio.CancelledError, SystemExit, Exception):
-            _LOGGER.exception("Error during setup of component %s", domain)
-            async_notify_setup_error(hass, domain, integration.documentation)
-            return False
-        finally:
-            end = timer()
-            if warn_task:
-                warn_task.cancel()
+            # pylint: disable-next=broad-except
+            except (asyncio.CancelledError, SystemExit, Exception):
+                _LOGGER.exception("Error during setup of component %s", domain)
+                async_notify_setup_error(hass, domain, integration.documentation)
+                return False
+            finally:
+                end = timer()
+                if warn_task:
+                    warn_task.cancel()
         _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
 
         if result is False:
@@ -463,10 +632,11 @@ async def async_process_deps_reqs(
     if failed_deps := await _async_process_dependencies(hass, config, integration):
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with async_trace_setup(hass, integration.domain, SetupPhase.REQUIREMENTS):
+        async with hass.timeout.async_freeze(integration.domain):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
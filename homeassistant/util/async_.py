@@ -3,12 +3,13 @@ from __future__ import annotations
 
 from asyncio import Future, Semaphore, gather, get_running_loop
 from asyncio.events import AbstractEventLoop
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Coroutine, Generator
 import concurrent.futures
 from contextlib import suppress
 import functools
 import logging
 import threading
+from time import perf_counter
 from traceback import extract_stack
 from typing import Any, ParamSpec, TypeVar, TypeVarTuple
 
@@ -24,6 +25,51 @@ _P = ParamSpec("_P")
 _Ts = TypeVarTuple("_Ts")
 
 
+class TimedCoroutine(Coroutine[Any, Any, _R]):
+    """Coroutine recording the time each of its steps blocks the event loop."""
+
+    __slots__ = ("_coro", "_record")
+
+    def __init__(
+        self, coro: Coroutine[Any, Any, _R], record: Callable[[float], None]
+    ) -> None:
+        """Initialize the coroutine."""
+        self._coro = coro
+        self._record = record
+
+    def send(self, value: Any) -> Any:
+        """Run the coroutine until its next suspension."""
+        start = perf_counter()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._record(perf_counter() - start)
+
+    def throw(self, *args: Any) -> Any:
+        """Throw an exception into the coroutine."""
+        start = perf_counter()
+        try:
+            return self._coro.throw(*args)
+        finally:
+            self._record(perf_counter() - start)
+
+    def close(self) -> None:
+        """Close the coroutine."""
+        self._coro.close()
+
+    def __await__(self) -> Generator[Any, None, _R]:
+        """Return the iterator used by await."""
+        return self  # type: ignore[return-value]
+
+    def __iter__(self) -> TimedCoroutine[_R]:
+        """Return the iterator."""
+        return self
+
+    def __next__(self) -> Any:
+        """Run the coroutine until its next suspension."""
+        return self.send(None)
+
+
 def cancelling(task: Future[Any]) -> bool:
     """Return True if task is cancelling."""
     return bool((cancelling_ := getattr(task, "cancelling", None)) and cancelling_())
@@ -1,4 +1,5 @@
 """Test img_util module."""
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -6,10 +7,13 @@ from turbojpeg import TurboJPEG
 
 from homeassistant.components.camera import Image
 from homeassistant.components.camera.img_util import (
+    SCALED_IMAGE_CACHE_TTL,
+    JpegScaler,
     TurboJPEGSingleton,
     find_supported_scaling_factor,
     scale_jpeg_camera_image,
 )
+from homeassistant.core import HomeAssistant
 
 from .common import EMPTY_8_6_JPEG, mock_turbo_jpeg
 
@@ -116,3 +120,101 @@ def test_find_supported_scaling_factor(
         )
         == scaling_factor
     )
+
+
+async def test_jpeg_scaler_caches_scaled_images(hass: HomeAssistant) -> None:
+    """Test scaled images are cached by frame and size until they expire."""
+    scaler = JpegScaler(hass)
+    camera_image = Image("image/jpeg", EMPTY_16_12_JPEG)
+    now = 1000.0
+
+    with patch(
+        "homeassistant.components.camera.img_util.scale_jpeg_camera_image",
+        return_value=EMPTY_8_6_JPEG,
+    ) as mock_scale, patch(
+        "homeassistant.components.camera.img_util.time.monotonic",
+        side_effect=lambda: now,
+    ):
+        assert (
+            await scaler.async_scale("camera.demo", camera_image, 8, 6)
+            == EMPTY_8_6_JPEG
+        )
+        assert (
+            await scaler.async_scale(
+                "camera.demo", Image("image/jpeg", EMPTY_16_12_JPEG), 8, 6
+            )
+            == EMPTY_8_6_JPEG
+        )
+        assert mock_scale.call_count == 1
+
+        # Another size, frame or camera is scaled again
+        await scaler.async_scale("camera.demo", camera_image, 4, 3)
+        await scaler.async_scale("camera.demo", Image("image/jpeg", b"new"), 8, 6)
+        await scaler.async_scale("camera.other", camera_image, 8, 6)
+        assert mock_scale.call_count == 4
+
+        now += SCALED_IMAGE_CACHE_TTL
+        await scaler.async_scale("camera.demo", camera_image, 8, 6)
+        assert mock_scale.call_count == 5
+
+
+async def test_jpeg_scaler_collapses_concurrent_requests(
+    hass: HomeAssistant,
+) -> None:
+    """Test concurrent requests for the same frame share one scale job."""
+    scaler = JpegScaler(hass)
+    camera_image = Image("image/jpeg", EMPTY_16_12_JPEG)
+
+    with patch(
+        "homeassistant.components.camera.img_util.scale_jpeg_camera_image",
+        return_value=EMPTY_8_6_JPEG,
+    ) as mock_scale:
+        results = await asyncio.gather(
+            *(scaler.async_scale("camera.demo", camera_image, 8, 6) for _ in range(5))
+        )
+
+    assert results == [EMPTY_8_6_JPEG] * 5
+    assert mock_scale.call_count == 1
+
+
+async def test_jpeg_scaler_does_not_cache_unscaled_images(
+    hass: HomeAssistant,
+) -> None:
+    """Test images which cannot be scaled are not cached."""
+    scaler = JpegScaler(hass)
+    camera_image = Image("image/jpeg", EMPTY_16_12_JPEG)
+
+    with patch(
+        "homeassistant.components.camera.img_util.scale_jpeg_camera_image",
+        side_effect=lambda cam_image, width, height: cam_image.content,
+    ) as mock_scale:
+        for _ in range(2):
+            assert (
+                await scaler.async_scale("camera.demo", camera_image, 32, 24)
+                == EMPTY_16_12_JPEG
+            )
+
+    assert mock_scale.call_count == 2
+
+
+async def test_jpeg_scaler_evicts_oldest_images(hass: HomeAssistant) -> None:
+    """Test the oldest images are evicted when the cache is full."""
+    scaler = JpegScaler(hass)
+    camera_image = Image("image/jpeg", EMPTY_16_12_JPEG)
+
+    with patch(
+        "homeassistant.components.camera.img_util.scale_jpeg_camera_image",
+        return_value=EMPTY_8_6_JPEG,
+    ) as mock_scale, patch(
+        "homeassistant.components.camera.img_util.MAX_SCALED_IMAGES", 2
+    ):
+        for width in (8, 4, 2):
+            await scaler.async_scale("camera.demo", camera_image, width, 6)
+        assert mock_scale.call_count == 3
+
+        await scaler.async_scale("camera.demo", camera_image, 2, 6)
+        await scaler.async_scale("camera.demo", camera_image, 4, 6)
+        assert mock_scale.call_count == 3
+
+        await scaler.async_scale("camera.demo", camera_image, 8, 6)
+        assert mock_scale.call_count == 4
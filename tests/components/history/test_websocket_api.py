@@ -4,6 +4,7 @@ from datetime import timedelta
 from unittest.mock import patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
@@ -171,6 +172,143 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_columnar(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period with the columnar format."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "1.5", attributes={"any": "attr"})
+    hass.states.async_set("sensor.text", "on")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "1.5", attributes={"any": "changed"})
+    hass.states.async_set("sensor.text", "off")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "unavailable")
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "3")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.text", "sensor.power"],
+            "significant_changes_only": False,
+            "columnar": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert list(result) == ["sensor.text", "sensor.power"]
+    assert result["sensor.power"]["s"] == [1.5, None, 3.0]
+    assert len(result["sensor.power"]["lu"]) == 3
+    assert all(isinstance(ts, float) for ts in result["sensor.power"]["lu"])
+    assert result["sensor.text"]["s"] == ["on", "off"]
+    assert len(result["sensor.text"]["lu"]) == 2
+    assert result["sensor.text"]["lu"][0] < result["sensor.text"]["lu"][1]
+
+
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period and the stream downsample with max_points."""
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    start = dt_util.utcnow()
+    end = start + timedelta(seconds=40)
+    freezer.move_to(start)
+    for second in range(40):
+        freezer.tick(timedelta(seconds=1))
+        hass.states.async_set("sensor.power", str(second))
+    await async_wait_recording_done(hass)
+    # The stream only sends the historical states once the period ended
+    freezer.move_to(end + timedelta(seconds=1))
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    # The first state, then the minimum and the maximum of two buckets,
+    # the last state is recorded at the end time and is not included
+    assert [state["s"] for state in response["result"]["sensor.power"]] == [
+        "0",
+        "1",
+        "18",
+        "19",
+        "38",
+    ]
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/stream",
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 4,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert [state["s"] for state in response["event"]["states"]["sensor.power"]] == [
+        "0",
+        "1",
+        "18",
+        "19",
+        "38",
+    ]
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+    # Full states can not be downsampled
+    for command in ("history/history_during_period", "history/stream"):
+        await client.send_json_auto_id(
+            {
+                "type": command,
+                "start_time": start.isoformat(),
+                "entity_ids": ["sensor.power"],
+                "no_attributes": True,
+                "max_points": 4,
+            }
+        )
+        response = await client.receive_json()
+        assert not response["success"]
+        assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_during_period_impossible_conditions(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
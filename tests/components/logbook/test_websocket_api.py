@@ -571,6 +571,101 @@ async def test_get_events_with_device_ids(
     assert isinstance(results[4]["when"], float)
 
 
+async def test_get_events_paginated(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events with a limit returns pages matching a single request."""
+    now = dt_util.utcnow() - timedelta(minutes=1)
+    start_time = (now - timedelta(seconds=1)).isoformat()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    with freeze_time(now):
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+        await hass.async_block_till_done()
+    context = core.Context(
+        id="01GTDGKBCH00GW0X276W5TEDDD",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    with freeze_time(now + timedelta(seconds=1)):
+        hass.bus.async_fire(
+            EVENT_AUTOMATION_TRIGGERED,
+            {
+                ATTR_NAME: "Mock automation",
+                ATTR_ENTITY_ID: "automation.alarm",
+                ATTR_SOURCE: "state of binary_sensor.dog_food_ready",
+            },
+            context=context,
+        )
+        await hass.async_block_till_done()
+    for offset in range(2, 8):
+        with freeze_time(now + timedelta(seconds=offset)):
+            # Two changes share each timestamp to test the page boundaries
+            hass.states.async_set(
+                "light.kitchen", STATE_ON if offset % 2 else STATE_OFF, context=context
+            )
+            hass.states.async_set(
+                "light.hallway", STATE_OFF if offset % 2 else STATE_ON, context=context
+            )
+            await hass.async_block_till_done()
+
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/get_events",
+            "start_time": start_time,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected) == 12
+    assert expected[-1]["context_event_type"] == EVENT_AUTOMATION_TRIGGERED
+
+    for limit in (1, 2, 3, 5):
+        events = []
+        after = None
+        msg_id = limit * 100
+        while True:
+            msg_id += 1
+            request = {
+                "id": msg_id,
+                "type": "logbook/get_events",
+                "start_time": start_time,
+                "limit": limit,
+            }
+            if after is not None:
+                request["after"] = after
+            await client.send_json(request)
+            response = await client.receive_json()
+            assert response["success"]
+            events.extend(response["result"]["events"])
+            if (after := response["result"]["next_after"]) is None:
+                break
+        assert events == expected
+
+    await client.send_json(
+        {
+            "id": 1000,
+            "type": "logbook/get_events",
+            "start_time": start_time,
+            "entity_ids": ["sensor.test"],
+            "limit": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"events": [], "next_after": None}
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_excluded_entities(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -1740,6 +1835,72 @@ async def test_subscribe_unsubscribe_logbook_stream_entities_past_only(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
+@patch("homeassistant.components.logbook.websocket_api.MAX_PAGE_ROWS", 2)
+async def test_subscribe_unsubscribe_logbook_stream_paginated(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the logbook stream delivers the past in pages of at most MAX_PAGE_ROWS rows."""
+    now = dt_util.utcnow() - timedelta(minutes=1)
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook", "automation", "script")
+        ]
+    )
+
+    await hass.async_block_till_done()
+    expected_times = []
+    for offset in range(6):
+        with freeze_time(now + timedelta(seconds=offset)):
+            hass.states.async_set(
+                "binary_sensor.is_light", STATE_ON if offset % 2 else STATE_OFF
+            )
+            await hass.async_block_till_done()
+            if offset:
+                expected_times.append(
+                    hass.states.get("binary_sensor.is_light").last_updated.timestamp()
+                )
+
+    await async_wait_recording_done(hass)
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": now.isoformat(),
+            "end_time": (dt_util.utcnow() - timedelta(microseconds=1)).isoformat(),
+            "entity_ids": ["binary_sensor.is_light"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    events = []
+    while True:
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event", msg
+        assert len(msg["event"]["events"]) <= 2
+        events.extend(msg["event"]["events"])
+        if not msg["event"].get("partial"):
+            break
+
+    assert [event["when"] for event in events] == expected_times
+    assert [event["state"] for event in events] == ["on", "off", "on", "off", "on"]
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 8
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_big_query(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
@@ -1381,6 +1381,7 @@ ABBREVIATIONS_WHITE_LIST = [
     "CONF_DISCOVERY_PREFIX",
     "CONF_EMBEDDED",
     "CONF_KEEPALIVE",
+    "CONF_RECEIVE_BATCH_LATENCY",
     "CONF_TLS_INSECURE",
     "CONF_TRANSPORT",
     "CONF_WILL_MESSAGE",
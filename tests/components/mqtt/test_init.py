@@ -9,6 +9,7 @@ from typing import Any, TypedDict
 from unittest.mock import ANY, MagicMock, call, mock_open, patch
 
 from freezegun.api import FrozenDateTimeFactory
+from paho.mqtt.client import MQTTMessage
 import pytest
 import voluptuous as vol
 
@@ -932,6 +933,92 @@ async def test_all_subscriptions_run_when_decode_fails(
     assert len(calls) == 1
 
 
+def _mqtt_message(topic: str, payload: bytes) -> MQTTMessage:
+    """Build a message like the paho thread receives it."""
+    msg = MQTTMessage(topic=topic.encode("utf-8"))
+    msg.payload = payload
+    return msg
+
+
+@patch("homeassistant.components.mqtt.client.MAX_RECEIVE_BATCH_SIZE", 2)
+async def test_receive_messages_in_batches(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test messages from the paho thread are handled in batches."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    client = hass.data["mqtt"].client
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as call_soon_threadsafe:
+        for payload in (b"1", b"2", b"3", b"4", b"5"):
+            client._mqtt_on_message(None, None, _mqtt_message("test-topic", payload))
+        await asyncio.sleep(0)
+
+    assert call_soon_threadsafe.call_count == 1
+    # Each batch yields to the event loop before the next one is handled
+    assert [call.payload for call in calls] == ["1", "2"]
+    await asyncio.sleep(0)
+    assert [call.payload for call in calls] == ["1", "2", "3", "4"]
+    await asyncio.sleep(0)
+    assert [call.payload for call in calls] == ["1", "2", "3", "4", "5"]
+
+    client._mqtt_on_message(None, None, _mqtt_message("test-topic", b"6"))
+    await hass.async_block_till_done()
+    assert calls[-1].payload == "6"
+
+
+@pytest.mark.parametrize(
+    "mqtt_config_entry_data",
+    [{mqtt.CONF_BROKER: "mock-broker", mqtt.CONF_RECEIVE_BATCH_LATENCY: 0.2}],
+)
+async def test_receive_messages_batch_latency(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test received messages are collected for the configured latency."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    client = hass.data["mqtt"].client
+
+    client._mqtt_on_message(None, None, _mqtt_message("test-topic", b"1"))
+    client._mqtt_on_message(None, None, _mqtt_message("test-topic", b"2"))
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert [call.payload for call in calls] == ["1", "2"]
+
+
+async def test_subscriptions_share_received_message(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test subscriptions with the same filter and encoding share the message."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls, encoding=None)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 4
+    assert calls[0] is calls[1]
+    assert calls[2].payload == b"test-payload"
+    assert calls[3].subscribed_topic == "test-topic/#"
+
+
 async def test_subscribe_topic(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
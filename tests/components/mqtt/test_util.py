@@ -292,3 +292,64 @@ async def test_waiting_for_client_with_disabled_entry(
 
     # returns False because entry is disabled
     assert not await mqtt.async_wait_for_mqtt_client(hass)
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "matching", "not_matching"),
+    [
+        ("a/b/c", ["a/b/c"], ["a/b", "a/b/c/d", "a/b/d"]),
+        ("a/+/c", ["a/b/c", "a//c"], ["a/b", "a/b/c/d", "$a/b/c"]),
+        ("a/#", ["a", "a/b", "a/b/c"], ["b", "b/a"]),
+        ("+/+", ["a/b", "/"], ["a", "a/b/c", "$SYS/b"]),
+        ("#", ["a", "a/b/c", "/"], ["$SYS", "$SYS/broker"]),
+        ("+", ["a", ""], ["a/b", "$SYS"]),
+        ("$SYS/#", ["$SYS", "$SYS/broker/load"], ["SYS/broker"]),
+    ],
+)
+def test_topic_trie_matches_like_paho(
+    topic_filter: str, matching: list[str], not_matching: list[str]
+) -> None:
+    """Test the topic trie matches topics like the paho matcher."""
+    # pylint: disable-next=import-outside-toplevel
+    from paho.mqtt.matcher import MQTTMatcher
+
+    trie: mqtt.util.TopicTrie[str] = mqtt.util.TopicTrie()
+    trie.add(topic_filter, "item")
+    matcher = MQTTMatcher()
+    matcher[topic_filter] = True
+    for topic in matching:
+        assert trie.match(topic) == ["item"]
+        assert next(matcher.iter_match(topic), False)
+    for topic in not_matching:
+        assert trie.match(topic) == []
+        assert not next(matcher.iter_match(topic), False)
+
+
+def test_topic_trie_add_remove() -> None:
+    """Test items are matched in the order they were added and can be removed."""
+    trie: mqtt.util.TopicTrie[str] = mqtt.util.TopicTrie()
+    trie.add("tele/+/SENSOR", "sensor")
+    trie.add("tele/#", "all")
+    trie.add("tele/plug/SENSOR", "plug")
+    trie.add("tele/+/SENSOR", "sensor 2")
+
+    assert len(trie) == 4
+    assert list(trie) == ["sensor", "all", "plug", "sensor 2"]
+    assert trie.match("tele/plug/SENSOR") == ["sensor", "all", "plug", "sensor 2"]
+    assert trie.match("tele/lamp/SENSOR") == ["sensor", "all", "sensor 2"]
+    assert trie.has_filter("tele/+/SENSOR")
+    assert not trie.has_filter("tele/+")
+
+    trie.remove("tele/+/SENSOR", "sensor")
+    trie.remove("tele/plug/SENSOR", "plug")
+    assert trie.match("tele/plug/SENSOR") == ["all", "sensor 2"]
+    with pytest.raises(KeyError):
+        trie.remove("tele/plug/SENSOR", "plug")
+
+    trie.remove("tele/+/SENSOR", "sensor 2")
+    trie.remove("tele/#", "all")
+    assert len(trie) == 0
+    assert not trie.has_filter("tele/#")
+    assert trie.match("tele/plug/SENSOR") == []
+    # Levels without items are pruned
+    assert not trie._root.children
@@ -0,0 +1,44 @@
+"""Test Profiler diagnostics."""
+from homeassistant.components.profiler import SERVICE_START_JOB_PROFILE
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockConfigEntry
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_entry_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test config entry diagnostics."""
+    assert await async_setup_component(hass, "diagnostics", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    result = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+    assert result["job_profile"] is None
+    assert result["loop_monitor"]["running"] is True
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_PROFILE, {}, blocking=True)
+    hass.bus.async_listen("profiled_event", callback(lambda event: None))
+    hass.bus.async_fire("profiled_event")
+    await hass.async_block_till_done()
+
+    result = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+    job_profile = result["job_profile"]
+    assert job_profile["running"] is True
+    assert set(job_profile) == {
+        "running",
+        "started",
+        "stopped",
+        "duration",
+        "jobs",
+        "event_types",
+        "domains",
+        "executor_jobs",
+    }
+    assert job_profile["jobs"]
@@ -1,8 +1,9 @@
 """Test the Profiler config flow."""
 from datetime import timedelta
-from functools import lru_cache
+from functools import lru_cache, partial
 import os
 from pathlib import Path
+import threading
 from unittest.mock import patch
 
 from lru import LRU
@@ -12,24 +13,31 @@ from homeassistant.components.profiler import (
     _LRU_CACHE_WRAPPER_OBJECT,
     _SQLALCHEMY_LRU_OBJECT,
     CONF_SECONDS,
+    LOOP_MONITOR,
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_START,
+    SERVICE_START_JOB_PROFILE,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_JOB_PROFILE,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.components.profiler.loop_monitor import MAX_STALLS, LoopMonitor
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -367,3 +375,179 @@ async def test_log_object_sources(
         await hass.services.async_call(
             DOMAIN, SERVICE_STOP_LOG_OBJECT_SOURCES, {}, blocking=True
         )
+
+
+async def test_job_profile(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test attributing event loop time to jobs, event types and integrations."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/job_profile"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_PROFILE, {}, blocking=True)
+    assert hass.job_profiler is not None
+    with pytest.raises(HomeAssistantError, match="Job profiling already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_JOB_PROFILE, {}, blocking=True
+        )
+
+    @callback
+    def _callback_listener(event):
+        """Handle an event in a callback."""
+
+    async def _async_listener(event):
+        """Handle an event in a coroutine."""
+
+    def _executor_listener(event):
+        """Handle an event in the executor."""
+
+    for listener in (_callback_listener, _async_listener, _executor_listener):
+        hass.bus.async_listen("profiled_event", listener)
+    hass.bus.async_listen("profiled_event", _callback_listener, run_immediately=True)
+    for _ in range(3):
+        hass.bus.async_fire("profiled_event")
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "profiler/job_profile"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["running"] is True
+    assert result["stopped"] is None
+
+    jobs = {job["name"]: job for job in result["jobs"]}
+    callback_job = jobs[
+        f"listen profiled_event: {__name__}.{_callback_listener.__qualname__}"
+    ]
+    assert callback_job["count"] == 6
+    assert callback_job["max"] >= callback_job["p99"] > 0
+    async_job = jobs[
+        f"listen profiled_event: {__name__}.{_async_listener.__qualname__}"
+    ]
+    assert async_job["count"] == 3
+    executor_jobs = {job["name"]: job for job in result["executor_jobs"]}
+    executor_job = executor_jobs[
+        f"listen profiled_event: {__name__}.{_executor_listener.__qualname__}"
+    ]
+    assert executor_job["count"] == 3
+    event_types = {item["name"]: item for item in result["event_types"]}
+    assert event_types["profiled_event"]["count"] == 9
+    # The test module does not belong to an integration
+    assert "homeassistant" in {item["name"] for item in result["domains"]}
+    assert [item["total"] for item in result["jobs"]] == sorted(
+        (item["total"] for item in result["jobs"]), reverse=True
+    )
+
+    await client.send_json_auto_id({"type": "profiler/job_profile", "limit": 1})
+    response = await client.receive_json()
+    assert len(response["result"]["jobs"]) == 1
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_JOB_PROFILE, {}, blocking=True)
+    assert hass.job_profiler is None
+    with pytest.raises(HomeAssistantError, match="Job profiling not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_JOB_PROFILE, {}, blocking=True
+        )
+
+    # The results are kept after stopping
+    await client.send_json_auto_id({"type": "profiler/job_profile"})
+    response = await client.receive_json()
+    assert response["result"]["running"] is False
+    assert response["result"]["stopped"] is not None
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_PROFILE, {}, blocking=True)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.job_profiler is None
+
+
+async def test_loop_monitor(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the event loop stalls are captured and attributed to callbacks."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    # The heartbeat and the watchdog are driven by the test
+    with patch(
+        "homeassistant.components.profiler.LoopMonitor",
+        partial(LoopMonitor, interval=60, threshold=0.1, watchdog_interval=3600),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    monitor: LoopMonitor = hass.data[DOMAIN][LOOP_MONITOR]
+
+    with patch(
+        "homeassistant.components.profiler.loop_monitor.time"
+    ) as mock_time, patch(
+        "homeassistant.components.profiler.loop_monitor._capture_stack",
+        return_value=(
+            "blocking.py:10 in _block_event_loop",
+            ['  File "blocking.py", line 10, in _block_event_loop'],
+        ),
+    ) as mock_capture_stack:
+        mock_time.monotonic.return_value = monitor._expected + 0.05
+        assert monitor._check_heartbeat(-1) == -1
+        mock_capture_stack.assert_not_called()
+
+        # The event loop is blocked, the watchdog captures it once
+        mock_time.monotonic.return_value = monitor._expected + 0.3
+        assert monitor._check_heartbeat(-1) == 0
+        assert monitor._check_heartbeat(0) == 0
+        assert mock_capture_stack.call_count == 1
+        monitor._async_beat()
+
+        # The heartbeat is no longer late once it ran
+        mock_capture_stack.return_value = ("other.py:1 in other", [])
+        assert monitor._check_heartbeat(0) == 0
+        assert mock_capture_stack.call_count == 1
+
+        # Smaller stalls do not evict the worst ones
+        for _ in range(MAX_STALLS + 10):
+            mock_time.monotonic.return_value = monitor._expected + 0.15
+            monitor._async_beat()
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/loop_monitor"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["running"] is True
+    assert result["stall_count"] == MAX_STALLS + 11
+    # Only the last lag is within the lag window of a single heartbeat
+    assert result["max_lag"] == pytest.approx(0.15)
+    assert len(result["stalls"]) == MAX_STALLS
+    stall = result["stalls"][0]
+    assert stall["lag"] == pytest.approx(0.3)
+    assert stall["callback"] == "blocking.py:10 in _block_event_loop"
+    assert "_block_event_loop" in stall["stack"][-1]
+    assert result["stalls"][1]["lag"] == pytest.approx(0.15)
+    assert result["stalls"][1]["callback"] is None
+
+    lag_entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_event_loop_lag"
+    )
+    stalls_entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_event_loop_stalls"
+    )
+    await async_update_entity(hass, lag_entity_id)
+    await async_update_entity(hass, stalls_entity_id)
+    assert float(hass.states.get(lag_entity_id).state) == 150
+    assert int(hass.states.get(stalls_entity_id).state) == result["stall_count"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not any(
+        thread.name == "profiler_loop_watchdog" for thread in threading.enumerate()
+    )
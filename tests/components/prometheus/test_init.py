@@ -209,6 +209,40 @@ async def test_sensor_unit(client, sensor_entities) -> None:
     )
 
 
+@pytest.mark.parametrize("namespace", [""])
+async def test_view_updates_changed_metrics(
+    hass: HomeAssistant, client, sensor_entities
+) -> None:
+    """Test the exposition follows state changes and supports compression."""
+    body = await generate_latest_metrics(client)
+    assert (
+        'sensor_unit_kwh{domain="sensor",'
+        'entity="sensor.television_energy",'
+        'friendly_name="Television Energy"} 74.0' in body
+    )
+    assert 'python_info{implementation="CPython"' in "\n".join(body)
+
+    set_state_with_entry(hass, sensor_entities["sensor_4"], 75)
+    await hass.async_block_till_done()
+
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers["Content-Encoding"] == "gzip"
+    body = (await resp.text()).split("\n")
+    assert (
+        'sensor_unit_kwh{domain="sensor",'
+        'entity="sensor.television_energy",'
+        'friendly_name="Television Energy"} 75.0' in body
+    )
+    assert (
+        'sensor_unit_sek_per_kwh{domain="sensor",'
+        'entity="sensor.electricity_price",'
+        'friendly_name="Electricity price"} 0.123' in body
+    )
+
+
 @pytest.mark.parametrize("namespace", [""])
 async def test_sensor_without_unit(client, sensor_entities) -> None:
     """Test prometheus metrics for sensors without a unit."""
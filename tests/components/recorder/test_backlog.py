@@ -0,0 +1,124 @@
+"""The tests for the recorder backlog spill."""
+from pathlib import Path
+
+from homeassistant.components.recorder.backlog import RecorderBacklogSpill
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+
+async def test_spill_and_replay_round_trip(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test spilled events are read back in order and the file is removed."""
+    path = tmp_path / "recorder.backlog"
+    spill = RecorderBacklogSpill(hass, str(path))
+    time_fired = dt_util.utcnow()
+    context = Context(user_id="abc", parent_id="def")
+    new_state = State(
+        "sensor.power",
+        "5",
+        {"unit_of_measurement": "W", "forecast": [1, 2]},
+        last_changed=time_fired,
+        last_updated=time_fired,
+        context=context,
+        state_info={"unrecorded_attributes": frozenset({"forecast"})},
+    )
+    events = [
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.power", "old_state": None, "new_state": new_state},
+            EventOrigin.local,
+            time_fired,
+            context,
+        ),
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.gone", "old_state": new_state, "new_state": None},
+            EventOrigin.local,
+            time_fired,
+        ),
+        Event("custom_event", {"value": 1}, EventOrigin.remote, time_fired),
+    ]
+    for event in events:
+        spill.async_spill(event)
+    spill.async_spill(Event("unserializable", {"value": object()}))
+    await spill.async_wait_writes()
+    assert path.exists()
+
+    replay_paths = spill.iter_replay_paths()
+    replay_path = await hass.async_add_executor_job(next, replay_paths)
+    assert replay_path == spill.replay_path
+    assert not path.exists()
+    replayed = await hass.async_add_executor_job(
+        lambda: list(spill.iter_events(replay_path))
+    )
+    assert [event.event_type for event in replayed] == [
+        EVENT_STATE_CHANGED,
+        EVENT_STATE_CHANGED,
+        "custom_event",
+    ]
+    assert replayed[0].context == context
+    assert replayed[0].time_fired == time_fired
+    replayed_state: State = replayed[0].data["new_state"]
+    assert replayed_state.as_dict() == new_state.as_dict()
+    assert replayed_state.state_info == {
+        "unrecorded_attributes": frozenset({"forecast"})
+    }
+    assert replayed[1].data == {
+        "entity_id": "sensor.gone",
+        "old_state": None,
+        "new_state": None,
+    }
+    assert replayed[2].data == {"value": 1}
+    assert replayed[2].origin is EventOrigin.remote
+
+    await hass.async_add_executor_job(spill.remove, replay_path)
+    assert not Path(replay_path).exists()
+    assert await hass.async_add_executor_job(list, replay_paths) == []
+
+
+async def test_spill_during_replay(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test events spilled during a replay are kept for the next replay."""
+    path = tmp_path / "recorder.backlog"
+    spill = RecorderBacklogSpill(hass, str(path))
+    time_fired = dt_util.utcnow()
+
+    def _replay() -> list[str]:
+        event_types = []
+        for replay_path in spill.iter_replay_paths():
+            event_types.extend(
+                event.event_type for event in spill.iter_events(replay_path)
+            )
+            spill.remove(replay_path)
+        return event_types
+
+    spill.async_spill(Event("event_1", {}, EventOrigin.local, time_fired))
+    await spill.async_wait_writes()
+    replay_paths = spill.iter_replay_paths()
+    replay_path = await hass.async_add_executor_job(next, replay_paths)
+
+    # Spilling starts again while the replay file is read
+    spill.async_spill(Event("event_2", {}, EventOrigin.local, time_fired))
+    await spill.async_wait_writes()
+    assert [
+        event.event_type
+        for event in await hass.async_add_executor_job(
+            lambda: list(spill.iter_events(replay_path))
+        )
+    ] == ["event_1"]
+    await hass.async_add_executor_job(spill.remove, replay_path)
+    assert await hass.async_add_executor_job(list, replay_paths) == []
+    assert path.exists()
+
+    # An interrupted replay is replayed before the new backlog
+    spill.async_spill(Event("event_3", {}, EventOrigin.local, time_fired))
+    await spill.async_wait_writes()
+    await hass.async_add_executor_job(next, spill.iter_replay_paths())
+    spill.async_spill(Event("event_4", {}, EventOrigin.local, time_fired))
+    await spill.async_wait_writes()
+    assert await hass.async_add_executor_job(_replay) == [
+        "event_2",
+        "event_3",
+        "event_4",
+    ]
+    assert not path.exists()
+    assert not Path(spill.replay_path).exists()
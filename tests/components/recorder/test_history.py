@@ -522,6 +522,105 @@ def test_get_significant_states_minimal_response(
     )
 
 
+def test_get_significant_states_columnar(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test columnar results match the compressed minimal response."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    one_and_half = zero + timedelta(seconds=1.5)
+    columns = history.get_significant_states_columnar(
+        hass, one_and_half, four, entity_ids=list(states)
+    )
+    hist = history.get_significant_states(
+        hass,
+        one_and_half,
+        four,
+        entity_ids=list(states),
+        minimal_response=True,
+        no_attributes=True,
+        compressed_state_format=True,
+    )
+    assert list(columns) == list(hist)
+    for entity_id, entity_states in hist.items():
+        expected_ts: list[float] = []
+        expected_states: list[str] = []
+        for state in entity_states:
+            if expected_states and state["s"] == expected_states[-1]:
+                continue
+            expected_ts.append(state["lu"])
+            expected_states.append(state["s"])
+        assert columns[entity_id]["lu"] == expected_ts
+        if entity_id.startswith("thermostat."):
+            assert columns[entity_id]["s"] == [float(s) for s in expected_states]
+        else:
+            assert columns[entity_id]["s"] == expected_states
+
+
+def test_get_significant_states_max_points(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test states are downsampled keeping the extremes and non numeric states."""
+    hass = hass_recorder()
+    entity_id = "sensor.power"
+    start = dt_util.utcnow()
+    end = start + timedelta(seconds=100)
+
+    with freeze_time(start) as freezer:
+        for second in range(100):
+            state = str(second % 10)
+            if second == 50:
+                state = "100"
+            elif second == 70:
+                state = "unavailable"
+            hass.states.set(entity_id, state)
+            freezer.tick(timedelta(seconds=1))
+        wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        start,
+        end,
+        entity_ids=[entity_id],
+        significant_changes_only=False,
+        minimal_response=True,
+        compressed_state_format=True,
+        max_points=10,
+    )
+    states = hist[entity_id]
+    # 5 buckets of 20 seconds keep the minimum and the maximum, the
+    # unavailable state splits a bucket and the last state is kept
+    assert [
+        (round(state["lu"] - start.timestamp()), state["s"]) for state in states
+    ] == [
+        (1, "1"),
+        (9, "9"),
+        (10, "0"),
+        (20, "0"),
+        (29, "9"),
+        (40, "0"),
+        (50, "100"),
+        (60, "0"),
+        (69, "9"),
+        (70, "unavailable"),
+        (71, "1"),
+        (79, "9"),
+        (80, "0"),
+        (89, "9"),
+        (99, "9"),
+    ]
+    timestamps = [state["lu"] for state in states]
+    assert timestamps == sorted(timestamps)
+
+    columns = history.get_significant_states_columnar(
+        hass, start, end, entity_ids=[entity_id], max_points=10
+    )
+    assert columns[entity_id]["lu"] == timestamps
+    assert columns[entity_id]["s"] == [
+        None if state["s"] == "unavailable" else float(state["s"]) for state in states
+    ]
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 def test_get_significant_states_with_initial(
     time_zone, hass_recorder: Callable[..., HomeAssistant]
@@ -2,6 +2,7 @@
 
 import datetime
 import importlib
+from pathlib import Path
 import sqlite3
 import sys
 import threading
@@ -291,6 +292,64 @@ async def test_events_during_migration_queue_exhausted(
     assert len(db_states) == 2
 
 
+async def test_events_during_migration_queue_exhausted_spill_backlog(
+    recorder_db_url: str,
+    hass: HomeAssistant,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test events are spilled to disk and replayed when the queue is exhausted."""
+    backlog_path = tmp_path / "recorder.backlog"
+
+    with patch("homeassistant.components.recorder.ALLOW_IN_MEMORY_DB", True), patch(
+        "homeassistant.components.recorder.core.create_engine",
+        new=create_engine_test,
+    ), patch(
+        "homeassistant.components.recorder.BACKLOG_SPILL_FILE", str(backlog_path)
+    ), patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1), patch.object(
+        recorder.core, "QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY", 0
+    ):
+        recorder_helper.async_initialize_recorder(hass)
+        await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": recorder_db_url,
+                    "commit_interval": 0,
+                    "spill_backlog": True,
+                }
+            },
+        )
+        hass.states.async_set("my.entity", "on", {})
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(hours=2))
+        await hass.async_block_till_done()
+        hass.states.async_set("my.entity", "off", {"friendly_name": "My entity"})
+        await hass.async_block_till_done()
+        assert recorder.get_instance(hass).recording is True
+        assert "The recorder will write new events to" in caplog.text
+        await recorder.get_instance(hass).async_recorder_ready.wait()
+        await async_wait_recording_done(hass)
+
+    # The queue has drained so new events are queued again without
+    # waiting for the queue watcher
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+    assert "replaying spilled events" in caplog.text
+    assert not backlog_path.exists()
+    db_states = await recorder.get_instance(hass).async_add_executor_job(
+        _get_native_states, hass, "my.entity"
+    )
+    assert [db_state.state for db_state in db_states] == ["on", "off"]
+    hass.states.async_set("my.entity", "on", {})
+    await async_wait_recording_done(hass)
+    db_states = await recorder.get_instance(hass).async_add_executor_job(
+        _get_native_states, hass, "my.entity"
+    )
+    assert len(db_states) == 3
+
+
 @pytest.mark.parametrize(
     ("start_version", "live"),
     [(0, True), (16, True), (18, True), (22, True), (25, True)],
@@ -22,7 +22,12 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    MIN_PURGE_BATCH_ROWS,
+    PURGE_BATCH_TARGET_LATENCY,
+    PurgeProgress,
+    purge_old_data,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -188,6 +193,85 @@ async def test_purge_old_states(
         assert state_attributes.count() == 3
 
 
+async def test_purge_time_budget_and_progress(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test a purge task stops after its time budget and tracks the progress."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with patch.object(instance, "max_bind_vars", 1), patch.object(
+        instance.database_engine, "max_bind_vars", 1
+    ), patch(
+        "homeassistant.components.recorder.purge.PURGE_TASK_TIME_BUDGET", 0
+    ), session_scope(hass=hass) as session:
+        states = session.query(States)
+        state_attributes = session.query(StateAttributes)
+
+        # Each purge task purges a single batch of states
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+        assert states.count() == 5
+
+        progress = instance.purge_progress
+        assert progress is not None
+        assert progress.purge_before == purge_before
+        assert progress.finished is None
+        assert progress.tasks == 1
+        assert progress.rows["states"] == 1
+
+        tasks = 1
+        while not purge_old_data(instance, purge_before, repack=False):
+            tasks += 1
+            assert tasks < 10
+        assert states.count() == 2
+        assert state_attributes.count() == 1
+
+        # The purge tasks of a run share the progress
+        assert instance.purge_progress is progress
+        assert progress.finished is not None
+        assert progress.tasks == tasks + 1
+        assert progress.rows["states"] == 4
+        assert progress.rows["state_attributes"] == 2
+        progress_dict = progress.as_dict()
+        assert progress_dict["rows"]["states"] == 4
+        assert progress_dict["finished"] == progress.finished.isoformat()
+
+        # The next purge run starts a new progress
+        purge_old_data(instance, purge_before, repack=False)
+        assert instance.purge_progress is not progress
+        assert instance.purge_progress.rows["states"] == 0
+
+
+def test_purge_progress_adapts_batch_rows() -> None:
+    """Test the rows purged per batch adapt to the latency of a batch."""
+    progress = PurgeProgress(dt_util.utcnow())
+    assert progress.get_batch_rows(4000) == 4000
+    assert progress.get_batch_rows(998) == 998
+
+    # Slow batches halve the rows down to the minimum
+    progress.record_batch(PURGE_BATCH_TARGET_LATENCY * 2, 4000)
+    assert progress.get_batch_rows(4000) == 2000
+    for _ in range(10):
+        progress.record_batch(PURGE_BATCH_TARGET_LATENCY * 2, 4000)
+    assert progress.get_batch_rows(4000) == MIN_PURGE_BATCH_ROWS
+    assert progress.batch_latency == PURGE_BATCH_TARGET_LATENCY * 2
+
+    # Batches close to the target keep the rows
+    progress.record_batch(PURGE_BATCH_TARGET_LATENCY * 0.75, 4000)
+    assert progress.get_batch_rows(4000) == MIN_PURGE_BATCH_ROWS
+
+    # Fast batches double the rows up to the max bind vars
+    progress.record_batch(0, 4000)
+    assert progress.get_batch_rows(4000) == MIN_PURGE_BATCH_ROWS * 2
+    for _ in range(10):
+        progress.record_batch(0, 4000)
+    assert progress.get_batch_rows(4000) == 4000
+    assert progress.get_batch_rows(998) == 998
+
+
 async def test_purge_old_states_encouters_database_corruption(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
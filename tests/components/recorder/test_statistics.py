@@ -1,6 +1,8 @@
 """The tests for sensor recorder platform."""
 from collections.abc import Callable
-from datetime import timedelta
+from datetime import date, timedelta
+from statistics import fmean
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -1183,6 +1185,126 @@ def test_daily_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+def test_daily_statistics_many_periods(
+    hass_recorder: Callable[..., HomeAssistant],
+    timezone,
+) -> None:
+    """Test daily statistics over many days and a daylight saving time change."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+
+    hass = hass_recorder()
+    wait_recording_done(hass)
+
+    zero = dt_util.as_utc(dt_util.parse_datetime("2022-10-20 00:00:00"))
+    external_statistics = [
+        {
+            "start": zero + timedelta(hours=hour),
+            "last_reset": None,
+            "max": hour + 1,
+            "mean": hour,
+            "min": hour - 1,
+            "state": hour,
+            "sum": hour * 2,
+        }
+        for hour in range(24 * 20)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    wait_recording_done(hass)
+
+    days: dict[date, list[dict[str, Any]]] = {}
+    for statistic in external_statistics:
+        days.setdefault(dt_util.as_local(statistic["start"]).date(), []).append(
+            statistic
+        )
+    expected_stats = []
+    for day, day_statistics in days.items():
+        day_start = dt_util.start_of_local_day(day)
+        expected_stats.append(
+            {
+                "start": day_start.timestamp(),
+                "end": dt_util.start_of_local_day(day + timedelta(days=1)).timestamp(),
+                "last_reset": None,
+                "max": max(statistic["max"] for statistic in day_statistics),
+                "mean": pytest.approx(
+                    fmean(statistic["mean"] for statistic in day_statistics)
+                ),
+                "min": min(statistic["min"] for statistic in day_statistics),
+                "state": day_statistics[-1]["state"],
+                "sum": day_statistics[-1]["sum"],
+            }
+        )
+
+    stats = statistics_during_period(
+        hass, zero, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    assert stats == {"test:total_energy_import": expected_stats}
+
+    # The start and end times are aligned with the start and end of the day
+    start_time = zero + timedelta(days=3, hours=5)
+    end_time = zero + timedelta(days=5, hours=5)
+    stats = statistics_during_period(
+        hass,
+        start_time,
+        end_time,
+        period="day",
+        statistic_ids={"test:total_energy_import"},
+    )
+    assert stats == {"test:total_energy_import": expected_stats[3:6]}
+
+    # Only the hourly statistics from the start until the end time are reduced
+    partial_days: dict[float, list[dict[str, Any]]] = {}
+    for statistic in external_statistics:
+        if start_time <= statistic["start"] < end_time:
+            partial_days.setdefault(
+                dt_util.start_of_local_day(
+                    dt_util.as_local(statistic["start"]).date()
+                ).timestamp(),
+                [],
+            ).append(statistic)
+    with session_scope(hass=hass, read_only=True) as session:
+        rows, periods = statistics._reduced_statistics_during_period(
+            session,
+            start_time,
+            end_time,
+            None,
+            "day",
+            {"max", "mean", "min", "state", "sum"},
+        )
+    assert [
+        (
+            periods[int(row.start_ts)][0],
+            row.max,
+            pytest.approx(row.mean),
+            row.min,
+            row.state,
+            row.sum,
+        )
+        for row in rows
+    ] == [
+        (
+            day_start,
+            max(statistic["max"] for statistic in day_statistics),
+            fmean(statistic["mean"] for statistic in day_statistics),
+            min(statistic["min"] for statistic in day_statistics),
+            day_statistics[-1]["state"],
+            day_statistics[-1]["sum"],
+        )
+        for day_start, day_statistics in partial_days.items()
+    ]
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 def test_weekly_statistics_mean(
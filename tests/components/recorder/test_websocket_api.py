@@ -2163,6 +2163,7 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge": None,
         "recording": True,
         "thread_running": True,
     }
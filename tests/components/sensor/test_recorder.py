@@ -602,6 +602,77 @@ def test_compile_hourly_statistics_purged_state_changes(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+def test_compile_hourly_statistics_from_live_states(
+    hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test compiling statistics from the states collected from state changes."""
+    zero = dt_util.utcnow()
+    period1 = zero + timedelta(minutes=1)
+    hass = hass_recorder()
+    setup_component(hass, "sensor", {})
+    wait_recording_done(hass)  # Wait for the sensor recorder platform to be added
+    history_spy = patch(
+        "homeassistant.components.sensor.recorder.history.get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    )
+
+    with freeze_time(zero) as freezer:
+        hass.states.set("sensor.test1", "10", TEMPERATURE_SENSOR_ATTRIBUTES)
+        hass.states.set("sensor.test2", "20", ENERGY_SENSOR_ATTRIBUTES)
+        # The first compile starts collecting the states
+        do_adhoc_statistics(hass, start=zero - timedelta(minutes=5))
+        wait_recording_done(hass)
+
+        freezer.move_to(period1 + timedelta(seconds=30))
+        hass.states.set("sensor.test1", "30", TEMPERATURE_SENSOR_ATTRIBUTES)
+        hass.states.set("sensor.test2", "25", ENERGY_SENSOR_ATTRIBUTES)
+        freezer.move_to(period1 + timedelta(minutes=2))
+        hass.states.set("sensor.test1", "20", TEMPERATURE_SENSOR_ATTRIBUTES)
+        # Attribute changes are not significant for measurements
+        hass.states.set(
+            "sensor.test1", "20", {**TEMPERATURE_SENSOR_ATTRIBUTES, "other": 1}
+        )
+        wait_recording_done(hass)
+
+    with history_spy as get_history:
+        do_adhoc_statistics(hass, start=period1)
+        wait_recording_done(hass)
+    get_history.assert_not_called()
+
+    # The states of older periods are read from the database
+    with history_spy as get_history:
+        do_adhoc_statistics(hass, start=zero)
+        wait_recording_done(hass)
+    assert get_history.call_count == 2
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats["sensor.test1"] == [
+        {
+            "start": process_timestamp(zero).timestamp(),
+            "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+            "mean": pytest.approx(20.0),
+            "min": pytest.approx(10.0),
+            "max": pytest.approx(30.0),
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        },
+        {
+            "start": process_timestamp(period1).timestamp(),
+            "end": process_timestamp(period1 + timedelta(minutes=5)).timestamp(),
+            "mean": pytest.approx(22.0),
+            "min": pytest.approx(10.0),
+            "max": pytest.approx(30.0),
+            "last_reset": None,
+            "state": None,
+            "sum": None,
+        },
+    ]
+    assert stats["sensor.test2"][-1]["state"] == pytest.approx(25.0)
+    assert stats["sensor.test2"][-1]["sum"] == pytest.approx(5.0)
+    assert "Error while processing event StatisticsTask" not in caplog.text
+
+
 @pytest.mark.parametrize("attributes", [TEMPERATURE_SENSOR_ATTRIBUTES])
 def test_compile_hourly_statistics_wrong_unit(
     hass_recorder: Callable[..., HomeAssistant],
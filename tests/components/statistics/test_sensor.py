@@ -18,6 +18,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.components.statistics import DOMAIN as STATISTICS_DOMAIN
+from homeassistant.components.statistics.rolling import RollingWindow
 from homeassistant.components.statistics.sensor import StatisticsSensor
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
@@ -1434,3 +1435,78 @@ async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
 
     assert hass.states.get("sensor.test") is None
     assert hass.states.get("sensor.cputest")
+
+
+def test_rolling_window_matches_full_recompute() -> None:
+    """Test the incremental window matches recomputing over the whole buffer."""
+    window = RollingWindow(5, percentile=50, circular=True)
+    percentile_windows = {
+        percentile: RollingWindow(5, percentile=percentile)
+        for percentile in (1, 25, 50, 99)
+    }
+    start = dt_util.utcnow()
+    for idx, value in enumerate([*VALUES_NUMERIC, 6, 20, 3.8]):
+        window.append(value, start + timedelta(seconds=idx * idx))
+        for percentile_window in percentile_windows.values():
+            percentile_window.append(value, start + timedelta(seconds=idx * idx))
+        if idx % 4 == 3:
+            window.popleft()
+            for percentile_window in percentile_windows.values():
+                percentile_window.popleft()
+        values = list(window.states)
+        if len(values) < 2:
+            continue
+        assert window.mean == pytest.approx(statistics.mean(values))
+        assert window.variance == pytest.approx(statistics.variance(values))
+        assert window.median() == statistics.median(values)
+        for percentile, percentile_window in percentile_windows.items():
+            assert percentile_window.percentile() == pytest.approx(
+                statistics.quantiles(values, n=100, method="exclusive")[percentile - 1]
+            )
+        assert window.max == (
+            max(values),
+            window.ages[values.index(max(values))],
+        )
+        assert window.min == (
+            min(values),
+            window.ages[values.index(min(values))],
+        )
+        assert window.sum == pytest.approx(sum(values))
+        assert window.sum_differences == pytest.approx(
+            sum(abs(j - i) for i, j in zip(values, values[1:]))
+        )
+        ages = list(window.ages)
+        assert window.area_step == pytest.approx(
+            sum(
+                values[i - 1] * (ages[i] - ages[i - 1]).total_seconds()
+                for i in range(1, len(values))
+            )
+        )
+
+
+def test_rolling_window_median_with_many_duplicates() -> None:
+    """Test the median stays exact while duplicates enter and leave the window."""
+    window = RollingWindow(7, percentile=50)
+    start = dt_util.utcnow()
+    for idx in range(500):
+        window.append((idx * 7919) % 5, start + timedelta(seconds=idx))
+        if idx % 3 == 1:
+            window.popleft()
+        assert window.median() == statistics.median(window.states)
+
+
+def test_rolling_window_recovers_from_outlier() -> None:
+    """Test an outlier leaving the window does not spoil the running sums."""
+    window = RollingWindow(3, circular=True)
+    start = dt_util.utcnow()
+    for idx, value in enumerate([5, 1e17, 7, 1, 2, 3]):
+        window.append(value, start + timedelta(seconds=idx))
+
+    assert list(window.states) == [1, 2, 3]
+    assert window.sum == 6
+    assert window.mean == pytest.approx(2)
+    assert window.variance == pytest.approx(1)
+    assert window.area_step == 3
+    assert window.area_linear == 4
+    assert window.sum_differences == 2
+    assert window.sum_differences_nonnegative == 2
@@ -17,13 +17,18 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    SetupPhase,
+    async_setup_component,
+    async_trace_setup,
+)
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -1262,6 +1267,53 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_shared_router(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscriptions share one listener and follow permission changes."""
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+
+    for msg_id, entity_ids in ((7, ["light.permitted"]), (8, ["light.other"])):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "subscribe_entities", "entity_ids": entity_ids}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"a": {}}
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"]["a"]["light.permitted"]["s"] == "on"
+
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True, "light.other": True}}}
+    )
+    hass.states.async_set("light.other", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"]["c"]["light.other"]["+"]["s"] == "off"
+
+    for msg_id, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2510,6 +2562,44 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_setup_trace(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the setup trace is returned in the Chrome trace format."""
+    with async_trace_setup(hass, "august", SetupPhase.SETUP):
+        pass
+    with async_trace_setup(hass, "august", SetupPhase.PLATFORM_SETUP, "sensor"):
+        await websocket_client.send_json({"id": 7, "type": "integration/setup_trace"})
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    events = msg["result"]["traceEvents"]
+    lanes = {
+        event["tid"]: event["args"]["name"]
+        for event in events
+        if event["name"] == "thread_name"
+    }
+    spans = [
+        (lanes[event["tid"]], event["name"], event["args"].get("in_progress", False))
+        for event in events
+        if event["ph"] == "X" and event["args"]["domain"] == "august"
+    ]
+    assert spans == [
+        ("august", "setup", False),
+        ("august sensor", "platform_setup", True),
+    ]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 8, "type": "integration/setup_trace"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
@@ -2,7 +2,7 @@
 import asyncio
 from datetime import timedelta
 from typing import Any, cast
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
 import pytest
@@ -16,6 +16,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -503,3 +504,112 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def _async_coalescing_handler(
+    hass_ws_client: WebSocketGenerator,
+) -> tuple[MockHAClientWebSocket, http.WebSocketHandler]:
+    """Return a client coalescing messages and its handler."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"] is True
+    return websocket_client, cast(http.WebSocketHandler, setup_instance)
+
+
+async def test_coalesce_byte_sized_batches(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test coalesced messages are sent in batches sized by bytes."""
+    with patch(
+        "homeassistant.components.websocket_api.http.MIN_COALESCE_BYTES", 40
+    ), patch("homeassistant.components.websocket_api.http.MAX_COALESCE_BYTES", 80):
+        websocket_client, instance = await _async_coalescing_handler(hass_ws_client)
+        instance._send_message({"id": 2})
+        msg = await websocket_client.receive_json()
+        assert msg == {"id": 2}
+
+        # The messages are queued at once, the bytes and str
+        # messages are sent as they are
+        for idx in range(3, 23):
+            instance._send_message({"id": idx, "pad": "x" * 10})
+        instance._send_message(b'{"id":23}')
+        instance._send_message('{"id":24}')
+
+        received: list[int] = []
+        batches: list[int] = []
+        while len(received) < 22:
+            batch = json_loads(await websocket_client.receive_str())
+            batches.append(len(batch))
+            received.extend(msg["id"] for msg in batch)
+
+    assert received == list(range(3, 25))
+    # Batches of 28 bytes messages grow from 40 to 80 bytes
+    assert batches == [2, 3, 3, 3, 3, 3, 3, 2]
+    assert instance._pending_bytes == 0
+
+
+async def test_coalesce_pending_bytes_overflow(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test clients coalescing messages are limited by the pending bytes."""
+    websocket_client, instance = await _async_coalescing_handler(hass_ws_client)
+
+    # The number of pending messages does not matter
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 1):
+        for idx in range(10):
+            instance._send_message({"id": idx})
+        received: list[int] = []
+        while len(received) < 10:
+            if isinstance(batch := await websocket_client.receive_json(), dict):
+                batch = [batch]
+            received.extend(msg["id"] for msg in batch)
+    assert received == list(range(10))
+
+    with patch("homeassistant.components.websocket_api.http.MAX_PENDING_BYTES", 50):
+        for _ in range(10):
+            instance._send_message({"overload": "message"})
+
+    msg = await websocket_client.receive()
+    while msg.type == WSMsgType.TEXT:
+        msg = await websocket_client.receive()
+    assert msg.type == WSMsgType.close
+    assert "Client unable to keep up with pending messages" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("remote", "compress"),
+    [
+        ("127.0.0.1", False),
+        ("192.168.1.10", False),
+        ("8.8.8.8", True),
+        ("invalid", True),
+    ],
+)
+async def test_should_compress(
+    hass: HomeAssistant, remote: str, compress: bool
+) -> None:
+    """Test permessage-deflate is only negotiated with remote clients."""
+    request = Mock(remote=remote)
+    assert http._should_compress(hass, request) is compress
@@ -6,6 +6,7 @@ from homeassistant.components.websocket_api.messages import (
     _state_diff_event,
     cached_event_message,
     message_to_json,
+    message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
@@ -300,3 +301,19 @@ async def test_message_to_json(caplog: pytest.LogCaptureFixture) -> None:
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
+    """Test we can serialize websocket messages to bytes."""
+
+    json_bytes = message_to_json_bytes({"id": 1, "message": "xyz"})
+
+    assert json_bytes == b'{"id":1,"message":"xyz"}'
+
+    json_bytes2 = message_to_json_bytes({"id": 1, "message": _Unserializeable()})
+
+    assert (
+        json_bytes2
+        == b'{"id":1,"type":"result","success":false,"error":{"code":"unknown_error","message":"Invalid JSON in response"}}'
+    )
+    assert "Unable to serialize to JSON" in caplog.text
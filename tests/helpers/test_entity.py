@@ -1693,6 +1693,43 @@ async def test_invalid_state(
     assert hass.states.get("test.test").state == "x" * 255
 
 
+async def test_batch_state_writes(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test entity states written in a batch are set when the block exits."""
+    ent1 = entity.Entity()
+    ent1.entity_id = "test.test1"
+    ent1.hass = hass
+    ent1._attr_state = "on"
+    ent2 = entity.Entity()
+    ent2.entity_id = "test.test2"
+    ent2.hass = hass
+    ent2._attr_state = "x" * 256
+
+    with entity.async_batch_state_writes(hass):
+        ent1.async_write_ha_state()
+        with entity.async_batch_state_writes(hass):
+            ent2.async_write_ha_state()
+        assert hass.states.get("test.test1") is None
+        assert hass.states.get("test.test2") is None
+
+    state1 = hass.states.get("test.test1")
+    state2 = hass.states.get("test.test2")
+    assert state1.state == "on"
+    assert state2.state == STATE_UNKNOWN
+    assert state1.last_updated == state2.last_updated
+    assert state1.context is state2.context
+    assert (
+        "homeassistant.helpers.entity",
+        logging.ERROR,
+        f"Failed to set state for test.test2, fall back to {STATE_UNKNOWN}",
+    ) in caplog.record_tuples
+
+    ent1._attr_state = "off"
+    ent1.async_write_ha_state()
+    assert hass.states.get("test.test1").state == "off"
+
+
 async def test_suggest_report_issue_built_in(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -24,7 +24,9 @@ from homeassistant.helpers.event import (
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    async_call_at_shared,
     async_call_later,
+    async_get_shared_timer_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -3588,6 +3590,89 @@ async def test_track_time_interval_name(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
 
+async def test_track_time_interval_jitter(hass: HomeAssistant) -> None:
+    """Test intervals within the same jitter budget share a loop timer."""
+    runs = []
+    initial = async_get_shared_timer_stats(hass)
+    unsubs = [
+        async_track_time_interval(
+            hass,
+            callback(lambda x, i=i: runs.append(i)),
+            timedelta(seconds=10),
+            jitter=timedelta(seconds=1),
+        )
+        for i in range(5)
+    ]
+    stats = async_get_shared_timer_stats(hass)
+    assert stats["timers"] == initial["timers"] + 5
+    assert stats["slots"] == initial["slots"] + 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert runs == [0, 1, 2, 3, 4]
+    stats = async_get_shared_timer_stats(hass)
+    assert stats["timers"] == initial["timers"] + 5
+    assert stats["wakeups"] == initial["wakeups"] + 1
+
+    for unsub in unsubs:
+        unsub()
+    stats = async_get_shared_timer_stats(hass)
+    assert stats["timers"] == initial["timers"]
+    assert stats["slots"] == initial["slots"]
+
+
+async def test_call_at_shared(hass: HomeAssistant) -> None:
+    """Test timers on the shared timer wheel."""
+    runs = []
+    loop_time = hass.loop.time()
+    initial = async_get_shared_timer_stats(hass)
+
+    unsub_1 = async_call_at_shared(
+        hass, callback(lambda x: runs.append(1)), loop_time + 5
+    )
+    async_call_at_shared(hass, callback(lambda x: runs.append(2)), loop_time + 5)
+    async_call_at_shared(hass, callback(lambda x: runs.append(3)), loop_time + 10)
+    stats = async_get_shared_timer_stats(hass)
+    assert stats["timers"] == initial["timers"] + 3
+    assert stats["slots"] == initial["slots"] + 2
+
+    unsub_1()
+    unsub_1()
+    assert async_get_shared_timer_stats(hass)["timers"] == initial["timers"] + 2
+
+    async_fire_time_changed_exact(hass, dt_util.utcnow() + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert runs == [2]
+
+    async_fire_time_changed_exact(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert runs == [2, 3]
+    stats = async_get_shared_timer_stats(hass)
+    assert stats["timers"] == initial["timers"]
+    assert stats["slots"] == initial["slots"]
+    assert stats["wakeups"] == initial["wakeups"] + 2
+
+
+async def test_call_at_shared_cancel_while_running(hass: HomeAssistant) -> None:
+    """Test a timer cancelled by another timer of the same slot does not run."""
+    runs = []
+    loop_time = hass.loop.time()
+
+    @callback
+    def _first(now: datetime) -> None:
+        runs.append(1)
+        unsub_second()
+
+    async_call_at_shared(hass, _first, loop_time + 5)
+    unsub_second = async_call_at_shared(
+        hass, callback(lambda x: runs.append(2)), loop_time + 5
+    )
+
+    async_fire_time_changed_exact(hass, dt_util.utcnow() + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert runs == [1]
+
+
 async def test_track_sunrise(hass: HomeAssistant) -> None:
     """Test track the sunrise."""
     latitude = 32.87336
@@ -1,5 +1,5 @@
 """Test integration platform helpers."""
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -9,7 +9,7 @@ from homeassistant.helpers.integration_platform import (
 )
 from homeassistant.setup import ATTR_COMPONENT, EVENT_COMPONENT_LOADED
 
-from tests.common import mock_platform
+from tests.common import MockModule, mock_integration, mock_platform
 
 
 async def test_process_integration_platforms(hass: HomeAssistant) -> None:
@@ -65,3 +65,21 @@ async def test_broken_integration(
 
     assert len(processed) == 0
     assert "Error importing integration loaded for platform_to_check" in caplog.text
+
+
+async def test_process_integration_platforms_platform_missing(
+    hass: HomeAssistant,
+) -> None:
+    """Test a platform is not imported when the integration has no such file."""
+    integration = mock_integration(hass, MockModule("loaded"))
+    integration._top_level_files = {"__init__.py", "manifest.json"}
+    hass.config.components.add("loaded")
+    process_platform = AsyncMock()
+
+    with patch.object(integration, "get_platform") as mock_get_platform:
+        await async_process_integration_platforms(
+            hass, "platform_to_check", process_platform
+        )
+
+    assert not mock_get_platform.called
+    assert not process_platform.called
@@ -17,6 +17,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    ExtraStoredData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -352,6 +353,77 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_serializes_changed_states(hass: HomeAssistant) -> None:
+    """Test states are only serialized again after they changed."""
+
+    class MockExtraStoredData(ExtraStoredData):
+        """Mock extra stored data counting serializations."""
+
+        def __init__(self, value: int) -> None:
+            """Initialize the extra data."""
+            self.value = value
+            self.serialized = 0
+
+        def __eq__(self, other: object) -> bool:
+            """Compare the extra data."""
+            return isinstance(other, MockExtraStoredData) and other.value == self.value
+
+        def as_dict(self) -> dict[str, Any]:
+            """Return the extra data."""
+            self.serialized += 1
+            return {"value": self.value}
+
+    class MockRestoreEntity(RestoreEntity):
+        """Mock restore entity with extra data."""
+
+        extra_value = 1
+
+        @property
+        def extra_restore_state_data(self) -> MockExtraStoredData:
+            """Return the extra data."""
+            return MockExtraStoredData(self.extra_value)
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = MockRestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await platform.async_add_entities([entity])
+    hass.states.async_set("input_boolean.b0", "on")
+
+    data = async_get(hass)
+
+    async def _async_dump() -> list[dict[str, Any]]:
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data:
+            await data.async_dump_states()
+        return [json_round_trip(state) for state in mock_write_data.mock_calls[0][1][0]]
+
+    written_states = await _async_dump()
+    assert written_states[0]["state"]["state"] == "on"
+    assert written_states[0]["extra_data"] == {"value": 1}
+    stored_state = data.async_get_stored_states()[0]
+    assert stored_state.extra_data.serialized == 1
+
+    # Unchanged states are not serialized again, only the last seen time is updated
+    later = dt_util.utcnow() + timedelta(minutes=15)
+    with patch("homeassistant.util.dt.utcnow", return_value=later):
+        written_states = await _async_dump()
+    assert written_states[0]["last_seen"] == later.isoformat()
+    assert data.async_get_stored_states()[0] is stored_state
+    assert stored_state.extra_data.serialized == 1
+
+    hass.states.async_set("input_boolean.b0", "off")
+    written_states = await _async_dump()
+    assert written_states[0]["state"]["state"] == "off"
+    assert written_states[0]["extra_data"] == {"value": 1}
+
+    entity.extra_value = 2
+    written_states = await _async_dump()
+    assert written_states[0]["state"]["state"] == "off"
+    assert written_states[0]["extra_data"] == {"value": 2}
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
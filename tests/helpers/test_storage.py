@@ -733,3 +733,195 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test saves only append the changes to the journal."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    data = {
+        "entities": [{"id": idx, "name": f"entity {idx}"} for idx in range(5)],
+        "options": {"hello": "world", "goodbye": "cruel world"},
+    }
+    await store.async_save(data)
+    stored_data = await hass.async_add_executor_job(
+        json.loads, await hass.async_add_executor_job(_read_bytes, store.path)
+    )
+    assert stored_data["data"] == data
+    assert not os.path.exists(store.journal_path)
+
+    data["entities"][1]["name"] = "renamed"
+    data["entities"].append({"id": 5, "name": "entity 5"})
+    del data["options"]["goodbye"]
+    data["options"]["new"] = [1, 2]
+    await store.async_save(data)
+
+    # The data file is left untouched
+    assert (
+        await hass.async_add_executor_job(
+            json.loads, await hass.async_add_executor_job(_read_bytes, store.path)
+        )
+        == stored_data
+    )
+    journal = await hass.async_add_executor_job(_read_bytes, store.journal_path)
+    assert len(journal.splitlines()) == 2
+
+    data["entities"] = data["entities"][:2]
+    await store.async_save(data)
+    journal = await hass.async_add_executor_job(_read_bytes, store.journal_path)
+    assert len(journal.splitlines()) == 3
+
+    # Saving the same data does not append to the journal
+    await store.async_save(data)
+    assert await hass.async_add_executor_job(_read_bytes, store.journal_path) == journal
+
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == data
+
+    # The first save after loading compacts the journal
+    await store2.async_save(data)
+    assert not os.path.exists(store.journal_path)
+    assert await storage.Store(hass, MOCK_VERSION, MOCK_KEY).async_load() == data
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_torn_and_stale(tmpdir: py.path.local) -> None:
+    """Test incomplete journal lines and journals of older data files are ignored."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save({"items": [1, 2, 3]})
+    await store.async_save({"items": [1, 2, 3, 4]})
+
+    def _append_torn_line() -> None:
+        with open(store.journal_path, "ab") as journal_file:
+            journal_file.write(b'[["s",["data","items",4],')
+
+    await hass.async_add_executor_job(_append_torn_line)
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == {"items": [1, 2, 3, 4]}
+
+    def _replace_journal_id() -> None:
+        with open(store.path, encoding="utf-8") as data_file:
+            stored_data = json.load(data_file)
+        stored_data["journal"] = "other"
+        with open(store.path, "w", encoding="utf-8") as data_file:
+            json.dump(stored_data, data_file)
+
+    await hass.async_add_executor_job(_replace_journal_id)
+    store3 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store3.async_load() == {"items": [1, 2, 3]}
+
+    await store3.async_remove()
+    assert not os.path.exists(store.path)
+    assert not os.path.exists(store.journal_path)
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the data file once it grows too large."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    with patch.object(storage, "JOURNAL_COMPACT_MIN_SIZE", 200):
+        await store.async_save({"counter": 0})
+        for counter in range(1, 5):
+            await store.async_save({"counter": counter})
+            assert os.path.exists(store.journal_path)
+        for counter in range(5, 10):
+            await store.async_save({"counter": counter})
+
+    stored_data = await hass.async_add_executor_job(
+        json.loads, await hass.async_add_executor_job(_read_bytes, store.path)
+    )
+    assert stored_data["data"]["counter"] > 0
+    store2 = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    assert await store2.async_load() == {"counter": 9}
+
+    # Changing the version compacts the journal
+    store3 = storage.Store(hass, MOCK_VERSION_2, MOCK_KEY, journal=True)
+    await store3.async_save({"counter": 10})
+    assert not os.path.exists(store.journal_path)
+
+    await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted on the final write for older versions."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+    await store.async_save({"items": [1, 2, 3]})
+    await store.async_save({"items": [1, 2, 3, 4]})
+    assert os.path.exists(store.journal_path)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    assert not os.path.exists(store.journal_path)
+    stored_data = await hass.async_add_executor_job(
+        json.loads, await hass.async_add_executor_job(_read_bytes, store.path)
+    )
+    assert stored_data["data"] == {"items": [1, 2, 3, 4]}
+
+    await hass.async_stop(force=True)
+
+
+async def test_coalesced_writes(tmpdir: py.path.local) -> None:
+    """Test stores saving at the same time are written in one executor job."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+    hass.config.config_dir = await hass.async_add_executor_job(
+        tmpdir.mkdir, "temp_storage"
+    )
+
+    stores = [
+        storage.Store(hass, MOCK_VERSION, f"{MOCK_KEY}_{idx}") for idx in range(3)
+    ]
+    with patch(
+        "homeassistant.helpers.storage._write_pending",
+        wraps=storage._write_pending,
+    ) as mock_write_pending:
+        await asyncio.gather(
+            *(store.async_save({"idx": idx}) for idx, store in enumerate(stores))
+        )
+
+    assert mock_write_pending.call_count == 1
+    for idx, store in enumerate(stores):
+        assert await store.async_load() == {"idx": idx}
+
+    bad_store = storage.Store(hass, MOCK_VERSION, f"{MOCK_KEY}_bad")
+    with patch.object(
+        bad_store, "_write_data", side_effect=OSError("disk full")
+    ), pytest.raises(OSError):
+        await asyncio.gather(
+            stores[0].async_save({"idx": "good"}), bad_store.async_save({"idx": 0})
+        )
+    assert await stores[0].async_load() == {"idx": "good"}
+
+    await hass.async_stop(force=True)
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a file."""
+    with open(path, "rb") as file:
+        return file.read()
@@ -1,10 +1,12 @@
 """Test Home Assistant template helper methods."""
 from __future__ import annotations
 
+import base64
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
 import random
 from types import MappingProxyType
@@ -20,6 +22,7 @@ from homeassistant.components import group
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -1698,6 +1701,120 @@ def test_render_with_possible_json_value_valid_with_is_defined(
     assert tpl.async_render_with_possible_json_value('{"hello": "world"}') == "world"
 
 
+def test_render_with_possible_json_value_fast_path(hass: HomeAssistant) -> None:
+    """Render value_json keys without jinja when possible."""
+    tpl = template.Template("{{ value_json.temperature }}", hass)
+    with patch.object(
+        template, "_render_with_context", wraps=template._render_with_context
+    ) as render_with_context:
+        assert tpl.async_render_with_possible_json_value('{"temperature": 21.5}') == (
+            "21.5"
+        )
+        assert tpl.async_render_with_possible_json_value(
+            '{"temperature": {"value": 1}}'
+        ) == str({"value": 1})
+        assert render_with_context.call_count == 0
+        # Not a dict, a missing key, or a key shadowed by a dict attribute
+        assert tpl.async_render_with_possible_json_value("[1]") == ""
+        assert tpl.async_render_with_possible_json_value('{"other": 1}') == ""
+        assert render_with_context.call_count == 2
+
+    tpl = template.Template("{{ value_json.items }}", hass)
+    assert tpl.async_render_with_possible_json_value('{"items": 1}') != "1"
+
+
+async def test_render_states_fast_path(hass: HomeAssistant) -> None:
+    """Render the state of a single entity without jinja."""
+    hass.states.async_set("sensor.temperature", "21.5")
+    tpl = template.Template("{{ states('sensor.temperature') }}", hass)
+    with patch.object(
+        template, "_render_with_context", wraps=template._render_with_context
+    ) as render_with_context:
+        assert tpl.async_render() == 21.5
+        assert tpl.async_render(parse_result=False) == "21.5"
+        info = tpl.async_render_to_info()
+        assert_result_info(info, 21.5, ["sensor.temperature"])
+        assert render_with_context.call_count == 0
+        # A variable named states shadows the function
+        assert tpl.async_render({"states": lambda _: "shadowed"}) == "shadowed"
+        assert render_with_context.call_count == 1
+
+    tpl = template.Template('{{ states("sensor.missing") }}', hass)
+    assert tpl.async_render() == "unknown"
+
+    tpl = template.Template("{{ states('sensor.temperature') }}", hass)
+    with pytest.raises(TemplateError):
+        tpl.async_render(limited=True)
+
+
+async def test_compiled_code_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled code is shared, loaded from and saved to storage."""
+    source = "{{ 'cached' ~ 1 }}"
+    code = template._NO_HASS_ENV.compile(source)
+    hass_storage[template.COMPILED_CODE_CACHE_KEY] = {
+        "version": template.COMPILED_CODE_CACHE_VERSION,
+        "minor_version": 1,
+        "key": template.COMPILED_CODE_CACHE_KEY,
+        "data": {
+            "header": list(template._compiled_code_cache_header()),
+            "code": {source: base64.b64encode(marshal.dumps(code)).decode()},
+        },
+    }
+    template.COMPILED_CODE_LRU.clear()
+    await template.async_load_compiled_code_cache(hass)
+    assert source in template.COMPILED_CODE_LRU
+    assert template.Template(source, hass).async_render() == "cached1"
+
+    tpl = template.Template("{{ 'not' ~ ' cached' }}", hass)
+    tpl_limited = template.Template("{{ 'not' ~ ' cached' }}", hass)
+    assert tpl.async_render() == "not cached"
+    assert tpl_limited.async_render(limited=True) == "not cached"
+    assert tpl._compiled_code is tpl_limited._compiled_code
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    saved = hass_storage[template.COMPILED_CODE_CACHE_KEY]["data"]
+    assert set(saved["code"]) == {source, "{{ 'not' ~ ' cached' }}"}
+
+
+async def test_compiled_code_cache_other_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled code saved by another python or jinja version is ignored."""
+    source = "{{ 'other' ~ 1 }}"
+    hass_storage[template.COMPILED_CODE_CACHE_KEY] = {
+        "version": template.COMPILED_CODE_CACHE_VERSION,
+        "minor_version": 1,
+        "key": template.COMPILED_CODE_CACHE_KEY,
+        "data": {"header": [1, "2.7.18", "2.0"], "code": {source: "bm90IGNvZGU="}},
+    }
+    template.COMPILED_CODE_LRU.clear()
+    await template.async_load_compiled_code_cache(hass)
+    assert source not in template.COMPILED_CODE_LRU
+
+
+async def test_compiled_code_cache_other_ha_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled code saved by another Home Assistant version is ignored."""
+    source = "{{ 'saved' ~ ' before upgrade' }}"
+    template.COMPILED_CODE_LRU.clear()
+    with patch("homeassistant.helpers.template.HA_VERSION", "2023.12.0"):
+        await template.async_load_compiled_code_cache(hass)
+        assert template.Template(source, hass).async_render() == "saved before upgrade"
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+    saved = hass_storage[template.COMPILED_CODE_CACHE_KEY]["data"]
+    assert source in saved["code"]
+
+    template.COMPILED_CODE_LRU.clear()
+    with patch("homeassistant.helpers.template.HA_VERSION", "2024.1.0"):
+        await template.async_load_compiled_code_cache(hass)
+    assert source not in template.COMPILED_CODE_LRU
+
+
 def test_render_with_possible_json_value_undefined_json(hass: HomeAssistant) -> None:
     """Render with possible JSON value with unknown JSON object."""
     tpl = template.Template("{{ value_json.bye|is_defined }}", hass)
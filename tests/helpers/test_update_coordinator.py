@@ -450,6 +450,28 @@ async def test_coordinator_entity(
     assert len(crd._listeners) == 0
 
 
+async def test_coordinator_batch_state_writes(hass: HomeAssistant) -> None:
+    """Test the coordinator writes entity states in one batch."""
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass, _LOGGER, name="test", batch_state_writes=True
+    )
+    entities = []
+    for idx in range(3):
+        ent = update_coordinator.CoordinatorEntity(crd)
+        ent.entity_id = f"sensor.test{idx}"
+        ent.hass = hass
+        crd.async_add_listener(ent._handle_coordinator_update)
+        entities.append(ent)
+
+    crd.async_set_updated_data(1)
+
+    states = [hass.states.get(ent.entity_id) for ent in entities]
+    assert all(state is not None for state in states)
+    assert len({state.last_updated for state in states}) == 1
+    assert len({state.context.id for state in states}) == 1
+    crd._async_unsub_refresh()
+
+
 async def test_async_set_updated_data(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
@@ -87,6 +87,7 @@ def test_split_entity_id() -> None:
 def test_async_add_hass_job_schedule_callback() -> None:
     """Test that we schedule callbacks and add jobs to the job pool."""
     hass = MagicMock()
+    hass.job_profiler = None
     job = MagicMock()
 
     ha.HomeAssistant.async_add_hass_job(hass, ha.HassJob(ha.callback(job)))
@@ -111,6 +112,7 @@ def test_async_add_hass_job_coro_named(hass: HomeAssistant) -> None:
 def test_async_add_hass_job_schedule_partial_callback() -> None:
     """Test that we schedule partial coros and add jobs to the job pool."""
     hass = MagicMock()
+    hass.job_profiler = None
     job = MagicMock()
     partial = functools.partial(ha.callback(job))
 
@@ -122,7 +124,7 @@ def test_async_add_hass_job_schedule_partial_callback() -> None:
 
 def test_async_add_hass_job_schedule_coroutinefunction(event_loop) -> None:
     """Test that we schedule coroutines and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=event_loop))
+    hass = MagicMock(loop=MagicMock(wraps=event_loop), job_profiler=None)
 
     async def job():
         pass
@@ -135,7 +137,7 @@ def test_async_add_hass_job_schedule_coroutinefunction(event_loop) -> None:
 
 def test_async_add_hass_job_schedule_partial_coroutinefunction(event_loop) -> None:
     """Test that we schedule partial coros and add jobs to the job pool."""
-    hass = MagicMock(loop=MagicMock(wraps=event_loop))
+    hass = MagicMock(loop=MagicMock(wraps=event_loop), job_profiler=None)
 
     async def job():
         pass
@@ -151,6 +153,7 @@ def test_async_add_hass_job_schedule_partial_coroutinefunction(event_loop) -> No
 def test_async_add_job_add_hass_threaded_job_to_pool() -> None:
     """Test that we schedule coroutines and add jobs to the job pool."""
     hass = MagicMock()
+    hass.job_profiler = None
 
     def job():
         pass
@@ -191,6 +194,7 @@ def test_async_create_task_schedule_coroutine_with_name(event_loop) -> None:
 def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass.job_profiler = None
     calls = []
 
     def job():
@@ -204,6 +208,7 @@ def test_async_run_hass_job_calls_callback() -> None:
 def test_async_run_hass_job_delegates_non_async() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass.job_profiler = None
     calls = []
 
     def job():
@@ -214,6 +219,63 @@ def test_async_run_hass_job_delegates_non_async() -> None:
     assert len(hass.async_add_hass_job.mock_calls) == 1
 
 
+async def test_job_profiler_runs_jobs(hass: HomeAssistant) -> None:
+    """Test every job type runs through the job profiler when one is set."""
+    calls: list[tuple[str, str | None]] = []
+
+    class MockJobProfiler:
+        """Job profiler recording the jobs it runs."""
+
+        def run_callback(self, hassjob, args):
+            calls.append(("callback", hassjob.name))
+            hassjob.target(*args)
+
+        def wrap_coroutine(self, hassjob, args, coro):
+            calls.append(("coroutine", hassjob.name))
+            return coro
+
+        def run_executor(self, hassjob, args):
+            calls.append(("executor", hassjob.name))
+            return hassjob.target(*args)
+
+    results: list[str] = []
+
+    @callback
+    def _callback(value: str) -> None:
+        results.append(value)
+
+    async def _coroutine(value: str) -> None:
+        results.append(value)
+
+    def _executor(value: str) -> None:
+        results.append(value)
+
+    hass.job_profiler = MockJobProfiler()
+    hass.async_run_hass_job(HassJob(_callback, "run callback"), "run callback")
+    hass.async_add_hass_job(HassJob(_callback, "add callback"), "add callback")
+    hass.async_add_hass_job(HassJob(_coroutine, "coroutine"), "coroutine")
+    hass.async_add_hass_job(HassJob(_executor, "executor"), "executor")
+    hass.bus.async_listen("test_event", _callback, run_immediately=True)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+
+    assert sorted(calls) == [
+        ("callback", "add callback"),
+        ("callback", "listen test_event"),
+        ("callback", "run callback"),
+        ("coroutine", "coroutine"),
+        ("executor", "executor"),
+    ]
+    assert len(results) == 5
+
+    hass.job_profiler = None
+    calls.clear()
+    hass.async_add_hass_job(HassJob(_coroutine, "coroutine"), "coroutine")
+    await hass.async_block_till_done()
+    assert not calls
+    assert len(results) == 6
+
+
 async def test_async_get_hass_can_be_called(hass: HomeAssistant) -> None:
     """Test calling async_get_hass via different paths.
 
@@ -930,6 +992,135 @@ async def test_eventbus_run_immediately_not_callback(hass: HomeAssistant) -> Non
         hass.bus.async_listen("test", listener, run_immediately=True)
 
 
+async def test_eventbus_keyed_by_entity_id(hass: HomeAssistant) -> None:
+    """Test listeners keyed by entity_id only see their entity."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen("test", listener, entity_id="light.kitchen")
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"entity_id": "light.bedroom"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data == {"entity_id": "light.kitchen"}
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
+async def test_eventbus_keyed_by_domain(hass: HomeAssistant) -> None:
+    """Test listeners keyed by domain only see entities of that domain."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def event_filter(event):
+        """Mock filter."""
+        return event.data["entity_id"] != "light.filtered"
+
+    unsub = hass.bus.async_listen(
+        "test", listener, event_filter, run_immediately=True, domain="light"
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "switch.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.filtered"})
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    # No async_block_till_done here
+    assert len(calls) == 1
+    assert calls[0].data == {"entity_id": "light.kitchen"}
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+
+    # Removing an unknown listener does not leave keyed listeners behind
+    assert not hass.bus._domain_listeners
+    unsub()
+    assert not hass.bus._domain_listeners
+
+
+async def test_eventbus_keyed_and_unkeyed_order(hass: HomeAssistant) -> None:
+    """Test keyed listeners run after match all and unkeyed listeners."""
+    calls = []
+
+    for name, kwargs in (
+        ("domain", {"domain": "light"}),
+        ("entity_id", {"entity_id": "light.kitchen"}),
+        ("unkeyed", {}),
+    ):
+        hass.bus.async_listen(
+            "test",
+            ha.callback(lambda event, name=name: calls.append(name)),
+            run_immediately=True,
+            **kwargs,
+        )
+    hass.bus.async_listen(
+        MATCH_ALL,
+        ha.callback(lambda event: calls.append("match_all")),
+        run_immediately=True,
+    )
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert calls == ["match_all", "unkeyed", "entity_id", "domain"]
+    assert hass.bus.async_listeners()["test"] == 3
+
+
+async def test_eventbus_keyed_invalid(hass: HomeAssistant) -> None:
+    """Test keyed listeners reject invalid keys."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(
+            "test", listener, entity_id="light.kitchen", domain="light"
+        )
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen(MATCH_ALL, listener, domain="light")
+
+
+async def test_eventbus_unsubscribe_while_firing(hass: HomeAssistant) -> None:
+    """Test a listener removing itself does not skip the next listener."""
+    calls = []
+    unsub = None
+
+    @ha.callback
+    def first_listener(event):
+        """Mock listener that removes itself."""
+        calls.append("first")
+        unsub()
+
+    @ha.callback
+    def second_listener(event):
+        """Mock listener."""
+        calls.append("second")
+
+    unsub = hass.bus.async_listen("test", first_listener, run_immediately=True)
+    hass.bus.async_listen("test", second_listener, run_immediately=True)
+
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test")
+    assert calls == ["first", "second", "second"]
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1138,6 +1329,84 @@ def test_state_repr() -> None:
     )
 
 
+async def test_statemachine_async_set_many(hass: HomeAssistant) -> None:
+    """Test setting many states in one batch."""
+    hass.states.async_set("light.bedroom", "on", {"brightness": 100})
+    hass.states.async_set("light.unchanged", "on")
+    await hass.async_block_till_done()
+    own_context = ha.Context()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [
+            ("light.bedroom", "off", {"brightness": 100}, False, None, None),
+            ("light.unchanged", "on", None, False, None, None),
+            ("Light.Kitchen", "on", {"color": "red"}, False, None, None),
+            ("light.own_context", "on", None, False, own_context, None),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bedroom",
+        "light.kitchen",
+        "light.own_context",
+    ]
+    bedroom = hass.states.get("light.bedroom")
+    kitchen = hass.states.get("light.kitchen")
+    own = hass.states.get("light.own_context")
+    assert bedroom.state == "off"
+    assert bedroom.attributes == {"brightness": 100}
+    assert events[0].data["old_state"].state == "on"
+    assert events[1].data["old_state"] is None
+    assert kitchen.attributes == {"color": "red"}
+    assert bedroom.last_updated == kitchen.last_updated == own.last_updated
+    assert bedroom.last_updated == events[0].time_fired
+    assert bedroom.context is kitchen.context
+    assert events[0].context is bedroom.context
+    assert own.context is own_context
+    assert events[2].context is own_context
+
+
+async def test_statemachine_async_set_many_shared_context(
+    hass: HomeAssistant,
+) -> None:
+    """Test setting many states with a passed context and force_update."""
+    context = ha.Context()
+    hass.states.async_set("light.bedroom", "on")
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_set_many(
+        [("light.bedroom", "on", None, True, None, None)], context
+    )
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].context is context
+    assert hass.states.get("light.bedroom").context is context
+
+
+async def test_statemachine_async_set_many_invalid_state(
+    hass: HomeAssistant,
+) -> None:
+    """Test states set before an invalid state still fire events."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ("light.bedroom", "on", None, False, None, None),
+                ("light.kitchen", "x" * 256, None, False, None, None),
+            ]
+        )
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert hass.states.get("light.bedroom").state == "on"
+    assert hass.states.get("light.kitchen") is None
+
+
 async def test_statemachine_is_state(hass: HomeAssistant) -> None:
     """Test is_state method."""
     hass.states.async_set("light.bowl", "on", {})
@@ -1,11 +1,15 @@
 """Test to verify that we can load components."""
+import json
+import pathlib
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
-from homeassistant import loader
+from homeassistant import components, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, __version__
 from homeassistant.core import HomeAssistant, callback
 
 from .common import MockModule, async_get_persistent_notifications, mock_integration
@@ -873,3 +877,99 @@ async def test_async_suggest_report_issue(
         )
         == report_issue
     )
+
+
+def _startup_cache_entry(domain: str, **changes: Any) -> dict[str, Any]:
+    """Return a startup cache entry matching a built-in integration."""
+    directory = pathlib.Path(components.__path__[0]) / domain
+    manifest_path = directory / "manifest.json"
+    return {
+        "stamp": [
+            str(directory),
+            manifest_path.stat().st_mtime_ns,
+            directory.stat().st_mtime_ns,
+        ],
+        "manifest": json.loads(manifest_path.read_text()),
+        "files": sorted(path.name for path in directory.iterdir()),
+        **changes,
+    }
+
+
+async def test_startup_cache_saves_resolved_integrations(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the resolved integrations are saved to the startup cache."""
+    await loader.async_load_startup_cache(hass)
+    integration = await loader.async_get_integration(hass, "logbook")
+    assert await integration.resolve_dependencies()
+    assert integration.platform_exists("websocket_api") is True
+    assert integration.platform_exists("light") is False
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    saved = hass_storage[loader.STARTUP_CACHE_KEY]["data"]
+    assert saved["ha_version"] == __version__
+    entry = saved["integrations"]["homeassistant.components.logbook"]
+    assert entry["manifest"]["domain"] == "logbook"
+    assert "processor.py" in entry["files"]
+    assert entry["dependencies"] == sorted(integration.all_dependencies)
+    assert "homeassistant.components.http" in saved["integrations"]
+
+
+async def test_startup_cache_used_when_unchanged(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test unchanged integrations are resolved from the startup cache."""
+    logbook_entry = _startup_cache_entry(
+        "logbook", files=["__init__.py", "cached.py"], dependencies=["http"]
+    )
+    logbook_entry["manifest"]["name"] = "Cached Logbook"
+    hue_entry = _startup_cache_entry("hue")
+    hue_entry["stamp"][1] -= 1
+    hue_entry["manifest"]["name"] = "Changed Hue"
+    hass_storage[loader.STARTUP_CACHE_KEY] = {
+        "version": loader.STARTUP_CACHE_VERSION,
+        "minor_version": 1,
+        "key": loader.STARTUP_CACHE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "integrations": {
+                "homeassistant.components.logbook": logbook_entry,
+                "homeassistant.components.http": _startup_cache_entry("http"),
+                "homeassistant.components.hue": hue_entry,
+            },
+        },
+    }
+    await loader.async_load_startup_cache(hass)
+
+    logbook = await loader.async_get_integration(hass, "logbook")
+    assert logbook.name == "Cached Logbook"
+    assert logbook.platform_exists("cached") is True
+    assert logbook.platform_exists("websocket_api") is False
+    assert await logbook.resolve_dependencies()
+    assert logbook.all_dependencies == {"http"}
+
+    hue = await loader.async_get_integration(hass, "hue")
+    assert hue.name == "Philips Hue"
+
+
+async def test_startup_cache_other_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test a startup cache saved by another version is ignored."""
+    logbook_entry = _startup_cache_entry("logbook")
+    logbook_entry["manifest"]["name"] = "Cached Logbook"
+    hass_storage[loader.STARTUP_CACHE_KEY] = {
+        "version": loader.STARTUP_CACHE_VERSION,
+        "minor_version": 1,
+        "key": loader.STARTUP_CACHE_KEY,
+        "data": {
+            "ha_version": "2023.1.0",
+            "integrations": {"homeassistant.components.logbook": logbook_entry},
+        },
+    }
+    await loader.async_load_startup_cache(hass)
+
+    logbook = await loader.async_get_integration(hass, "logbook")
+    assert logbook.name == "Logbook"
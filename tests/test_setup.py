@@ -739,6 +739,140 @@ async def test_async_start_setup_platforms(hass: HomeAssistant) -> None:
     assert "sensor" not in hass.data[setup.DATA_SETUP_TIME]
 
 
+async def test_setup_trace(hass: HomeAssistant, mock_handlers) -> None:
+    """Test the setup phases of an integration are recorded in the setup trace."""
+
+    async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+        await asyncio.sleep(0)
+        return True
+
+    mock_integration(hass, MockModule("comp_dep"))
+    mock_integration(
+        hass,
+        MockModule(
+            "comp",
+            dependencies=["comp_dep"],
+            async_setup=async_setup,
+            async_setup_entry=AsyncMock(return_value=True),
+        ),
+    )
+    mock_platform(hass, "comp.config_flow", None)
+    MockConfigEntry(domain="comp", title="Living room").add_to_hass(hass)
+
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    spans = [
+        span
+        for span in setup.async_get_setup_trace(hass).spans
+        if span.domain == "comp"
+    ]
+    assert [(span.phase, span.detail) for span in spans] == [
+        (setup.SetupPhase.WAIT_DEPENDENCIES, None),
+        (setup.SetupPhase.REQUIREMENTS, None),
+        (setup.SetupPhase.IMPORT, None),
+        (setup.SetupPhase.CONFIG, None),
+        (setup.SetupPhase.SETUP, None),
+        (setup.SetupPhase.CONFIG_ENTRY_SETUP, "Living room"),
+    ]
+    for span in spans:
+        assert span.end is not None
+        assert span.end >= span.start
+    by_phase = {span.phase: span for span in spans}
+    assert by_phase[setup.SetupPhase.WAIT_DEPENDENCIES].blocking is None
+    assert by_phase[setup.SetupPhase.IMPORT].blocking == (
+        by_phase[setup.SetupPhase.IMPORT].end - by_phase[setup.SetupPhase.IMPORT].start
+    )
+    setup_span = by_phase[setup.SetupPhase.SETUP]
+    assert 0 <= setup_span.blocking <= setup_span.end - setup_span.start
+    assert by_phase[setup.SetupPhase.CONFIG_ENTRY_SETUP].blocking is not None
+
+
+async def test_setup_trace_chrome_trace() -> None:
+    """Test the setup trace is exported in the Chrome trace format."""
+    trace = setup.SetupTrace()
+    origin = trace.origin
+    trace.spans.append(
+        setup.SetupSpan("hue", setup.SetupPhase.SETUP, None, origin + 1, origin + 3)
+    )
+    trace.spans.append(
+        setup.SetupSpan(
+            "hue",
+            setup.SetupPhase.PLATFORM_SETUP,
+            "light",
+            origin + 2,
+            origin + 2.5,
+            0.25,
+        )
+    )
+    trace.spans.append(
+        setup.SetupSpan("bootstrap", setup.SetupPhase.STAGE, "stage_1", origin + 1)
+    )
+    trace.spans.append(
+        setup.SetupSpan("hue", setup.SetupPhase.CONFIG, None, origin + 0.5, origin + 1)
+    )
+
+    with patch("homeassistant.setup.time.monotonic", return_value=origin + 4):
+        chrome_trace = trace.as_chrome_trace()
+
+    assert chrome_trace["displayTimeUnit"] == "ms"
+    assert chrome_trace["otherData"] == {"started": trace.started.isoformat()}
+    events = chrome_trace["traceEvents"]
+    assert events[0] == {
+        "name": "process_name",
+        "ph": "M",
+        "pid": 1,
+        "args": {"name": "Home Assistant setup"},
+    }
+    lanes = {
+        event["args"]["name"]: event["tid"]
+        for event in events
+        if event["name"] == "thread_name"
+    }
+    assert lanes == {"hue": 1, "hue light": 2, "bootstrap": 3}
+    assert [event for event in events if event["ph"] == "X"] == [
+        {
+            "name": "setup",
+            "cat": "setup",
+            "ph": "X",
+            "pid": 1,
+            "tid": 1,
+            "ts": 1_000_000,
+            "dur": 2_000_000,
+            "args": {"domain": "hue"},
+        },
+        {
+            "name": "platform_setup",
+            "cat": "platform_setup",
+            "ph": "X",
+            "pid": 1,
+            "tid": 2,
+            "ts": 2_000_000,
+            "dur": 500_000,
+            "args": {"domain": "hue", "detail": "light", "blocking_ms": 250.0},
+        },
+        {
+            "name": "stage_1",
+            "cat": "stage",
+            "ph": "X",
+            "pid": 1,
+            "tid": 3,
+            "ts": 1_000_000,
+            "dur": 3_000_000,
+            "args": {"domain": "bootstrap", "detail": "stage_1", "in_progress": True},
+        },
+        {
+            "name": "config",
+            "cat": "config",
+            "ph": "X",
+            "pid": 1,
+            "tid": 1,
+            "ts": 500_000,
+            "dur": 500_000,
+            "args": {"domain": "hue"},
+        },
+    ]
+
+
 async def test_setup_config_entry_from_yaml(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None: